@@ -3,6 +3,7 @@ Main application entry point that initializes all services
 """
 import logging
 import asyncio
+import sys
 from typing import Dict, Any, Optional, List
 
 # Configure logging
@@ -62,6 +63,21 @@ async def shutdown_services():
     logger.info("✅ All services shutdown successfully")
     return True
 
+def install_event_loop_policy():
+    """Use rloop's io_uring-backed event loop on Linux when it is installed
+
+    Concurrent quote/RPC traffic is then submitted in batched syscalls; the
+    default selector loop is kept when rloop is unavailable.
+    """
+    if sys.platform != "linux":
+        return
+    try:
+        import rloop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(rloop.EventLoopPolicy())
+    logger.info("Using rloop (io_uring) event loop policy")
+
 async def main():
     """Main application entry point"""
     try:
@@ -84,4 +100,5 @@ async def main():
 
 if __name__ == "__main__":
     # Entry point when script is run directly
+    install_event_loop_policy()
     asyncio.run(main())
\ No newline at end of file
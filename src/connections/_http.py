@@ -0,0 +1,143 @@
+"""Shared aiohttp session for HTTP API connections
+
+Connections acquire the process-wide session with get_session() and hand it back
+with release_session() from their close(); the session (and its pooled keep-alive
+connections) is closed once the last user releases it. Per-API headers such as
+Authorization are passed per request, so one pool serves every API host.
+
+TokenBucket provides client-side rate limiting for those APIs, and
+iter_chat_stream() decodes streamed (SSE) chat completion responses.
+"""
+import asyncio
+import logging
+import ssl
+from typing import AsyncIterable, AsyncIterator, Optional, Union
+
+import aiohttp
+import orjson
+
+logger = logging.getLogger(__name__)
+
+# Built once at import: loading the trust store for a new SSLContext costs milliseconds.
+# ALPN offers only HTTP/1.1, the sole protocol aiohttp speaks.
+_SSL_CONTEXT = ssl.create_default_context()
+_SSL_CONTEXT.set_alpn_protocols(["http/1.1"])
+
+_SESSION: Optional[aiohttp.ClientSession] = None
+_SESSION_LOOP: Optional[asyncio.AbstractEventLoop] = None
+_USERS = 0
+
+
+async def get_session() -> aiohttp.ClientSession:
+    """Acquire the shared HTTP session, creating it on first use in this event loop
+
+    Every call must be paired with a release_session() call.
+
+    Returns:
+        Shared aiohttp ClientSession
+    """
+    global _SESSION, _SESSION_LOOP, _USERS
+    loop = asyncio.get_running_loop()
+    if _SESSION is None or _SESSION.closed or _SESSION_LOOP is not loop:
+        # Resolve and cache DNS asynchronously (aiodns, installed via aiohttp[speedups])
+        # instead of a threadpool getaddrinfo call per new connection
+        try:
+            resolver = aiohttp.AsyncResolver()
+        except RuntimeError:
+            resolver = None
+        connector = aiohttp.TCPConnector(
+            ssl=_SSL_CONTEXT,
+            limit=100,
+            limit_per_host=32,
+            ttl_dns_cache=600,
+            keepalive_timeout=75,
+            enable_cleanup_closed=True,
+            resolver=resolver
+        )
+        # Ask proxies/servers to keep connections open so repeated API calls
+        # reuse warm TLS connections instead of re-handshaking per request
+        _SESSION = aiohttp.ClientSession(
+            connector=connector,
+            headers={'Connection': 'keep-alive'}
+        )
+        _SESSION_LOOP = loop
+        _USERS = 0
+        logger.debug("Created shared HTTP session")
+    _USERS += 1
+    return _SESSION
+
+
+async def release_session() -> None:
+    """Release a session acquired with get_session(), closing it after the last user"""
+    global _SESSION, _SESSION_LOOP, _USERS
+    _USERS = max(_USERS - 1, 0)
+    if _USERS == 0 and _SESSION is not None:
+        if not _SESSION.closed:
+            await _SESSION.close()
+            logger.debug("Closed shared HTTP session")
+        _SESSION = None
+        _SESSION_LOOP = None
+
+
+class TokenBucket:
+    """Token-bucket rate limiter driven by the event loop's monotonic clock
+
+    Allows bursts of up to capacity requests and refills at rate tokens per
+    second; concurrent callers queue on a lock and are released in order.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1):
+        """Initialize the bucket
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum number of stored tokens (burst size)
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated: Optional[float] = None
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it"""
+        loop = asyncio.get_running_loop()
+        async with self._lock:
+            now = loop.time()
+            if self._updated is not None:
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._updated = loop.time()
+                self._tokens = 1.0
+            self._tokens -= 1
+
+
+async def iter_chat_stream(lines: AsyncIterable[Union[bytes, str]]) -> AsyncIterator[str]:
+    """Yield content deltas from an OpenAI-style streamed chat completion
+
+    Reads the server-sent event body line by line, skipping comments and
+    keep-alive lines, until the terminating [DONE] frame.
+
+    Args:
+        lines: Body lines of a chat completion request sent with "stream": true,
+            e.g. an aiohttp response's content or an httpx response's aiter_lines()
+
+    Returns:
+        Async iterator over non-empty content deltas
+    """
+    async for line in lines:
+        if isinstance(line, str):
+            line = line.encode()
+        line = line.strip()
+        if not line.startswith(b"data:"):
+            continue
+        payload = line[5:].strip()
+        if payload == b"[DONE]":
+            break
+        choices = orjson.loads(payload).get("choices")
+        if choices:
+            content = choices[0].get("delta", {}).get("content")
+            if content:
+                yield content
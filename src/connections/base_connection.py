@@ -7,7 +7,7 @@ from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ActionParameter:
     """Parameter definition for an action"""
     name: str
@@ -20,6 +20,8 @@ Parameter = ActionParameter
 
 class Action:
     """Defines an available action and its parameters"""
+    __slots__ = ("name", "parameters", "description")
+
     def __init__(self, name: str, parameters: List[ActionParameter], description: str):
         self.name = name
         self.parameters = parameters
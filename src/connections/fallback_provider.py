@@ -0,0 +1,64 @@
+"""Web3 HTTP provider that fails over between RPC endpoints"""
+import logging
+import time
+from typing import Any, Dict, List
+
+import requests
+from web3 import HTTPProvider
+from web3.providers import JSONBaseProvider
+from web3.types import RPCEndpoint, RPCResponse
+
+logger = logging.getLogger(__name__)
+
+# HTTP statuses that mean the endpoint, not the request, is at fault
+_FAILOVER_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+class FallbackHTTPProvider(JSONBaseProvider):
+    """Provider that tries each RPC endpoint in order, skipping recently failed ones
+
+    Each endpoint has its own HTTPProvider, so requests made concurrently from
+    worker threads never share mutable endpoint state. An endpoint that times
+    out, refuses the connection or answers 429/5xx is put on cooldown and the
+    request moves straight on to the next endpoint. If every endpoint is cooling
+    down they are all tried anyway.
+    """
+
+    def __init__(self, endpoints: List[str], cooldown: float = 30, **kwargs: Any):
+        """Initialize the provider
+
+        Args:
+            endpoints: RPC URLs in order of preference; non-HTTP(S) URLs are ignored
+            cooldown: Seconds a failed endpoint is skipped for
+            **kwargs: Passed through to each endpoint's HTTPProvider (e.g. request_kwargs)
+        """
+        endpoints = [url for url in endpoints if url and url.startswith(("http://", "https://"))]
+        if not endpoints:
+            raise ValueError("FallbackHTTPProvider needs at least one HTTP(S) endpoint")
+        super().__init__()
+        self.endpoints = endpoints
+        self.cooldown = cooldown
+        self._providers: Dict[str, HTTPProvider] = {url: HTTPProvider(url, **kwargs) for url in endpoints}
+        self._bad_until: Dict[str, float] = {}
+
+    def __str__(self) -> str:
+        return f"RPC fallback connection {', '.join(self.endpoints)}"
+
+    def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        now = time.monotonic()
+        candidates = [url for url in self.endpoints if self._bad_until.get(url, 0) <= now] or self.endpoints
+
+        last_error: Exception = RuntimeError("No RPC endpoints available")
+        for url in candidates:
+            try:
+                return self._providers[url].make_request(method, params)
+            except requests.exceptions.HTTPError as e:
+                if e.response is None or e.response.status_code not in _FAILOVER_STATUSES:
+                    raise
+                last_error = e
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                last_error = e
+            self._bad_until[url] = time.monotonic() + self.cooldown
+            logger.warning("RPC %s failed for %s, cooling down %ss: %s", url, method, self.cooldown, last_error)
+
+        raise last_error
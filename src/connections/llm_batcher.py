@@ -0,0 +1,102 @@
+"""Micro-batching of concurrent LLM completion requests"""
+import asyncio
+import logging
+from collections import defaultdict
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# dispatch(system_prompt, user_message, n) -> n completion results
+Dispatch = Callable[[str, str, int], Awaitable[List[Dict[str, Any]]]]
+
+
+class LLMAutoBatcher:
+    """Buffer prompts for a few milliseconds and dispatch identical ones together
+
+    Identical (system_prompt, user_message) pairs submitted within max_wait_ms are
+    served by one request asking for n choices; distinct prompts in the same window
+    are dispatched concurrently.
+    """
+
+    def __init__(self, dispatch: Dispatch, max_batch: int = 32, max_wait_ms: float = 10):
+        """Initialize the batcher
+
+        Args:
+            dispatch: Coroutine function returning n results for one prompt
+            max_batch: Maximum number of prompts drained per window
+            max_wait_ms: Longest time the first prompt of a window waits for company
+        """
+        self._dispatch = dispatch
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000
+        self._queue: Optional[asyncio.Queue] = None
+        self._consumer: Optional[asyncio.Task] = None
+        self._pending: Set[asyncio.Task] = set()
+
+    def _ensure_consumer(self) -> asyncio.Queue:
+        """Start the background consumer on first use in the running event loop"""
+        if self._consumer is None or self._consumer.done() \
+                or self._consumer.get_loop() is not asyncio.get_running_loop():
+            self._queue = asyncio.Queue()
+            self._consumer = asyncio.create_task(self._run())
+        return self._queue
+
+    async def submit(self, system_prompt: str, user_message: str) -> Dict[str, Any]:
+        """Queue a prompt and wait for its result"""
+        queue = self._ensure_consumer()
+        future = asyncio.get_running_loop().create_future()
+        await queue.put(((system_prompt, user_message), future))
+        return await future
+
+    async def _run(self) -> None:
+        """Drain the queue in windows and dispatch each group of identical prompts"""
+        loop = asyncio.get_running_loop()
+        queue = self._queue
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            groups: Dict[Tuple[str, str], List[asyncio.Future]] = defaultdict(list)
+            for prompt, future in batch:
+                groups[prompt].append(future)
+            for (system_prompt, user_message), futures in groups.items():
+                task = asyncio.create_task(self._dispatch_group(system_prompt, user_message, futures))
+                self._pending.add(task)
+                task.add_done_callback(self._pending.discard)
+
+    async def _dispatch_group(self, system_prompt: str, user_message: str, futures: List[asyncio.Future]) -> None:
+        """Run one request for a group of identical prompts and resolve their futures"""
+        try:
+            results = await self._dispatch(system_prompt, user_message, len(futures))
+        except Exception as e:
+            logger.error("Batched completion failed: %s", e)
+            for future in futures:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for future, result in zip(futures, results):
+            if not future.done():
+                future.set_result(result)
+
+    async def close(self) -> None:
+        """Stop the background consumer"""
+        if self._consumer is not None and not self._consumer.done():
+            self._consumer.cancel()
+            try:
+                await self._consumer
+            except asyncio.CancelledError:
+                pass
+        if self._queue is not None:
+            while not self._queue.empty():
+                _, future = self._queue.get_nowait()
+                future.cancel()
+        self._consumer = None
+        self._queue = None
@@ -0,0 +1,108 @@
+"""Response caches for LLM completions
+
+LLMCache keeps recent completions in memory; DiskLLMCache persists them in
+SQLite so repeated prompts stay cached across restarts.
+"""
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Optional
+
+try:
+    import zstandard
+    _compress = zstandard.ZstdCompressor().compress
+    _decompress = zstandard.ZstdDecompressor().decompress
+except ImportError:
+    _compress = zlib.compress
+    _decompress = zlib.decompress
+
+from .ttl_cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DISK_CACHE_PATH = "~/.cache/sonickid/llm.sqlite"
+
+
+class LLMCache(TTLCache):
+    """Exact-match LRU cache with per-entry expiry
+
+    Keys are hashes of everything that determines a completion (model, prompts,
+    sampling parameters), so only deterministic requests should be cached.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 3600):
+        """Initialize the cache
+
+        Args:
+            maxsize: Maximum number of entries kept before the least recently used is evicted
+            ttl: Default seconds an entry stays valid
+        """
+        super().__init__(maxsize=maxsize, ttl=ttl)
+
+    @staticmethod
+    def make_key(model: str, system_prompt: str, user_message: str, temperature: float, max_tokens: int) -> str:
+        """Build a cache key from the parameters that determine a completion"""
+        payload = json.dumps(
+            {"m": model, "s": system_prompt, "u": user_message, "t": temperature, "mx": max_tokens},
+            sort_keys=True
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class DiskLLMCache:
+    """SQLite-backed completion cache with compressed bodies
+
+    Bodies are zstd-compressed when the zstandard package is installed and
+    zlib-compressed otherwise; entries written with the other codec read as misses.
+    Calls block on disk I/O, so async callers should run them in a worker thread;
+    a lock serializes access to the shared connection across threads.
+    """
+
+    def __init__(self, path: str = DEFAULT_DISK_CACHE_PATH, ttl: int = 7 * 24 * 3600):
+        """Open (or create) the cache database
+
+        Args:
+            path: SQLite database file; ~ is expanded and parent directories are created
+            ttl: Default seconds an entry stays valid
+        """
+        path = os.path.expanduser(path)
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, expires INTEGER, body BLOB)"
+        )
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached completion for key, or None if missing or expired"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body FROM cache WHERE key=? AND expires>?", (key, int(time.time()))
+            ).fetchone()
+        if row is None:
+            return None
+        try:
+            return _decompress(row[0]).decode()
+        except Exception as e:
+            logger.debug("Discarding unreadable cache entry %s: %s", key, e)
+            return None
+
+    def set(self, key: str, value: str, ttl: Optional[int] = None) -> None:
+        """Store a completion"""
+        expires = int(time.time()) + (self.ttl if ttl is None else ttl)
+        body = _compress(value.encode())
+        with self._lock:
+            self._conn.execute("INSERT OR REPLACE INTO cache VALUES (?, ?, ?)", (key, expires, body))
+
+    def close(self) -> None:
+        """Close the database connection"""
+        with self._lock:
+            self._conn.close()
@@ -1,18 +1,118 @@
 """
 OpenOcean API integration as a BaseConnection implementation
 """
+import asyncio
 import logging
 import os
-from typing import Dict, Any, Optional, List
+from types import MappingProxyType
+from typing import Dict, Any, Optional, List, Mapping
+from eth_abi import encode as abi_encode, decode as abi_decode
 from .base_connection import BaseConnection, Action, ActionParameter
 from .openocean_connection import OpenOceanConnection
+from ..constants.abi import (
+    MULTICALL3_ADDRESS,
+    MULTICALL3_AGGREGATE3_SELECTOR,
+    ERC20_NAME_SELECTOR,
+    ERC20_SYMBOL_SELECTOR,
+    ERC20_DECIMALS_SELECTOR,
+)
 from web3 import Web3
 
 logger = logging.getLogger(__name__)
 
+_NO_PARAMS: tuple = ()
+
+_HEX_CHARS = frozenset("0123456789abcdefABCDEF")
+_MAX_SYMBOL_LENGTH = 64
+
+# Read-only templates for static failures; return a dict() copy so callers may modify it
+_ERR_NOT_CONNECTED = MappingProxyType({"success": False, "error": "Not connected to OpenOcean API"})
+_ERR_SYMBOL_REQUIRED = MappingProxyType({"success": False, "error": "Token symbol is required"})
+_ERR_MISSING_PARAMS = MappingProxyType({"success": False, "error": "Missing required parameters"})
+_ERR_NO_WALLET = MappingProxyType({"success": False, "error": "No wallet configured, private key missing"})
+_ERR_QUOTE_FAILED = MappingProxyType({"success": False, "error": "Failed to get swap quote"})
+_ERR_SWAP_FAILED = MappingProxyType({"success": False, "error": "Failed to execute swap"})
+
+_TOKEN_METADATA_SELECTORS = (ERC20_NAME_SELECTOR, ERC20_SYMBOL_SELECTOR, ERC20_DECIMALS_SELECTOR)
+
+
+def _decode_string_result(data: bytes) -> str:
+    """Decode an ERC20 string return value, tolerating legacy bytes32 tokens (e.g. MKR)"""
+    if len(data) == 32:
+        return data.rstrip(b'\x00').decode('utf-8', 'ignore')
+    return abi_decode(['string'], data)[0]
+
+
+def _is_hex_address(value: str) -> bool:
+    """Check that a string is a 0x-prefixed 20-byte hex address"""
+    return len(value) == 42 and value.startswith("0x") and all(c in _HEX_CHARS for c in value[2:])
+
+
+def _is_token_symbol(value: str) -> bool:
+    """Check that a string could be a token symbol (e.g. 'ETH', 'USDC.e', 'USD+')
+
+    Only rules out obviously bad input; the API decides whether the symbol exists.
+    0x-prefixed values are addresses and must pass _is_hex_address instead.
+    """
+    return (
+        0 < len(value) <= _MAX_SYMBOL_LENGTH
+        and not value.startswith("0x")
+        and not any(c.isspace() for c in value)
+    )
+
+
+def _first_invalid_token(*tokens: str) -> Optional[str]:
+    """Return the first token that is neither a valid address nor a plausible symbol"""
+    for token in tokens:
+        if not (_is_hex_address(token) or _is_token_symbol(token)):
+            return token
+    return None
+
+
 class OpenOceanBaseConnection(BaseConnection):
     """OpenOcean DEX integration base connection"""
     
+    # Static action table, shared by all instances
+    _ACTIONS = MappingProxyType({
+        "get-token-list": Action(
+            name="get-token-list",
+            description="Get list of supported tokens on the current chain",
+            parameters=_NO_PARAMS
+        ),
+        "get-token-by-symbol": Action(
+            name="get-token-by-symbol",
+            description="Get token details by symbol",
+            parameters=(
+                ActionParameter("symbol", True, str, "Token symbol (e.g., 'ETH', 'USDC')"),
+            )
+        ),
+        "get-dex-list": Action(
+            name="get-dex-list",
+            description="Get list of supported DEXes on the current chain",
+            parameters=_NO_PARAMS
+        ),
+        "get-swap-quote": Action(
+            name="get-swap-quote",
+            description="Get a quote for swapping tokens",
+            parameters=(
+                ActionParameter("in_token", True, str, "Input token address or symbol"),
+                ActionParameter("out_token", True, str, "Output token address or symbol"),
+                ActionParameter("amount", True, str, "Token amount (without decimals)"),
+                ActionParameter("gas_price", False, str, "Gas price in GWEI (without decimals)"),
+            )
+        ),
+        "execute-swap": Action(
+            name="execute-swap",
+            description="Execute a token swap",
+            parameters=(
+                ActionParameter("in_token", True, str, "Input token address or symbol"),
+                ActionParameter("out_token", True, str, "Output token address or symbol"),
+                ActionParameter("amount", True, str, "Token amount (without decimals)"),
+                ActionParameter("slippage", False, float, "Slippage percentage (0.05-50)"),
+            )
+        ),
+    })
+    
     def __init__(self, config: Dict[str, Any]):
         """Initialize the OpenOcean base connection
         
@@ -22,11 +122,18 @@ class OpenOceanBaseConnection(BaseConnection):
                 - slippage: Default slippage percentage
                 - referrer: Optional referrer address
                 - referrer_fee: Optional referrer fee percentage
+                - token_addresses: Optional token addresses to resolve on connect
         """
         super().__init__(config)
+        self._chain_id: str = self.config['chain_id']
+        self._rpc_chain_env = f"{self.config['rpc_url_env']}_{self._chain_id}"
         self.openocean = None
         self.web3 = None
         self.account = None
+        self._symbol_index: Dict[str, Dict[str, Any]] = {}
+        self._rpc_sem: Optional[asyncio.Semaphore] = None
+        self._dex_list: List[Dict[str, Any]] = []
+        self._warm_task: Optional[asyncio.Task] = None
         
     def validate_config(self, config: Dict[str, Any]) -> Dict[str, Any]:
         """Validate and prepare configuration
@@ -39,10 +146,14 @@ class OpenOceanBaseConnection(BaseConnection):
         """
         # Default configuration
         validated_config = {
-            'chain_id': config.get('chain_id', '1'),  # Default to Ethereum
+            'chain_id': str(config.get('chain_id', '1')),  # Default to Ethereum
             'slippage': config.get('slippage', 1),    # Default 1% slippage
             'private_key_env': config.get('private_key_env', 'ETH_PRIVATE_KEY'),
             'rpc_url_env': config.get('rpc_url_env', 'WEB3_RPC_URL'),
+            'token_addresses': list(config.get('token_addresses', [])),
+            'multicall_batch_size': int(config.get('multicall_batch_size', 30)),
+            'multicall_concurrency': int(config.get('multicall_concurrency', 25)),
+            'max_concurrent_rpc': int(config.get('max_concurrent_rpc', 25)),
         }
         
         # Optional referrer parameters
@@ -54,9 +165,9 @@ class OpenOceanBaseConnection(BaseConnection):
             if 0.01 <= fee <= 3:
                 validated_config['referrer_fee'] = fee
             else:
-                logger.warning(f"Referrer fee {fee} is outside allowed range (0.01-3), ignoring")
+                logger.warning("Referrer fee %s is outside allowed range (0.01-3), ignoring", fee)
         
-        logger.info(f"OpenOcean configured for chain ID: {validated_config['chain_id']}")
+        logger.info("OpenOcean configured for chain ID: %s", validated_config['chain_id'])
         return validated_config
     
     async def connect(self) -> bool:
@@ -66,6 +177,9 @@ class OpenOceanBaseConnection(BaseConnection):
             True if connection successful, False otherwise
         """
         try:
+            # Cap in-flight OpenOcean/Web3 calls to stay under provider rate limits
+            self._rpc_sem = asyncio.Semaphore(self.config['max_concurrent_rpc'])
+            
             # Initialize OpenOcean connection
             self.openocean = OpenOceanConnection(self.config)
             if not await self.openocean.connect():
@@ -73,18 +187,15 @@ class OpenOceanBaseConnection(BaseConnection):
                 return False
             
             # Initialize Web3 connection
-            chain_id = self.config['chain_id']
             rpc_env_key = self.config['rpc_url_env']
-            rpc_chain_env = f"{rpc_env_key}_{chain_id}"
-            
-            rpc_url = os.getenv(rpc_chain_env, os.getenv(rpc_env_key))
+            rpc_url = os.getenv(self._rpc_chain_env) or os.getenv(rpc_env_key)
             if not rpc_url:
-                logger.error(f"No RPC URL found in environment variables ({rpc_chain_env} or {rpc_env_key})")
+                logger.error("No RPC URL found in environment variables (%s or %s)", self._rpc_chain_env, rpc_env_key)
                 return False
             
             self.web3 = Web3(Web3.HTTPProvider(rpc_url))
             if not self.web3.is_connected():
-                logger.error(f"Failed to connect to Web3 provider at {rpc_url}")
+                logger.error("Failed to connect to Web3 provider at %s", rpc_url)
                 return False
             
             # Initialize account if private key is available
@@ -92,66 +203,147 @@ class OpenOceanBaseConnection(BaseConnection):
             private_key = os.getenv(private_key_env)
             if private_key:
                 self.account = self.web3.eth.account.from_key(private_key)
-                logger.info(f"Account initialized: {self.account.address}")
+                logger.info("Account initialized: %s", self.account.address)
             else:
-                logger.warning(f"No private key found in environment variable {private_key_env}")
+                logger.warning("No private key found in environment variable %s", private_key_env)
+            
+            # Warm the symbol index from chain instead of per-symbol API lookups
+            if self.config['token_addresses']:
+                tokens = await self.batch_resolve_tokens(self.config['token_addresses'])
+                self._symbol_index.update((t['symbol'].lower(), t) for t in tokens)
+                logger.info("Resolved %s token(s) via multicall", len(tokens))
             
-            logger.info(f"Successfully connected to OpenOcean API and Web3 for chain ID {chain_id}")
+            # Prefetch token and DEX lists in the background so connect() returns immediately
+            self._warm_task = asyncio.create_task(self.warm())
+            
+            logger.info("Successfully connected to OpenOcean API and Web3 for chain ID %s", self._chain_id)
             return True
         
         except Exception as e:
-            logger.error(f"Error connecting to OpenOcean: {str(e)}")
+            logger.error("Error connecting to OpenOcean: %s", e)
             return False
     
     async def close(self) -> None:
         """Close the connection"""
+        if self._warm_task and not self._warm_task.done():
+            self._warm_task.cancel()
+        self._warm_task = None
+        
         if self.openocean:
             await self.openocean.close()
             self.openocean = None
+        self.account = None
+    
+    async def warm(self) -> None:
+        """Fetch the token and DEX lists concurrently and index them for later lookups"""
+        try:
+            async with self._rpc_sem:
+                tokens, dexes = await asyncio.gather(
+                    self.openocean.get_token_list(),
+                    self.openocean.get_dex_list()
+                )
+            
+            if tokens:
+                # Keep the first match per symbol, and let on-chain resolved tokens take precedence
+                index = {}
+                for token in reversed(tokens):
+                    index[token.get('symbol', '').lower()] = token
+                index.update(self._symbol_index)
+                self._symbol_index = index
+            if dexes:
+                self._dex_list = dexes
+            
+            logger.info("Warmed OpenOcean indexes: %s token(s), %s DEX(es)", len(tokens or ()), len(dexes or ()))
+        except Exception as e:
+            logger.warning("Error warming OpenOcean indexes: %s", e)
+    
+    async def batch_resolve_tokens(self, addresses: List[str]) -> List[Dict[str, Any]]:
+        """Resolve token metadata on-chain using batched Multicall3 reads
+        
+        Each batch of up to ``multicall_batch_size`` tokens is read with a single
+        ``eth_call`` (name, symbol and decimals per token), with at most
+        ``multicall_concurrency`` batches in flight.
+        
+        Args:
+            addresses: Token contract addresses
+            
+        Returns:
+            List of token dicts (address, name, symbol, decimals) in input order.
+            Tokens whose metadata could not be read are omitted.
+        """
+        if not self.web3 or not addresses:
+            return []
+        
+        batch_size = self.config['multicall_batch_size']
+        semaphore = asyncio.Semaphore(self.config['multicall_concurrency'])
+        batches = [addresses[i:i + batch_size] for i in range(0, len(addresses), batch_size)]
+        
+        async def resolve_batch(batch: List[str]) -> List[Dict[str, Any]]:
+            async with semaphore:
+                return await asyncio.to_thread(self._multicall_token_metadata, batch)
+        
+        results = await asyncio.gather(*(resolve_batch(b) for b in batches), return_exceptions=True)
+        
+        tokens = []
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error("Error resolving token batch via multicall: %s", result)
+                continue
+            tokens.extend(result)
+        return tokens
+    
+    def _multicall_token_metadata(self, addresses: List[str]) -> List[Dict[str, Any]]:
+        """Read name/symbol/decimals for a batch of tokens in one eth_call (blocking)"""
+        targets = [Web3.to_checksum_address(address) for address in addresses]
+        calls = [
+            (target, True, selector)
+            for target in targets
+            for selector in _TOKEN_METADATA_SELECTORS
+        ]
+        calldata = MULTICALL3_AGGREGATE3_SELECTOR + abi_encode(['(address,bool,bytes)[]'], [calls])
+        raw = self.web3.eth.call({'to': MULTICALL3_ADDRESS, 'data': Web3.to_hex(calldata)})
+        (results,) = abi_decode(['(bool,bytes)[]'], raw)
+        
+        tokens = []
+        for i, target in enumerate(targets):
+            (name_ok, name_data), (symbol_ok, symbol_data), (decimals_ok, decimals_data) = results[3 * i:3 * i + 3]
+            if not (symbol_ok and decimals_ok):
+                logger.debug("Skipping token %s: symbol/decimals call reverted", target)
+                continue
+            try:
+                tokens.append({
+                    'address': target,
+                    'name': _decode_string_result(name_data) if name_ok else '',
+                    'symbol': _decode_string_result(symbol_data),
+                    'decimals': abi_decode(['uint8'], decimals_data)[0],
+                })
+            except Exception as e:
+                logger.debug("Skipping token %s: undecodable metadata (%s)", target, e)
+        return tokens
+    
+    async def _resolve_token_address(self, token: str) -> Optional[str]:
+        """Resolve a token address or symbol to an address
+        
+        Args:
+            token: Token address or symbol
+            
+        Returns:
+            Token address, or None if the symbol is unknown
+        """
+        if _is_hex_address(token):
+            return token
+        
+        token_info = self._symbol_index.get(token.lower())
+        if not token_info:
+            async with self._rpc_sem:
+                token_info = await self.openocean.get_token_by_symbol(token)
+        return token_info["address"] if token_info else None
     
     def register_actions(self) -> None:
         """Register available actions for OpenOcean"""
-        self.actions = {
-            "get-token-list": Action(
-                name="get-token-list",
-                description="Get list of supported tokens on the current chain",
-                parameters=[]
-            ),
-            "get-token-by-symbol": Action(
-                name="get-token-by-symbol",
-                description="Get token details by symbol",
-                parameters=[
-                    ActionParameter("symbol", True, str, "Token symbol (e.g., 'ETH', 'USDC')")
-                ]
-            ),
-            "get-dex-list": Action(
-                name="get-dex-list",
-                description="Get list of supported DEXes on the current chain",
-                parameters=[]
-            ),
-            "get-swap-quote": Action(
-                name="get-swap-quote",
-                description="Get a quote for swapping tokens",
-                parameters=[
-                    ActionParameter("in_token", True, str, "Input token address or symbol"),
-                    ActionParameter("out_token", True, str, "Output token address or symbol"),
-                    ActionParameter("amount", True, str, "Token amount (without decimals)"),
-                    ActionParameter("gas_price", False, str, "Gas price in GWEI (without decimals)"),
-                ]
-            ),
-            "execute-swap": Action(
-                name="execute-swap",
-                description="Execute a token swap",
-                parameters=[
-                    ActionParameter("in_token", True, str, "Input token address or symbol"),
-                    ActionParameter("out_token", True, str, "Output token address or symbol"),
-                    ActionParameter("amount", True, str, "Token amount (without decimals)"),
-                    ActionParameter("slippage", False, float, "Slippage percentage (0.05-50)"),
-                ]
-            ),
-        }
+        self.actions = self._ACTIONS
     
-    async def get_token_list(self, **kwargs) -> Dict[str, Any]:
+    async def get_token_list(self, **kwargs) -> Mapping[str, Any]:
         """Get list of supported tokens on the current chain
         
         Returns:
@@ -159,19 +351,20 @@ class OpenOceanBaseConnection(BaseConnection):
         """
         try:
             if not self.openocean:
-                return {"success": False, "error": "Not connected to OpenOcean API"}
+                return dict(_ERR_NOT_CONNECTED)
             
-            tokens = await self.openocean.get_token_list()
+            async with self._rpc_sem:
+                tokens = await self.openocean.get_token_list()
             return {
                 "success": tokens is not None,
                 "tokens": tokens or [],
                 "count": len(tokens) if tokens else 0
             }
         except Exception as e:
-            logger.error(f"Error getting token list: {str(e)}")
+            logger.error("Error getting token list: %s", e)
             return {"success": False, "error": str(e)}
     
-    async def get_token_by_symbol(self, **kwargs) -> Dict[str, Any]:
+    async def get_token_by_symbol(self, **kwargs) -> Mapping[str, Any]:
         """Get token details by symbol
         
         Args:
@@ -183,22 +376,23 @@ class OpenOceanBaseConnection(BaseConnection):
         try:
             symbol = kwargs.get("symbol")
             if not symbol:
-                return {"success": False, "error": "Token symbol is required"}
+                return dict(_ERR_SYMBOL_REQUIRED)
             
             if not self.openocean:
-                return {"success": False, "error": "Not connected to OpenOcean API"}
+                return dict(_ERR_NOT_CONNECTED)
             
-            token = await self.openocean.get_token_by_symbol(symbol)
+            async with self._rpc_sem:
+                token = await self.openocean.get_token_by_symbol(symbol)
             return {
                 "success": token is not None,
                 "token": token or None,
                 "token_address": token.get("address") if token else None
             }
         except Exception as e:
-            logger.error(f"Error getting token by symbol: {str(e)}")
+            logger.error("Error getting token by symbol: %s", e)
             return {"success": False, "error": str(e)}
     
-    async def get_dex_list(self, **kwargs) -> Dict[str, Any]:
+    async def get_dex_list(self, **kwargs) -> Mapping[str, Any]:
         """Get list of supported DEXes on the current chain
         
         Returns:
@@ -206,19 +400,20 @@ class OpenOceanBaseConnection(BaseConnection):
         """
         try:
             if not self.openocean:
-                return {"success": False, "error": "Not connected to OpenOcean API"}
+                return dict(_ERR_NOT_CONNECTED)
             
-            dexes = await self.openocean.get_dex_list()
+            async with self._rpc_sem:
+                dexes = await self.openocean.get_dex_list()
             return {
                 "success": dexes is not None,
                 "dexes": dexes or [],
                 "count": len(dexes) if dexes else 0
             }
         except Exception as e:
-            logger.error(f"Error getting DEX list: {str(e)}")
+            logger.error("Error getting DEX list: %s", e)
             return {"success": False, "error": str(e)}
     
-    async def get_swap_quote(self, **kwargs) -> Dict[str, Any]:
+    async def get_swap_quote(self, **kwargs) -> Mapping[str, Any]:
         """Get a quote for swapping tokens
         
         Args:
@@ -236,36 +431,36 @@ class OpenOceanBaseConnection(BaseConnection):
             amount = kwargs.get("amount")
             gas_price = kwargs.get("gas_price")
             
-            if not all([in_token, out_token, amount]):
-                return {"success": False, "error": "Missing required parameters"}
+            if not (in_token and out_token and amount):
+                return dict(_ERR_MISSING_PARAMS)
+            
+            # Reject malformed input before any network I/O
+            invalid_token = _first_invalid_token(in_token, out_token)
+            if invalid_token:
+                return {"success": False, "error": f"Invalid token address or symbol: {invalid_token}"}
             
             if not self.openocean:
-                return {"success": False, "error": "Not connected to OpenOcean API"}
+                return dict(_ERR_NOT_CONNECTED)
             
             # Resolve token symbols to addresses if needed
-            in_token_address = in_token
-            if not in_token.startswith("0x"):
-                token_info = await self.openocean.get_token_by_symbol(in_token)
-                if not token_info:
-                    return {"success": False, "error": f"Token symbol not found: {in_token}"}
-                in_token_address = token_info["address"]
-            
-            out_token_address = out_token
-            if not out_token.startswith("0x"):
-                token_info = await self.openocean.get_token_by_symbol(out_token)
-                if not token_info:
-                    return {"success": False, "error": f"Token symbol not found: {out_token}"}
-                out_token_address = token_info["address"]
-            
-            quote = await self.openocean.get_quote(
-                in_token_address=in_token_address,
-                out_token_address=out_token_address,
-                amount=amount,
-                gas_price=gas_price
-            )
+            in_token_address = await self._resolve_token_address(in_token)
+            if not in_token_address:
+                return {"success": False, "error": f"Token symbol not found: {in_token}"}
+            
+            out_token_address = await self._resolve_token_address(out_token)
+            if not out_token_address:
+                return {"success": False, "error": f"Token symbol not found: {out_token}"}
+            
+            async with self._rpc_sem:
+                quote = await self.openocean.get_quote(
+                    in_token_address=in_token_address,
+                    out_token_address=out_token_address,
+                    amount=amount,
+                    gas_price=gas_price
+                )
             
             if not quote:
-                return {"success": False, "error": "Failed to get swap quote"}
+                return dict(_ERR_QUOTE_FAILED)
             
             return {
                 "success": True,
@@ -278,10 +473,10 @@ class OpenOceanBaseConnection(BaseConnection):
                 "price_impact": quote.get("price_impact")
             }
         except Exception as e:
-            logger.error(f"Error getting swap quote: {str(e)}")
+            logger.error("Error getting swap quote: %s", e)
             return {"success": False, "error": str(e)}
     
-    async def execute_swap(self, **kwargs) -> Dict[str, Any]:
+    async def execute_swap(self, **kwargs) -> Mapping[str, Any]:
         """Execute a token swap
         
         Args:
@@ -299,49 +494,43 @@ class OpenOceanBaseConnection(BaseConnection):
             amount = kwargs.get("amount")
             slippage = kwargs.get("slippage")
             
-            if not all([in_token, out_token, amount]):
-                return {"success": False, "error": "Missing required parameters"}
+            if not (in_token and out_token and amount):
+                return dict(_ERR_MISSING_PARAMS)
+            
+            # Reject malformed input before any network I/O
+            invalid_token = _first_invalid_token(in_token, out_token)
+            if invalid_token:
+                return {"success": False, "error": f"Invalid token address or symbol: {invalid_token}"}
             
             if not self.openocean:
-                return {"success": False, "error": "Not connected to OpenOcean API"}
+                return dict(_ERR_NOT_CONNECTED)
             
             if not self.account:
-                return {"success": False, "error": "No wallet configured, private key missing"}
+                return dict(_ERR_NO_WALLET)
             
             # Resolve token symbols to addresses if needed
-            in_token_address = in_token
-            if not in_token.startswith("0x"):
-                token_info = await self.openocean.get_token_by_symbol(in_token)
-                if not token_info:
-                    return {"success": False, "error": f"Token symbol not found: {in_token}"}
-                in_token_address = token_info["address"]
-            
-            out_token_address = out_token
-            if not out_token.startswith("0x"):
-                token_info = await self.openocean.get_token_by_symbol(out_token)
-                if not token_info:
-                    return {"success": False, "error": f"Token symbol not found: {out_token}"}
-                out_token_address = token_info["address"]
-            
-            # Get private key from environment
-            private_key_env = self.config['private_key_env']
-            private_key = os.getenv(private_key_env)
-            if not private_key:
-                return {"success": False, "error": f"Private key not found in environment variable {private_key_env}"}
-            
-            # Execute swap
-            result = await self.openocean.execute_swap(
-                in_token_address=in_token_address,
-                out_token_address=out_token_address,
-                amount=amount,
-                private_key=private_key,
-                slippage=slippage
-            )
+            in_token_address = await self._resolve_token_address(in_token)
+            if not in_token_address:
+                return {"success": False, "error": f"Token symbol not found: {in_token}"}
+            
+            out_token_address = await self._resolve_token_address(out_token)
+            if not out_token_address:
+                return {"success": False, "error": f"Token symbol not found: {out_token}"}
+            
+            # Execute swap, signing with the account derived at connect()
+            async with self._rpc_sem:
+                result = await self.openocean.execute_swap(
+                    in_token_address=in_token_address,
+                    out_token_address=out_token_address,
+                    amount=amount,
+                    slippage=slippage,
+                    account=self.account
+                )
             
             if not result:
-                return {"success": False, "error": "Failed to execute swap"}
+                return dict(_ERR_SWAP_FAILED)
             
             return result
         except Exception as e:
-            logger.error(f"Error executing swap: {str(e)}")
+            logger.error("Error executing swap: %s", e)
             return {"success": False, "error": str(e)}
\ No newline at end of file
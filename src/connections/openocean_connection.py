@@ -1,16 +1,154 @@
 """OpenOcean API connection handler"""
 import logging
 import os
-import json
 import time
 from typing import Dict, Any, Optional, List, Tuple, Union, cast
 import aiohttp
 import asyncio
+import orjson
+import requests
+import websockets
+from types import MappingProxyType
+from eth_abi import encode as abi_encode, decode as abi_decode
+from eth_account.signers.local import LocalAccount
 from web3 import Web3
-from web3.contract import Contract
+from web3.exceptions import TransactionNotFound
+from ._http import get_session, release_session
+from ..constants.abi import (
+    MULTICALL3_ADDRESS,
+    MULTICALL3_AGGREGATE3_SELECTOR,
+    ERC20_ALLOWANCE_SELECTOR,
+    ERC20_APPROVE_SELECTOR,
+)
 
 logger = logging.getLogger(__name__)
 
+# Chain ID -> chain name used in OpenOcean API paths
+CHAIN_MAP = MappingProxyType({
+    '1': 'eth',      # Ethereum
+    '56': 'bsc',     # Binance Smart Chain
+    '137': 'polygon', # Polygon
+    '42161': 'arbitrum', # Arbitrum
+    '10': 'optimism', # Optimism
+    '43114': 'avax',  # Avalanche
+    '250': 'fantom',  # Fantom
+    '146': 'sonic',   # Sonic - Use "sonic" as chain name (not chain ID)
+    # Add more chains as needed
+})
+
+# Chain ID -> block explorer base URL
+_EXPLORER_BASE = MappingProxyType({
+    '1': 'https://etherscan.io',
+    '56': 'https://bscscan.com',
+    '137': 'https://polygonscan.com',
+    '42161': 'https://arbiscan.io',
+    '10': 'https://optimistic.etherscan.io',
+    '43114': 'https://snowtrace.io',
+    '250': 'https://ftmscan.com',
+    '146': 'https://explorer.sonic.ooo',
+    # Add more chains as needed
+})
+
+# batchAll of a batch contract that executes several calls atomically with the signer
+# as msg.sender (e.g. the 0x...0808 precompile on Moonbeam-based chains); configured
+# per chain through the batch_routers option
+_BATCH_ALL_SELECTOR = Web3.keccak(text="batchAll(address[],uint256[],bytes[],uint64[])")[:4]
+
+# Chains where transactions are priced with EIP-1559 fees instead of a legacy gas price
+_EIP1559_CHAINS = frozenset({'1', '10', '137', '42161'})
+
+# Sentinel for distinguishing a missing 'data' field from an explicit null
+_MISSING = object()
+
+# Allowances at or above this are treated as unlimited: approvals of 2**256 - 1 are not
+# spent down (or barely), so they stay valid across swaps and are safe to remember
+_UNLIMITED_ALLOWANCE = 2**255
+
+def _dump_for_log(obj: Any, limit: Optional[int] = None, indent: bool = True, level: int = logging.INFO) -> str:
+    """Serialize an object for a log message, skipping the work if the level is disabled
+
+    Args:
+        obj: Object to serialize
+        limit: Optional maximum length of the returned string
+        indent: Whether to pretty-print with a 2-space indent
+        level: Log level the message will be emitted at
+
+    Returns:
+        JSON text, or an empty string when the level is disabled
+    """
+    if not logger.isEnabledFor(level):
+        return ''
+    option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+    text = orjson.dumps(obj, option=option, default=str).decode()
+    return text[:limit] if limit else text
+
+
+class _NewHeadsWatcher:
+    """Background eth_subscribe("newHeads") listener used to wake receipt pollers once per block"""
+    
+    def __init__(self, wss_url: str):
+        self.wss_url = wss_url
+        self._task: Optional[asyncio.Task] = None
+        self._next_head: Optional[asyncio.Future] = None
+    
+    def start(self) -> None:
+        """Start the subscription task if it is not already running"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+    
+    def stop(self) -> None:
+        """Cancel the subscription task and wake any pending waiters"""
+        if self._task and not self._task.done():
+            self._task.cancel()
+        self._task = None
+        if self._next_head is not None and not self._next_head.done():
+            self._next_head.set_result(None)
+        self._next_head = None
+    
+    async def wait_for_head(self, timeout: float) -> None:
+        """Wait until the next block header arrives or timeout seconds pass"""
+        if self._next_head is None or self._next_head.done():
+            self._next_head = asyncio.get_running_loop().create_future()
+        try:
+            await asyncio.wait_for(asyncio.shield(self._next_head), timeout)
+        except asyncio.TimeoutError:
+            pass
+    
+    async def _run(self) -> None:
+        subscribe = orjson.dumps({'jsonrpc': '2.0', 'id': 1, 'method': 'eth_subscribe', 'params': ['newHeads']})
+        while True:
+            try:
+                async with websockets.connect(self.wss_url) as ws:
+                    await ws.send(subscribe.decode())
+                    async for message in ws:
+                        if orjson.loads(message).get('method') != 'eth_subscription':
+                            continue
+                        next_head = self._next_head
+                        if next_head is not None and not next_head.done():
+                            next_head.set_result(None)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("newHeads subscription to %s dropped: %s", self.wss_url, e)
+                await asyncio.sleep(5)
+
+
+def _encode_approve(spender: str, amount: int) -> bytes:
+    """Encode approve(address,uint256) calldata without going through the contract ABI machinery"""
+    return ERC20_APPROVE_SELECTOR + bytes.fromhex(spender[2:].rjust(64, '0')) + amount.to_bytes(32, 'big')
+
+
+def _encode_batch_all(targets: List[str], values: List[int], call_data: List[bytes]) -> bytes:
+    """Encode batchAll(address[],uint256[],bytes[],uint64[]) calldata
+
+    No per-call gas limits are passed, so each call is forwarded all remaining gas.
+    """
+    return _BATCH_ALL_SELECTOR + abi_encode(
+        ['address[]', 'uint256[]', 'bytes[]', 'uint64[]'],
+        [[Web3.to_checksum_address(target) for target in targets], values, call_data, []]
+    )
+
+
 # ERC20 ABI for token approval functions
 ERC20_ABI = [
     {
@@ -42,6 +180,14 @@ ERC20_ABI = [
 class OpenOceanConnection:
     """Connection handler for OpenOcean API"""
     
+    # Web3 clients keyed by RPC URL, shared across instances so RPC connection pools are reused
+    _web3_cache: Dict[str, Web3] = {}
+    
+    # Caps in-flight API requests across all instances, independent of the
+    # connector pool; created lazily for the running event loop
+    _concurrency: Optional[asyncio.Semaphore] = None
+    _concurrency_loop: Optional[asyncio.AbstractEventLoop] = None
+    
     def __init__(self, config: Dict[str, Any]):
         """Initialize OpenOcean connection
 
@@ -53,8 +199,23 @@ class OpenOceanConnection:
                 - referrer_fee: Optional referrer fee percentage (0.01-3)
                 - use_pro_api: Whether to use Pro API (default: True)
                 - api_key: OpenOcean Pro API key (can also be set via OPENOCEAN_API_KEY env var)
+                - token_list_ttl: Seconds to reuse a fetched token list (default: 300)
+                - dex_list_ttl: Seconds to reuse a fetched DEX list (default: 600)
+                - allowance_ttl: Seconds to reuse an allowance API response (default: 10)
+                - max_concurrency: Maximum in-flight API requests shared by all
+                  connections (default: 8)
+                - spender_allowance_ttl: Seconds to trust a known unlimited on-chain
+                  allowance for a router before re-checking it (default: 3600)
+                - rate_limit_burst: Requests that may be sent back to back before the
+                  one-per-min_interval rate applies (default: 1)
+                - batch_routers: Chain ID -> batch contract (exposing batchAll) used to
+                  send approval and swap as a single transaction; only chains in
+                  CHAIN_MAP are accepted
+        
+        Set WEB3_WSS_URL_<chain_id> to have receipt polling driven by a newHeads
+        WebSocket subscription instead of a fixed interval.
         """
-        self.chain_id = config.get('chain_id', '1')  # Default to Ethereum
+        self.chain_id = str(config.get('chain_id', '1'))  # Default to Ethereum
         self.chain_name = self._get_chain_name(self.chain_id)
         self.use_pro_api = config.get('use_pro_api', True)  # Default to Pro API
         
@@ -65,48 +226,90 @@ class OpenOceanConnection:
         else:
             self.base_url = "https://open-api.openocean.finance/v4"
             self.api_key = None
-            
+        
+        # Request URL prefix and headers depend only on config, so build them once
+        self._url_prefix = f"{self.base_url}/{self.chain_name}"
+        if self.use_pro_api and self.api_key:
+            self._headers = MappingProxyType({'apikey': self.api_key, 'Content-Type': 'application/json'})
+        else:
+            self._headers = MappingProxyType({})
+        
         self._session: Optional[aiohttp.ClientSession] = None
-        self.min_interval = 1  # 1 second between requests
-        self._last_request = 0
+        self.min_interval = 1  # 1 second between requests (token refill interval)
+        self.rate_limit_burst = config.get('rate_limit_burst', 1)
+        self._rate_lock = asyncio.Lock()
+        self._tokens = float(self.rate_limit_burst)
+        self._last_refill = time.monotonic()
+        self.max_concurrency = config.get('max_concurrency', 8)
         self.slippage = config.get('slippage', 1)  # Default 1% slippage
+        self._slippage_str = str(self.slippage)
         self.referrer = config.get('referrer', None)
         self.referrer_fee = config.get('referrer_fee', None)
         
+        # Token lists are large and change rarely; cache them per chain
+        self.token_list_ttl = config.get('token_list_ttl', 300)
+        # Entries are (fetched_at, data, etag) so expired lists can be revalidated
+        self._token_list_cache: Dict[str, Tuple[float, List[Dict[str, Any]], Optional[str]]] = {}
+        # Lower-cased symbol -> token, per chain, rebuilt whenever the token list is refetched
+        self._symbol_index: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self.dex_list_ttl = config.get('dex_list_ttl', 600)
+        self._dex_list_cache: Dict[str, Tuple[float, List[Dict[str, Any]], Optional[str]]] = {}
+        # Allowances change on approval, so only reuse them briefly
+        self.allowance_ttl = config.get('allowance_ttl', 10)
+        self._allowance_cache: Dict[Tuple[str, str, str], Tuple[float, Dict[str, Any]]] = {}
+        # On-chain allowances per (chain, token, owner, spender); max approvals are
+        # effectively permanent, so these can be trusted for much longer
+        self.spender_allowance_ttl = config.get('spender_allowance_ttl', 3600)
+        self._spender_allowance_cache: Dict[Tuple[str, str, str, str], Tuple[int, float]] = {}
+        # EIP-1559 fees per chain as (max_fee, priority_fee, fetched_at), refreshed about once per block
+        self.fee_ttl = config.get('fee_ttl', 3)
+        self._fee_cache: Dict[str, Tuple[int, int, float]] = {}
+        self._batch_router: Dict[str, str] = {}
+        for batch_chain_id, batch_address in config.get('batch_routers', {}).items():
+            if str(batch_chain_id) in CHAIN_MAP:
+                self._batch_router[str(batch_chain_id)] = batch_address
+            else:
+                # Quotes for an unmapped chain would come from the Ethereum API
+                logger.warning("Ignoring batch router for chain %s: not supported by CHAIN_MAP", batch_chain_id)
+        # Fixed fields of max-amount approve transactions per (chain, token, spender)
+        self._approve_tx_template: Dict[Tuple[str, str, str], Dict[str, Any]] = {}
+        # Comma-joined DEX ID query values, keyed by the ID set they were built from
+        self._dex_ids_cache: Dict[frozenset, str] = {}
+        wss_url = os.getenv(f"WEB3_WSS_URL_{self.chain_id}")
+        self._heads = _NewHeadsWatcher(wss_url) if wss_url else None
+        
         logger.info(f"Initialized OpenOcean connection for chain {self.chain_name} (ID: {self.chain_id})")
     
-    def _get_chain_name(self, chain_id: str) -> str:
+    def _join_dex_ids(self, dex_ids: Union[List[str], frozenset]) -> str:
+        """Return the comma-separated query value for a set of DEX IDs, memoized per set"""
+        key = dex_ids if isinstance(dex_ids, frozenset) else frozenset(dex_ids)
+        joined = self._dex_ids_cache.get(key)
+        if joined is None:
+            joined = self._dex_ids_cache[key] = ','.join(str(dex_id) for dex_id in dex_ids)
+        return joined
+    
+    @staticmethod
+    def _get_chain_name(chain_id: str) -> str:
         """Convert chain ID to chain name for OpenOcean API"""
-        chain_map = {
-            '1': 'eth',      # Ethereum
-            '56': 'bsc',     # Binance Smart Chain
-            '137': 'polygon', # Polygon
-            '42161': 'arbitrum', # Arbitrum
-            '10': 'optimism', # Optimism
-            '43114': 'avax',  # Avalanche
-            '250': 'fantom',  # Fantom
-            '146': 'sonic',   # Sonic - Use "sonic" as chain name (not chain ID)
-            # Add more chains as needed
-        }
-        
-        # Convert numeric chain_id to string if needed
-        if isinstance(chain_id, int):
-            chain_id = str(chain_id)
-            
-        logger.debug(f"Mapping chain ID {chain_id} to OpenOcean chain name")
-        return chain_map.get(chain_id, 'eth')
+        return CHAIN_MAP.get(str(chain_id), 'eth')
     
-    async def connect(self, verbose: bool = False) -> bool:
-        """Establish connection and verify API access
+    async def connect(self, verbose: bool = False, verify_on_connect: bool = False) -> bool:
+        """Establish connection, optionally verifying API access
         
         Args:
             verbose: Whether to print token list details (default: False)
+            verify_on_connect: Fetch the token list to verify API access before
+                returning (default: False; failures surface on the first real call)
             
         Returns:
             True if connected successfully, False otherwise
         """
         try:
-            self._session = aiohttp.ClientSession()
+            if not self._session:
+                self._session = await get_session()
+            if not verify_on_connect:
+                return True
+            
             # Test connection by getting token list (non-verbose mode)
             test_response = await self.get_token_list(verbose=verbose)
             if test_response:
@@ -118,10 +321,43 @@ class OpenOceanConnection:
             return False
     
     async def close(self) -> None:
-        """Close the connection"""
+        """Close the connection, releasing the shared HTTP session"""
+        if self._heads:
+            self._heads.stop()
         if self._session:
-            await self._session.close()
             self._session = None
+            await release_session()
+    
+    def _get_concurrency(self) -> asyncio.Semaphore:
+        """Return the semaphore bounding concurrent API requests for the running event loop"""
+        cls = type(self)
+        loop = asyncio.get_running_loop()
+        if cls._concurrency is None or cls._concurrency_loop is not loop:
+            cls._concurrency = asyncio.Semaphore(self.max_concurrency)
+            cls._concurrency_loop = loop
+        return cls._concurrency
+    
+    async def _rate_limit(self) -> None:
+        """Wait for a token from the request rate limiter
+        
+        Token bucket refilled at one token per min_interval, holding at most
+        rate_limit_burst tokens. Callers are serialized on a lock so concurrent
+        requests share the budget instead of all passing the check at once.
+        """
+        if self.min_interval <= 0:
+            return
+        async with self._rate_lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.rate_limit_burst,
+                self._tokens + (now - self._last_refill) / self.min_interval
+            )
+            self._last_refill = now
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) * self.min_interval)
+                self._tokens = 1.0
+                self._last_refill = time.monotonic()
+            self._tokens -= 1
     
     async def _make_request(self, endpoint: str, params: Dict[str, Any] = None) -> Optional[Dict[str, Any]]:
         """Make a request to the OpenOcean API with rate limiting
@@ -133,97 +369,167 @@ class OpenOceanConnection:
         Returns:
             Response data or None if the request failed
         """
+        return await self._get_data(endpoint, params, allow_empty_for_no_route=True)
+    
+    async def _get_response(self,
+                            endpoint: str,
+                            params: Optional[Dict[str, Any]] = None,
+                            etag: Optional[str] = None) -> Optional[Tuple[int, bytes, Optional[str]]]:
+        """GET a chain-scoped OpenOcean endpoint and return the raw response
+        
+        Handles the session check, concurrency bound, rate limiting and HTTP
+        status check shared by every chain-scoped GET.
+        
+        Args:
+            endpoint: API endpoint to call (e.g. 'quote')
+            params: Query parameters
+            etag: ETag of a cached response; sent as If-None-Match so an
+                unchanged resource comes back as an empty 304
+            
+        Returns:
+            Tuple of (status, body, ETag), or None if the request failed
+        """
         if not self._session:
             logger.error("Connection not established. Call connect() first.")
             return None
         
-        # Apply rate limiting
-        now = time.time()
-        if now - self._last_request < self.min_interval:
-            await asyncio.sleep(self.min_interval - (now - self._last_request))
-        self._last_request = time.time()
-        
-        try:
-            url = f"{self.base_url}/{self.chain_name}/{endpoint}"
-            logger.info(f"Making request to OpenOcean API: {url}")
-            logger.info(f"Request parameters: {json.dumps(params, indent=2) if params else 'None'}")
-            
-            # Set up headers with API key if using Pro API
-            headers = {}
-            if self.use_pro_api and self.api_key:
-                headers['apikey'] = self.api_key
-                headers['Content-Type'] = 'application/json'
-                logger.info("Using OpenOcean Pro API with API key")
-            
-            # Make the request with appropriate headers
-            async with self._session.get(url, params=params, headers=headers, timeout=30) as response:
-                response_text = await response.text()
+        # Bound concurrency before queuing on the rate limiter
+        async with self._get_concurrency():
+            # Apply rate limiting
+            await self._rate_limit()
+            
+            try:
+                url = f"{self._url_prefix}/{endpoint}"
+                logger.info("Making request to OpenOcean API: %s", url)
+                logger.info("Request parameters: %s", _dump_for_log(params) if params else 'None')
                 
-                if response.status != 200:
-                    logger.error(f"OpenOcean API request failed with status {response.status}: {response_text}")
-                    logger.error(f"Request URL: {url}")
-                    logger.error(f"Headers: {dict(response.headers)}")
-                    return None
+                # Set up headers with API key if using Pro API
+                headers = self._headers
+                if headers:
+                    logger.info("Using OpenOcean Pro API with API key")
+                if etag:
+                    headers = {**headers, 'If-None-Match': etag}
                 
-                try:
-                    data = json.loads(response_text)
+                # Make the request with appropriate headers
+                async with self._session.get(url, params=params, headers=headers, timeout=30) as response:
+                    response_bytes = await response.read()
                     
-                    # For large responses like token lists, only log summary
-                    if endpoint == 'tokenList' and 'data' in data and isinstance(data['data'], list):
-                        token_count = len(data['data'])
-                        logger.info(f"OpenOcean API response: Retrieved {token_count} tokens")
-                        logger.debug(f"Full token list: {json.dumps(data, indent=2)}")
-                    else:
-                        # For other responses, log the full response but with a size limit
-                        response_str = json.dumps(data, indent=2)
-                        if len(response_str) > 500:  # If response is very large
-                            logger.info(f"OpenOcean API response: {response_str[:500]}... (truncated)")
-                            logger.debug(f"Full response: {response_str}")
-                        else:
-                            logger.info(f"OpenOcean API response: {response_str}")
-                except json.JSONDecodeError:
-                    logger.error(f"Failed to parse OpenOcean API response as JSON: {response_text}")
-                    return None
-                
-                if data.get('code') != 200:
-                    logger.error(f"OpenOcean API returned error code: {data.get('code')}")
-                    logger.error(f"Error response: {data}")
-                    if data.get('message'):
-                        logger.error(f"Error message: {data.get('message')}")
-                    if data.get('error'):
-                        logger.error(f"Error details: {data.get('error')}")
-                    return None
-                
-                # Check if data structure is valid
-                if 'data' not in data:
-                    # For some endpoints (like quote), a success code without data field
-                    # might be a legitimate empty response indicating no available route
-                    if endpoint in ['quote', 'swap'] and data.get('code') == 200:
-                        logger.warning(f"OpenOcean API returned success code but no data field for {endpoint}: {data}")
-                        # Return empty dict to indicate success but no route available
-                        return {}
-                    elif data.get('code') == 200:
-                        # Some endpoints may return just a success code when operation succeeded
-                        logger.info(f"OpenOcean API returned success code for {endpoint} without data field")
-                        return {}
-                    elif data.get('code') in [400, 404, 500] and endpoint in ['quote', 'swap']:
-                        # Error codes for these endpoints might mean no route available
-                        logger.warning(f"OpenOcean API returned error code {data.get('code')} for {endpoint} - likely no route available: {data}")
-                        return {}
-                    else:
-                        logger.error(f"OpenOcean API response missing 'data' field: {data}")
+                    if response.status == 304 and etag:
+                        logger.info("OpenOcean API %s not modified", endpoint)
+                        return 304, response_bytes, etag
+                    
+                    if response.status != 200:
+                        logger.error("OpenOcean API request failed with status %s: %s", response.status, response_bytes.decode('utf-8', 'replace'))
+                        logger.error("Request URL: %s", url)
+                        logger.error("Headers: %s", dict(response.headers))
                         return None
-                
-                return data.get('data')
-        except aiohttp.ClientError as e:
-            logger.error(f"OpenOcean API connection error for {url}: {str(e)}")
+                    
+                    return 200, response_bytes, response.headers.get('ETag')
+            except aiohttp.ClientError as e:
+                logger.error("OpenOcean API connection error for %s: %s", url, e)
+                return None
+            except asyncio.TimeoutError:
+                logger.error("OpenOcean API request timed out for %s", url)
+                return None
+            except Exception as e:
+                logger.error("Unexpected error making request to OpenOcean API (%s): %s", endpoint, e)
+                return None
+    
+    async def _get_bytes(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Optional[bytes]:
+        """GET a chain-scoped OpenOcean endpoint and return the raw response body, or None on failure"""
+        response = await self._get_response(endpoint, params)
+        return response[1] if response else None
+    
+    async def _get_data(self,
+                        endpoint: str,
+                        params: Optional[Dict[str, Any]] = None,
+                        *,
+                        allow_empty_for_no_route: bool = False) -> Optional[Any]:
+        """GET a chain-scoped OpenOcean endpoint and return the response's 'data' field
+        
+        Single request path shared by every chain-scoped GET: fetches the body with
+        _get_bytes, then decodes and checks it with _parse_data.
+        
+        Args:
+            endpoint: API endpoint to call (e.g. 'quote')
+            params: Query parameters
+            allow_empty_for_no_route: Return {} instead of None when the API reports
+                success without a 'data' field (e.g. no route available)
+            
+        Returns:
+            The 'data' field of the response, or None if the request failed
+        """
+        response_bytes = await self._get_bytes(endpoint, params)
+        if response_bytes is None:
             return None
-        except asyncio.TimeoutError:
-            logger.error(f"OpenOcean API request timed out for {url}")
+        return self._parse_data(endpoint, response_bytes, allow_empty_for_no_route)
+    
+    def _parse_data(self, endpoint: str, response_bytes: bytes, allow_empty_for_no_route: bool = False) -> Optional[Any]:
+        """Decode an OpenOcean response body, check its error code and return its 'data' field
+        
+        Args:
+            endpoint: API endpoint the body came from
+            response_bytes: Raw response body
+            allow_empty_for_no_route: Return {} instead of None when the API reports
+                success without a 'data' field
+            
+        Returns:
+            The 'data' field of the response, or None if the response was an error
+        """
+        try:
+            data = orjson.loads(response_bytes)
+            
+            # For large responses like token lists, only log summary
+            if endpoint == 'tokenList' and 'data' in data and isinstance(data['data'], list):
+                token_count = len(data['data'])
+                logger.info("OpenOcean API response: Retrieved %s tokens", token_count)
+                logger.debug("Full token list: %s", _dump_for_log(data, level=logging.DEBUG))
+            elif logger.isEnabledFor(logging.INFO):
+                # For other responses, log the full response but with a size limit
+                response_str = _dump_for_log(data)
+                if len(response_str) > 500:  # If response is very large
+                    logger.info("OpenOcean API response: %s... (truncated)", response_str[:500])
+                    logger.debug("Full response: %s", response_str)
+                else:
+                    logger.info("OpenOcean API response: %s", response_str)
+        except orjson.JSONDecodeError:
+            logger.error("Failed to parse OpenOcean API response as JSON: %s", response_bytes.decode('utf-8', 'replace'))
             return None
-        except Exception as e:
-            logger.error(f"Unexpected error making request to OpenOcean API ({endpoint}): {str(e)}")
+        
+        if not isinstance(data, dict):
+            logger.error("Unexpected OpenOcean API response for %s: %s", endpoint, data)
             return None
+        
+        code = data.get('code')
+        if code != 200:
+            message = data.get('message')
+            error = data.get('error')
+            logger.error("OpenOcean API returned error code: %s", code)
+            logger.error("Error response: %s", data)
+            if message:
+                logger.error("Error message: %s", message)
+            if error:
+                logger.error("Error details: %s", error)
+            return None
+        
+        # Check if data structure is valid
+        payload = data.get('data', _MISSING)
+        if payload is _MISSING:
+            if not allow_empty_for_no_route:
+                logger.error("OpenOcean API response missing 'data' field: %s", data)
+                return None
+            
+            # For some endpoints (like quote), a success code without data field
+            # might be a legitimate empty response indicating no available route
+            if endpoint in ['quote', 'swap']:
+                logger.warning("OpenOcean API returned success code but no data field for %s: %s", endpoint, data)
+            else:
+                # Some endpoints may return just a success code when operation succeeded
+                logger.info("OpenOcean API returned success code for %s without data field", endpoint)
+            # Return empty dict to indicate success but no route available
+            return {}
+        
+        return payload
     
     async def get_token_list(self, verbose: bool = False) -> Optional[List[Dict[str, Any]]]:
         """Get list of supported tokens for the current chain
@@ -234,19 +540,14 @@ class OpenOceanConnection:
         Returns:
             List of token data or None if the request failed
         """
-        # Store original log level
-        original_level = logger.level
-        
-        try:
-            # If not verbose, temporarily increase log level to reduce output
-            if not verbose:
-                logger.setLevel(logging.WARNING)
-            
-            # Make the request
-            return await self._make_request('tokenList')
-        finally:
-            # Restore original log level
-            logger.setLevel(original_level)
+        # Make the request (or reuse / revalidate the cached list)
+        previous = self._token_list_cache.get(self.chain_name)
+        tokens = await self._get_cached_list('tokenList', self._token_list_cache, self.token_list_ttl)
+        if tokens and (previous is None or tokens is not previous[1]):
+            self._symbol_index[self.chain_name] = self._build_symbol_index(tokens)
+        if verbose and tokens:
+            logger.info("Token list for %s: %d tokens", self.chain_name, len(tokens))
+        return tokens
     
     async def get_token_by_symbol(self, symbol: str, verbose: bool = False) -> Optional[Dict[str, Any]]:
         """Get token details by symbol
@@ -263,12 +564,18 @@ class OpenOceanConnection:
             return None
         
         # Find token by symbol (case-insensitive)
-        for token in tokens:
-            if token.get('symbol', '').lower() == symbol.lower():
-                return token
-        
-        logger.warning(f"Token with symbol {symbol} not found")
-        return None
+        token = self._symbol_index.get(self.chain_name, {}).get(symbol.lower())
+        if token is None:
+            logger.warning("Token with symbol %s not found", symbol)
+        return token
+    
+    @staticmethod
+    def _build_symbol_index(tokens: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """Index tokens by lower-cased symbol, keeping the first token listed for each symbol"""
+        index = {}
+        for token in reversed(tokens):
+            index[token.get('symbol', '').lower()] = token
+        return index
     
     async def get_dex_list(self) -> Optional[List[Dict[str, Any]]]:
         """Get list of supported DEXes for the current chain
@@ -276,15 +583,50 @@ class OpenOceanConnection:
         Returns:
             List of DEX data or None if the request failed
         """
-        return await self._make_request('dexList')
+        return await self._get_cached_list('dexList', self._dex_list_cache, self.dex_list_ttl)
+    
+    async def _get_cached_list(self,
+                               endpoint: str,
+                               cache: Dict[str, Tuple[float, List[Dict[str, Any]], Optional[str]]],
+                               ttl: float) -> Optional[List[Dict[str, Any]]]:
+        """Return a rarely-changing list endpoint from a per-chain TTL cache
+        
+        Expired entries are revalidated with their ETag; on 304 Not Modified the
+        cached list is kept and its timestamp refreshed without re-parsing.
+        
+        Args:
+            endpoint: List endpoint to call (e.g. 'tokenList')
+            cache: Per-chain cache of (fetched_at, data, etag) entries
+            ttl: Seconds a cached list is reused without revalidation
+            
+        Returns:
+            The list data or None if the request failed
+        """
+        cached = cache.get(self.chain_name)
+        if cached and time.monotonic() - cached[0] < ttl:
+            return cached[1]
+        
+        response = await self._get_response(endpoint, etag=cached[2] if cached else None)
+        if response is None:
+            return None
+        status, response_bytes, etag = response
+        
+        if status == 304 and cached:
+            cache[self.chain_name] = (time.monotonic(), cached[1], cached[2])
+            return cached[1]
+        
+        items = self._parse_data(endpoint, response_bytes, allow_empty_for_no_route=True)
+        if items:
+            cache[self.chain_name] = (time.monotonic(), items, etag)
+        return items
     
     async def get_quote(self, 
                        in_token_address: str, 
                        out_token_address: str, 
                        amount: str,
                        gas_price: str = None,
-                       disabled_dex_ids: List[str] = None,
-                       enabled_dex_ids: List[str] = None) -> Optional[Dict[str, Any]]:
+                       disabled_dex_ids: Union[List[str], frozenset] = None,
+                       enabled_dex_ids: Union[List[str], frozenset] = None) -> Optional[Dict[str, Any]]:
         """Get a swap quote without executing the swap
         
         Args:
@@ -306,59 +648,20 @@ class OpenOceanConnection:
             'outTokenAddress': out_token_address,
             'amount': amount,
             'gasPrice': gas_price if gas_price is not None else default_gas_price,
-            'slippage': str(self.slippage)  # Add slippage parameter which is required 
+            'slippage': self._slippage_str  # Add slippage parameter which is required 
         }
         
         if disabled_dex_ids:
-            params['disabledDexIds'] = ','.join(disabled_dex_ids)
+            params['disabledDexIds'] = self._join_dex_ids(disabled_dex_ids)
             
         if enabled_dex_ids:
-            params['enabledDexIds'] = ','.join(enabled_dex_ids)
+            params['enabledDexIds'] = self._join_dex_ids(enabled_dex_ids)
         
-        # Make direct request to ensure we get the proper response including the 'data' field
-        if not self._session:
-            logger.error("Connection not established. Call connect() first.")
-            return None
-            
-        url = f"{self.base_url}/{self.chain_name}/quote"
-        headers = {}
-        if self.use_pro_api and self.api_key:
-            headers['apikey'] = self.api_key
-            headers['Content-Type'] = 'application/json'
-        
-        logger.info(f"Making direct quote request to: {url}")
-        logger.info(f"Request parameters: {json.dumps(params, indent=2)}")
-        
-        try:
-            # Apply rate limiting
-            now = time.time()
-            if now - self._last_request < self.min_interval:
-                await asyncio.sleep(self.min_interval - (now - self._last_request))
-            self._last_request = time.time()
-            
-            async with self._session.get(url, params=params, headers=headers) as response:
-                if response.status != 200:
-                    logger.error(f"OpenOcean API quote request failed with status {response.status}")
-                    return None
-                
-                full_response = await response.json()
-                logger.info(f"OpenOcean API response (truncated): {json.dumps(full_response)[:200]}...")
-                
-                if full_response.get('code') != 200:
-                    logger.error(f"OpenOcean API returned error code: {full_response.get('code')}")
-                    return None
-                
-                # Extract the data field which contains the quote information
-                if 'data' in full_response and isinstance(full_response['data'], dict):
-                    quote_data = full_response['data']
-                    return quote_data
-                else:
-                    logger.warning(f"No quote data found in response!")
-                    return None
-                
-        except Exception as e:
-            logger.error(f"Error making quote request: {str(e)}")
+        quote_data = await self._get_data('quote', params)
+        if quote_data is not None and not isinstance(quote_data, dict):
+            logger.warning("No quote data found in response!")
             return None
+        return quote_data
     
     async def get_swap_transaction(self,
                                  in_token_address: str,
@@ -369,7 +672,7 @@ class OpenOceanConnection:
                                  gas_price: str = None,
                                  referrer: str = None,
                                  referrer_fee: float = None,
-                                 enabled_dex_ids: List[str] = None) -> Optional[Dict[str, Any]]:
+                                 enabled_dex_ids: Union[List[str], frozenset] = None) -> Optional[Dict[str, Any]]:
         """Get a swap transaction data
         
         Args:
@@ -394,7 +697,7 @@ class OpenOceanConnection:
             'outTokenAddress': out_token_address,
             'amount': amount,
             'account': account,
-            'slippage': str(slippage) if slippage is not None else str(self.slippage),
+            'slippage': str(slippage) if slippage is not None else self._slippage_str,
             'gasPrice': gas_price if gas_price is not None else default_gas_price,
         }
         
@@ -405,55 +708,18 @@ class OpenOceanConnection:
             params['referrerFee'] = referrer_fee or self.referrer_fee
             
         if enabled_dex_ids:
-            params['enabledDexIds'] = ','.join(enabled_dex_ids)
+            params['enabledDexIds'] = self._join_dex_ids(enabled_dex_ids)
             
-        # Make direct request to ensure we get the proper response including the 'data' field
-        if not self._session:
-            logger.error("Connection not established. Call connect() first.")
+        swap_data = await self._get_data('swap', params)
+        if swap_data is None:
             return None
-            
-        url = f"{self.base_url}/{self.chain_name}/swap"
-        headers = {}
-        if self.use_pro_api and self.api_key:
-            headers['apikey'] = self.api_key
-            headers['Content-Type'] = 'application/json'
-        
-        logger.info(f"Making direct swap request to: {url}")
-        logger.info(f"Request parameters: {json.dumps(params, indent=2)}")
-        
-        try:
-            # Apply rate limiting
-            now = time.time()
-            if now - self._last_request < self.min_interval:
-                await asyncio.sleep(self.min_interval - (now - self._last_request))
-            self._last_request = time.time()
-            
-            async with self._session.get(url, params=params, headers=headers) as response:
-                if response.status != 200:
-                    logger.error(f"OpenOcean API swap request failed with status {response.status}")
-                    return None
-                
-                full_response = await response.json()
-                logger.info(f"OpenOcean API response (truncated): {json.dumps(full_response)[:200]}...")
-                
-                if full_response.get('code') != 200:
-                    logger.error(f"OpenOcean API returned error code: {full_response.get('code')}")
-                    return None
-                
-                # Extract the data field which contains the swap information
-                if 'data' in full_response and isinstance(full_response['data'], dict):
-                    swap_data = full_response['data']
-                    # Verify the correct router address
-                    router = swap_data.get('to', '')
-                    logger.info(f"Swap will use router: {router}")
-                    return swap_data
-                else:
-                    logger.warning(f"No swap data found in response!")
-                    return None
-                
-        except Exception as e:
-            logger.error(f"Error making swap request: {str(e)}")
+        if not isinstance(swap_data, dict):
+            logger.warning("No swap data found in response!")
             return None
+        
+        # Verify the correct router address
+        logger.info("Swap will use router: %s", swap_data.get('to', ''))
+        return swap_data
     
     async def check_token_allowance_direct(self,
                                      token_address: str,
@@ -467,61 +733,252 @@ class OpenOceanConnection:
         Returns:
             Dictionary with allowance information or None if check failed
         """
-        try:
-            # Build API endpoint for allowance check
-            chain_name = self._get_chain_name(self.chain_id)
-            endpoint = f"allowance"
-            
-            # Set up parameters
-            params = {
-                "inTokenAddress": token_address,
-                "account": owner_address
-            }
+        cache_key = (self.chain_name, token_address.lower(), owner_address.lower())
+        cached = self._allowance_cache.get(cache_key)
+        if cached and time.monotonic() - cached[0] < self.allowance_ttl:
+            return cached[1]
+        
+        logger.info("Checking allowance for token %s, account %s", token_address, owner_address)
+        params = {
+            "inTokenAddress": token_address,
+            "account": owner_address
+        }
+        allowance_data = await self._get_data('allowance', params, allow_empty_for_no_route=True)
+        if allowance_data is None:
+            return None
+        
+        # The allowance information is the first element of the data list
+        if isinstance(allowance_data, list) and allowance_data:
+            allowance_info = allowance_data[0]
+            logger.info("Allowance info for token %s: %s", token_address, allowance_info)
+        else:
+            # Default to zero allowance if we couldn't find data
+            logger.warning("No allowance data found in response: %s", allowance_data)
+            allowance_info = {"allowance": "0", "raw": "0"}
+        
+        self._allowance_cache[cache_key] = (time.monotonic(), allowance_info)
+        return allowance_info
+    
+    def invalidate_allowance(self, token_address: str, owner_address: str) -> None:
+        """Drop a cached allowance, e.g. after an approval transaction was sent
+        
+        Args:
+            token_address: Token contract address
+            owner_address: Token owner address
+        """
+        self._allowance_cache.pop((self.chain_name, token_address.lower(), owner_address.lower()), None)
+    
+    def _spender_allowance_key(self, token_address: str, owner_address: str, spender_address: str) -> Tuple[str, str, str, str]:
+        return (self.chain_id, token_address.lower(), owner_address.lower(), spender_address.lower())
+    
+    def _get_known_allowance(self, token_address: str, owner_address: str, spender_address: str) -> Optional[int]:
+        """Return a recently observed on-chain allowance for a spender, or None if unknown or stale"""
+        cached = self._spender_allowance_cache.get(
+            self._spender_allowance_key(token_address, owner_address, spender_address)
+        )
+        if cached and time.monotonic() - cached[1] < self.spender_allowance_ttl:
+            return cached[0]
+        return None
+    
+    def _remember_allowance(self,
+                            token_address: str,
+                            owner_address: str,
+                            spender_address: str,
+                            allowance: Optional[int]) -> None:
+        """Record an observed on-chain allowance for a spender, or forget it when allowance is None
+
+        Only unlimited allowances are kept. A finite allowance is spent down by every
+        swap, so remembering it would let a later swap skip a needed approval.
+        """
+        key = self._spender_allowance_key(token_address, owner_address, spender_address)
+        if allowance is None or allowance < _UNLIMITED_ALLOWANCE:
+            self._spender_allowance_cache.pop(key, None)
+        else:
+            self._spender_allowance_cache[key] = (allowance, time.monotonic())
+    
+    def _get_web3(self, rpc_url: str = None) -> Optional[Web3]:
+        """Get a cached Web3 instance for the chain's RPC endpoint
+        
+        The provider keeps its HTTP connections alive through a dedicated
+        requests.Session. No connectivity probe is made; an unreachable node
+        surfaces as an error on the first real call.
+        
+        Args:
+            rpc_url: RPC URL to use (optional, defaults to env var for the chain)
             
-            # Make request to allowance endpoint
-            logger.info(f"Checking allowance for token {token_address}, account {owner_address}")
+        Returns:
+            Web3 instance or None if no RPC URL is configured
+        """
+        rpc_url = rpc_url or self._get_rpc_url()
+        if not rpc_url:
+            return None
+        
+        web3 = self._web3_cache.get(rpc_url)
+        if web3 is None:
+            web3 = Web3(Web3.HTTPProvider(
+                rpc_url,
+                request_kwargs={'timeout': 10},
+                session=requests.Session()
+            ))
+            self._web3_cache[rpc_url] = web3
+        return web3
+    
+    def _get_rpc_url(self) -> Optional[str]:
+        """Get the RPC URL configured for the current chain, or None if there is none"""
+        rpc_url = os.getenv(f"WEB3_RPC_URL_{self.chain_id}", os.getenv("WEB3_RPC_URL", ""))
+        if not rpc_url:
+            logger.error(f"No RPC URL configured for chain ID {self.chain_id}")
+            return None
+        return rpc_url
+    
+    async def _rpc_batch(self, calls: List[Tuple[str, List[Any]]]) -> Optional[List[Any]]:
+        """Send several JSON-RPC calls to the chain's node in a single batch request
+        
+        Args:
+            calls: List of (method, params) tuples
             
-            # Get the full response including code and data fields
+        Returns:
+            Results in call order (None for calls the node rejected), or None if
+            the batch request itself failed
+        """
+        rpc_url = self._get_rpc_url()
+        if not rpc_url:
+            return None
+        
+        payload = [
+            {'jsonrpc': '2.0', 'id': i, 'method': method, 'params': params}
+            for i, (method, params) in enumerate(calls)
+        ]
+        try:
             if not self._session:
-                logger.error("Connection not established. Call connect() first.")
-                return None
-                
-            url = f"{self.base_url}/{self.chain_name}/{endpoint}"
-            headers = {}
-            if self.use_pro_api and self.api_key:
-                headers['apikey'] = self.api_key
-                headers['Content-Type'] = 'application/json'
-            
-            try:
-                async with self._session.get(url, params=params, headers=headers) as response:
-                    if response.status != 200:
-                        logger.error(f"OpenOcean API allowance request failed with status {response.status}")
-                        return None
-                    
-                    full_response = await response.json()
-                    
-                    if full_response.get('code') != 200:
-                        logger.error(f"OpenOcean API returned error code: {full_response.get('code')}")
-                        return None
-                    
-                    # Extract the data field which contains the allowance information
-                    if 'data' in full_response and isinstance(full_response['data'], list) and len(full_response['data']) > 0:
-                        allowance_info = full_response['data'][0]
-                        logger.info(f"Allowance info for token {token_address}: {allowance_info}")
-                        return allowance_info
-                        
-                    # Default to zero allowance if we couldn't find data
-                    logger.warning(f"No allowance data found in response: {full_response}")
-                    return {"allowance": "0", "raw": "0"}
-                    
-            except Exception as e:
-                logger.error(f"Error making allowance API request: {str(e)}")
-                return None
-                
+                self._session = await get_session()
+            async with self._session.post(
+                rpc_url,
+                data=orjson.dumps(payload),
+                headers={'Content-Type': 'application/json'},
+                timeout=10
+            ) as response:
+                if response.status != 200:
+                    logger.error("RPC batch request failed with status %s", response.status)
+                    return None
+                replies = orjson.loads(await response.read())
         except Exception as e:
-            logger.error(f"Error checking token allowance via API: {str(e)}")
+            logger.error("RPC batch request failed: %s", e)
+            return None
+        
+        if not isinstance(replies, list):
+            logger.error("Unexpected RPC batch response: %s", replies)
             return None
+        
+        results: List[Any] = [None] * len(calls)
+        for reply in replies:
+            call_id = reply.get('id')
+            if isinstance(call_id, int) and 0 <= call_id < len(calls):
+                if 'error' in reply:
+                    logger.debug("RPC call %s failed: %s", calls[call_id][0], reply['error'])
+                else:
+                    results[call_id] = reply.get('result')
+        return results
+    
+    async def _get_pending_state(self,
+                                 owner_address: str,
+                                 token_address: str = None,
+                                 spender_address: str = None,
+                                 include_gas_price: bool = True) -> Tuple[Optional[int], Optional[int], Optional[int]]:
+        """Fetch gas price, pending nonce and (optionally) an ERC20 allowance in one RPC batch
+        
+        Args:
+            owner_address: Transaction sender / token owner address
+            token_address: Token to read the allowance of (optional)
+            spender_address: Spender to read the allowance for (required with token_address)
+            include_gas_price: Whether to fetch the legacy gas price
             
+        Returns:
+            Tuple of (gas_price, nonce, allowance); any value not requested or that
+            the node could not provide is None
+        """
+        owner_checksum = Web3.to_checksum_address(owner_address)
+        calls: List[Tuple[str, List[Any]]] = [
+            ('eth_getTransactionCount', [owner_checksum, 'pending']),
+            ('eth_gasPrice', []),
+        ]
+        if not include_gas_price:
+            calls.pop()
+        if token_address and spender_address:
+            calldata = ERC20_ALLOWANCE_SELECTOR + abi_encode(
+                ['address', 'address'],
+                [owner_checksum, Web3.to_checksum_address(spender_address)]
+            )
+            calls.append(('eth_call', [
+                {'to': Web3.to_checksum_address(token_address), 'data': '0x' + calldata.hex()},
+                'latest'
+            ]))
+        
+        results = await self._rpc_batch(calls)
+        if results is None:
+            results = [None] * len(calls)
+        
+        def to_int(value: Any) -> Optional[int]:
+            return int(value, 16) if isinstance(value, str) and value.startswith('0x') and len(value) > 2 else None
+        
+        nonce = to_int(results[0])
+        gas_price = to_int(results[1]) if include_gas_price else None
+        allowance = to_int(results[-1]) if token_address and spender_address else None
+        
+        # Fall back to individual calls for anything the batch did not return
+        if (include_gas_price and gas_price is None) or nonce is None:
+            web3 = self._get_web3()
+            if web3:
+                if include_gas_price and gas_price is None:
+                    gas_price = await asyncio.to_thread(lambda: web3.eth.gas_price)
+                if nonce is None:
+                    nonce = await asyncio.to_thread(web3.eth.get_transaction_count, owner_checksum, 'pending')
+        return gas_price, nonce, allowance
+    
+    async def _get_fees(self) -> Optional[Tuple[int, int]]:
+        """Get EIP-1559 fee parameters for the current chain from eth_feeHistory
+        
+        Fees are derived from the last 5 blocks (next base fee plus the median
+        priority fee paid) and reused for fee_ttl seconds, roughly one block.
+        
+        Returns:
+            Tuple of (max_fee_per_gas, max_priority_fee_per_gas), or None if the
+            fee history could not be fetched
+        """
+        cached = self._fee_cache.get(self.chain_id)
+        if cached and time.monotonic() - cached[2] < self.fee_ttl:
+            return cached[0], cached[1]
+        
+        results = await self._rpc_batch([('eth_feeHistory', [5, 'latest', [25, 50, 75]])])
+        history = results[0] if results else None
+        if not history or not history.get('baseFeePerGas'):
+            return None
+        
+        base_fee = int(history['baseFeePerGas'][-1], 16)
+        tips = sorted(int(reward[1], 16) for reward in history.get('reward') or [] if len(reward) > 1)
+        priority_fee = tips[len(tips) // 2] if tips else 10**9
+        max_fee = 2 * base_fee + priority_fee
+        self._fee_cache[self.chain_id] = (max_fee, priority_fee, time.monotonic())
+        return max_fee, priority_fee
+    
+    async def _get_fee_fields(self, gas_price: Optional[str] = None) -> Dict[str, int]:
+        """Get the fee fields for a transaction on the current chain
+        
+        Args:
+            gas_price: Explicit gas price in GWEI; forces a legacy gasPrice field
+            
+        Returns:
+            {'maxFeePerGas', 'maxPriorityFeePerGas'} on EIP-1559 chains, otherwise
+            {'gasPrice'}; empty if no fee data is available
+        """
+        if gas_price:
+            return {'gasPrice': Web3.to_wei(gas_price, 'gwei')}
+        if self.chain_id in _EIP1559_CHAINS:
+            fees = await self._get_fees()
+            if fees:
+                return {'maxFeePerGas': fees[0], 'maxPriorityFeePerGas': fees[1]}
+        return {}
+    
     async def check_token_allowance(self,
                                token_address: str,
                                owner_address: str,
@@ -545,30 +1002,17 @@ class OpenOceanConnection:
                 return int(allowance_info["raw"])
                 
             # Fall back to using web3 if direct API method fails
-            # Get RPC URL for the chain if not provided
-            if not rpc_url:
-                rpc_url = os.getenv(f"WEB3_RPC_URL_{self.chain_id}", os.getenv("WEB3_RPC_URL", ""))
-                if not rpc_url:
-                    logger.error(f"No RPC URL configured for chain ID {self.chain_id}")
-                    return None
-            
-            # Create Web3 instance
-            web3 = Web3(Web3.HTTPProvider(rpc_url))
-            if not web3.is_connected():
-                logger.error(f"Failed to connect to node at {rpc_url}")
+            web3 = self._get_web3(rpc_url)
+            if not web3:
                 return None
             
-            # Create token contract instance
-            token_contract = web3.eth.contract(
-                address=Web3.to_checksum_address(token_address), 
-                abi=ERC20_ABI
+            # Check allowance through Multicall3 so callers can batch many checks
+            (allowance,) = await self._multicall_allowances(
+                web3, [(token_address, owner_address, spender_address)]
             )
-            
-            # Check allowance
-            allowance = token_contract.functions.allowance(
-                Web3.to_checksum_address(owner_address),
-                Web3.to_checksum_address(spender_address)
-            ).call()
+            if allowance is None:
+                logger.error(f"Allowance call reverted for {token_address}")
+                return None
             
             logger.info(f"Current allowance for {token_address}: {allowance}")
             return allowance
@@ -577,6 +1021,69 @@ class OpenOceanConnection:
             logger.error(f"Error checking token allowance: {str(e)}")
             return None
     
+    async def _multicall_allowances(self,
+                                    web3: Web3,
+                                    pairs: List[Tuple[str, str, str]]) -> List[Optional[int]]:
+        """Read several ERC20 allowances in a single Multicall3 eth_call
+        
+        Args:
+            web3: Web3 instance to query
+            pairs: List of (token, owner, spender) address tuples
+            
+        Returns:
+            Allowance for each pair, in order (None where the call reverted)
+        """
+        calls = [
+            (
+                Web3.to_checksum_address(token),
+                True,
+                ERC20_ALLOWANCE_SELECTOR + abi_encode(
+                    ['address', 'address'],
+                    [Web3.to_checksum_address(owner), Web3.to_checksum_address(spender)]
+                )
+            )
+            for token, owner, spender in pairs
+        ]
+        calldata = MULTICALL3_AGGREGATE3_SELECTOR + abi_encode(['(address,bool,bytes)[]'], [calls])
+        raw = await asyncio.to_thread(web3.eth.call, {'to': MULTICALL3_ADDRESS, 'data': Web3.to_hex(calldata)})
+        (results,) = abi_decode(['(bool,bytes)[]'], raw)
+        return [
+            abi_decode(['uint256'], data)[0] if ok and len(data) >= 32 else None
+            for ok, data in results
+        ]
+    
+    def _approval_tx_template(self, token_address: str, spender_address: str, amount: int) -> Dict[str, Any]:
+        """Get the fixed fields of an approve transaction
+        
+        Templates for unlimited (max uint256) approvals are cached per token and
+        spender, so only the sender, nonce and fees vary per transaction.
+        
+        Args:
+            token_address: Token contract address
+            spender_address: Address of the spender (router contract)
+            amount: Approval amount
+            
+        Returns:
+            Transaction fields 'to', 'value', 'data', 'gas' and 'chainId' (do not mutate)
+        """
+        is_max = amount == 2**256 - 1
+        key = (self.chain_id, token_address.lower(), spender_address.lower())
+        if is_max:
+            template = self._approve_tx_template.get(key)
+            if template is not None:
+                return template
+        
+        template = {
+            'to': Web3.to_checksum_address(token_address),
+            'value': 0,
+            'data': '0x' + _encode_approve(spender_address, amount).hex(),
+            'gas': 60000,  # Standard gas limit for approve
+            'chainId': int(self.chain_id)
+        }
+        if is_max:
+            self._approve_tx_template[key] = template
+        return template
+    
     async def check_and_create_approval_transaction(self,
                                                swap_data: Dict[str, Any],
                                                owner_address: str,
@@ -636,24 +1143,10 @@ class OpenOceanConnection:
             logger.info(f"Allowance {current_allowance} is insufficient for amount {amount_needed_int}, approval needed")
             
             # Create approval transaction
-            # Get RPC URL for the chain
-            rpc_url = os.getenv(f"WEB3_RPC_URL_{self.chain_id}", os.getenv("WEB3_RPC_URL", ""))
-            if not rpc_url:
-                logger.error(f"No RPC URL configured for chain ID {self.chain_id}")
+            web3 = self._get_web3()
+            if not web3:
                 return True, None
             
-            # Create Web3 instance
-            web3 = Web3(Web3.HTTPProvider(rpc_url))
-            if not web3.is_connected():
-                logger.error(f"Failed to connect to node at {rpc_url}")
-                return True, None
-            
-            # Create token contract instance
-            token_contract = web3.eth.contract(
-                address=Web3.to_checksum_address(token_address), 
-                abi=ERC20_ABI
-            )
-            
             # Determine approval amount
             if amount_to_approve == "max":
                 # Max uint256 value for unlimited approval
@@ -661,17 +1154,20 @@ class OpenOceanConnection:
             else:
                 approval_amount = int(amount_to_approve)
             
+            # Fetch nonce and gas price concurrently, off the event loop
+            owner_checksum = Web3.to_checksum_address(owner_address)
+            nonce, gas_price = await asyncio.gather(
+                asyncio.to_thread(web3.eth.get_transaction_count, owner_checksum),
+                asyncio.to_thread(lambda: web3.eth.gas_price)
+            )
+            
             # Create approval transaction
-            approval_data = token_contract.functions.approve(
-                Web3.to_checksum_address(router_address),
-                approval_amount
-            ).build_transaction({
-                'from': Web3.to_checksum_address(owner_address),
-                'nonce': web3.eth.get_transaction_count(Web3.to_checksum_address(owner_address)),
-                'gas': 60000,  # Standard gas limit for approve
-                'gasPrice': web3.eth.gas_price,
-                'chainId': int(self.chain_id)
-            })
+            approval_data = {
+                **self._approval_tx_template(token_address, router_address, approval_amount),
+                'from': owner_checksum,
+                'nonce': nonce,
+                'gasPrice': gas_price
+            }
             
             return True, approval_data
             
@@ -682,44 +1178,37 @@ class OpenOceanConnection:
     async def execute_approval_transaction(self,
                                        token_address: str,
                                        spender_address: str,
-                                       private_key: str,
+                                       private_key: str = None,
                                        amount: str = "max",
-                                       gas_price: str = None) -> Optional[Dict[str, Any]]:
+                                       gas_price: str = None,
+                                       account: LocalAccount = None,
+                                       wait_for_receipt: bool = True) -> Optional[Dict[str, Any]]:
         """Execute a token approval transaction
         
         Args:
             token_address: Token contract address
             spender_address: Address of the spender (router contract)
-            private_key: Private key for signing transaction
+            private_key: Private key for signing transaction (ignored if account is given)
             amount: Amount to approve ("max" for unlimited approval, or a specific amount)
             gas_price: Gas price in GWEI (without decimals)
+            account: Already-derived signing account
+            wait_for_receipt: Wait for the transaction to be mined. When False the
+                result has no 'success'/'gas_used' yet; poll 'tx_hash' with _poll_receipt
             
         Returns:
-            Transaction data or None if the approval failed
+            Transaction data (including the 'nonce' used) or None if the approval failed
         """
         try:
-            # Get RPC URL for the chain
-            rpc_url = os.getenv(f"WEB3_RPC_URL_{self.chain_id}", os.getenv("WEB3_RPC_URL", ""))
-            if not rpc_url:
-                logger.error(f"No RPC URL configured for chain ID {self.chain_id}")
+            # Reuse the pooled Web3 client for the chain
+            web3 = self._get_web3()
+            if not web3:
                 return None
             
-            # Create Web3 instance
-            web3 = Web3(Web3.HTTPProvider(rpc_url))
-            if not web3.is_connected():
-                logger.error(f"Failed to connect to node at {rpc_url}")
-                return None
-            
-            # Create account from private key
-            account = web3.eth.account.from_key(private_key)
+            # Derive the signing account only if the caller didn't provide one
+            if account is None:
+                account = web3.eth.account.from_key(private_key)
             owner_address = account.address
             
-            # Create token contract instance
-            token_contract = web3.eth.contract(
-                address=Web3.to_checksum_address(token_address), 
-                abi=ERC20_ABI
-            )
-            
             # Determine approval amount
             if amount == "max":
                 # Max uint256 value for unlimited approval
@@ -727,42 +1216,54 @@ class OpenOceanConnection:
             else:
                 approval_amount = int(amount)
             
-            # Determine gas price
-            gas_price_wei = None
-            if gas_price:
-                gas_price_wei = web3.to_wei(gas_price, 'gwei')
-            else:
-                gas_price_wei = web3.eth.gas_price
+            # Fetch fee data and nonce (plus the legacy gas price on non-EIP-1559 chains) concurrently
+            fee_fields, (network_gas_price, nonce, _) = await asyncio.gather(
+                self._get_fee_fields(gas_price),
+                self._get_pending_state(
+                    owner_address,
+                    include_gas_price=not gas_price and self.chain_id not in _EIP1559_CHAINS
+                )
+            )
+            
+            # Fall back to the legacy gas price if no fee data is available
+            if not fee_fields:
+                if network_gas_price is None:
+                    network_gas_price = await asyncio.to_thread(lambda: web3.eth.gas_price)
+                fee_fields = {'gasPrice': network_gas_price}
             
             # Create approval transaction
-            tx = token_contract.functions.approve(
-                Web3.to_checksum_address(spender_address),
-                approval_amount
-            ).build_transaction({
+            tx = {
+                **self._approval_tx_template(token_address, spender_address, approval_amount),
                 'from': Web3.to_checksum_address(owner_address),
-                'nonce': web3.eth.get_transaction_count(Web3.to_checksum_address(owner_address)),
-                'gas': 60000,  # Standard gas limit for approve
-                'gasPrice': gas_price_wei,
-                'chainId': int(self.chain_id)
-            })
+                'nonce': nonce,
+                **fee_fields
+            }
             
             # Sign and send transaction
-            signed_tx = account.sign_transaction(tx)
-            tx_hash = web3.eth.send_raw_transaction(signed_tx.rawTransaction)
-            
-            # Wait for transaction receipt
-            receipt = web3.eth.wait_for_transaction_receipt(tx_hash)
+            signed_tx = await asyncio.to_thread(account.sign_transaction, tx)
+            try:
+                tx_hash = await asyncio.to_thread(web3.eth.send_raw_transaction, signed_tx.rawTransaction)
+            except Exception:
+                self._remember_allowance(token_address, owner_address, spender_address, None)
+                raise
+            self.invalidate_allowance(token_address, owner_address)
             
             result = {
-                'success': receipt['status'] == 1,
                 'tx_hash': web3.to_hex(tx_hash),
                 'explorer_url': self._get_explorer_url(web3.to_hex(tx_hash)),
-                'gas_used': receipt['gasUsed'],
                 'token_address': token_address,
                 'spender_address': spender_address,
-                'approval_amount': str(approval_amount)
+                'approval_amount': str(approval_amount),
+                'nonce': nonce
             }
             
+            if wait_for_receipt:
+                receipt = await self._poll_receipt(web3, tx_hash)
+                result['success'] = receipt['status'] == 1
+                result['gas_used'] = receipt['gasUsed']
+                if result['success']:
+                    self._remember_allowance(token_address, owner_address, spender_address, approval_amount)
+            
             return result
         
         except Exception as e:
@@ -773,40 +1274,43 @@ class OpenOceanConnection:
                          in_token_address: str,
                          out_token_address: str,
                          amount: str,
-                         private_key: str,
+                         private_key: str = None,
                          slippage: float = None,
                          gas_price: str = None,
                          referrer: str = None,
                          referrer_fee: float = None,
                          check_allowance: bool = True,
-                         auto_approve: bool = True) -> Optional[Dict[str, Any]]:
+                         auto_approve: bool = True,
+                         account: LocalAccount = None) -> Optional[Dict[str, Any]]:
         """Execute a token swap using the OpenOcean API
         
         Args:
             in_token_address: Input token address
             out_token_address: Output token address
             amount: Token amount (without decimals)
-            private_key: Private key for signing transaction
+            private_key: Private key for signing transaction (ignored if account is given)
             slippage: Slippage percentage (0.05-50)
             gas_price: Gas price in GWEI (without decimals)
             referrer: Referrer address for fee sharing
             referrer_fee: Referrer fee percentage (0.01-3)
             check_allowance: Whether to check if token approval is needed
             auto_approve: Whether to automatically execute approval transaction if needed
+            account: Already-derived signing account
             
         Returns:
             Transaction data or None if the swap failed
         """
-        # Create Web3 instance for the chain
-        rpc_url = os.getenv(f"WEB3_RPC_URL_{self.chain_id}", os.getenv("WEB3_RPC_URL", ""))
-        if not rpc_url:
-            logger.error(f"No RPC URL configured for chain ID {self.chain_id}")
+        # Reuse the pooled Web3 client for the chain
+        web3 = self._get_web3()
+        if not web3:
             return None
         
-        web3 = Web3(Web3.HTTPProvider(rpc_url))
-        
-        # Get account from private key
-        account = web3.eth.account.from_key(private_key)
+        # Derive the signing account only if the caller didn't provide one
+        if account is None:
+            if not private_key:
+                logger.error("Either an account or a private key is required to execute a swap")
+                return None
+            account = web3.eth.account.from_key(private_key)
         user_address = account.address
         
         try:
@@ -826,8 +1330,40 @@ class OpenOceanConnection:
                 logger.error("Failed to get swap transaction data")
                 return None
             
+            swap_in_token = swap_data.get("inToken", {}).get("address", "")
+            router_address = swap_data.get("to", "")
+            amount_needed = int(swap_data.get("inAmount", "0"))
+            
+            # Skip the allowance check entirely if we recently saw enough allowance
+            if check_allowance:
+                known_allowance = self._get_known_allowance(swap_in_token, user_address, router_address)
+                if known_allowance is not None and known_allowance >= amount_needed:
+                    logger.info("Known allowance %s covers swap amount", known_allowance)
+                    check_allowance = False
+            
+            # Fetch nonce and current allowance for the router in a single RPC batch,
+            # alongside EIP-1559 fees when no explicit gas price was requested
+            fee_fields, (_, nonce, batched_allowance) = await asyncio.gather(
+                self._get_fee_fields() if not gas_price else asyncio.sleep(0, {}),
+                self._get_pending_state(
+                    user_address,
+                    token_address=swap_in_token if check_allowance else None,
+                    spender_address=router_address if check_allowance else None,
+                    include_gas_price=False
+                )
+            )
+            if not fee_fields:
+                # Use the gas price the swap was quoted with
+                fee_fields = {'gasPrice': int(swap_data['gasPrice'])}
+            if check_allowance and batched_allowance is not None:
+                self._remember_allowance(swap_in_token, user_address, router_address, batched_allowance)
+                if batched_allowance >= amount_needed:
+                    logger.info("Allowance %s already covers swap amount", batched_allowance)
+                    check_allowance = False
+            
             # Check if token approval is needed
             approval_result = None
+            batch_router = None
             if check_allowance:
                 needs_approval, approval_tx = await self.check_and_create_approval_transaction(
                     swap_data=swap_data,
@@ -847,27 +1383,32 @@ class OpenOceanConnection:
                             logger.error("Input token address not found in swap data")
                             return None
                         
-                        # Execute approval transaction
-                        approval_result = await self.execute_approval_transaction(
-                            token_address=token_address,
-                            spender_address=swap_data.get("to", ""),
-                            private_key=private_key,
-                            amount="max",
-                            gas_price=gas_price
-                        )
-                        
-                        if not approval_result or not approval_result.get("success"):
-                            logger.error("Token approval failed")
-                            return {
-                                'success': False,
-                                'error': 'Token approval failed',
-                                'approval_result': approval_result
-                            }
-                        
-                        logger.info(f"Token approval successful: {approval_result.get('tx_hash')}")
-                        
-                        # Wait a short time for approval to be recognized
-                        await asyncio.sleep(2)
+                        batch_router = self._batch_router.get(self.chain_id)
+                        if batch_router:
+                            # Approval and swap are sent together as one batch transaction below
+                            logger.info("Batching token approval with the swap via %s", batch_router)
+                        else:
+                            # Send the approval without waiting; the swap follows it with
+                            # the next nonce and both receipts are awaited together
+                            approval_result = await self.execute_approval_transaction(
+                                token_address=token_address,
+                                spender_address=swap_data.get("to", ""),
+                                amount="max",
+                                gas_price=gas_price,
+                                account=account,
+                                wait_for_receipt=False
+                            )
+                            
+                            if not approval_result:
+                                logger.error("Token approval failed")
+                                return {
+                                    'success': False,
+                                    'error': 'Token approval failed',
+                                    'approval_result': approval_result
+                                }
+                            
+                            logger.info(f"Token approval sent: {approval_result.get('tx_hash')}")
+                            nonce = approval_result['nonce'] + 1
                     elif not auto_approve:
                         logger.warning("Token approval needed but auto_approve is disabled")
                         return {
@@ -889,18 +1430,55 @@ class OpenOceanConnection:
                 'to': swap_data['to'],
                 'value': int(swap_data['value']),
                 'gas': int(swap_data['estimatedGas'] * 1.2),  # Add 20% buffer to gas estimate
-                'gasPrice': int(swap_data['gasPrice']),
-                'nonce': web3.eth.get_transaction_count(user_address),
+                'nonce': nonce,
                 'data': swap_data['data'],
-                'chainId': int(self.chain_id)
+                'chainId': int(self.chain_id),
+                **fee_fields
             }
             
+            if batch_router:
+                # Wrap approve + swap in a single atomic batchAll call
+                approval_amount = 2**256 - 1
+                batch_calldata = _encode_batch_all(
+                    [swap_in_token, router_address],
+                    [0, tx['value']],
+                    [_encode_approve(router_address, approval_amount), bytes.fromhex(swap_data['data'][2:])]
+                )
+                tx['to'] = Web3.to_checksum_address(batch_router)
+                tx['data'] = '0x' + batch_calldata.hex()
+                tx['gas'] += 60000  # Standard gas limit for approve
+            
             # Sign and send transaction
-            signed_tx = account.sign_transaction(tx)
-            tx_hash = web3.eth.send_raw_transaction(signed_tx.rawTransaction)
+            signed_tx = await asyncio.to_thread(account.sign_transaction, tx)
+            tx_hash = await asyncio.to_thread(web3.eth.send_raw_transaction, signed_tx.rawTransaction)
             
-            # Wait for transaction receipt
-            receipt = web3.eth.wait_for_transaction_receipt(tx_hash)
+            # Wait for the swap (and any approval sent just before it) to be mined
+            if approval_result:
+                approval_receipt, receipt = await asyncio.gather(
+                    self._poll_receipt(web3, approval_result['tx_hash']),
+                    self._poll_receipt(web3, tx_hash)
+                )
+                approval_result['success'] = approval_receipt['status'] == 1
+                approval_result['gas_used'] = approval_receipt['gasUsed']
+                if approval_result['success']:
+                    self._remember_allowance(
+                        approval_result['token_address'],
+                        user_address,
+                        approval_result['spender_address'],
+                        int(approval_result['approval_amount'])
+                    )
+                else:
+                    logger.error("Token approval failed")
+            else:
+                receipt = await self._poll_receipt(web3, tx_hash)
+                if batch_router:
+                    approval_result = {
+                        'success': receipt['status'] == 1,
+                        'tx_hash': web3.to_hex(tx_hash),
+                        'explorer_url': self._get_explorer_url(web3.to_hex(tx_hash))
+                    }
+                    if approval_result['success']:
+                        self._remember_allowance(swap_in_token, user_address, router_address, approval_amount)
             
             result = {
                 'success': receipt['status'] == 1,
@@ -914,7 +1492,7 @@ class OpenOceanConnection:
                 'price_impact': swap_data.get('price_impact', 'N/A')
             }
             
-            # Include approval result if an approval was executed
+            # Include approval result if an approval was executed (same tx when batched)
             if approval_result:
                 result['approval'] = {
                     'success': approval_result['success'],
@@ -928,6 +1506,38 @@ class OpenOceanConnection:
             logger.error(f"Error executing swap: {str(e)}")
             return None
     
+    async def _poll_receipt(self, web3: Web3, tx_hash: Any, interval: float = 0.5, timeout: float = 120) -> Dict[str, Any]:
+        """Poll for a transaction receipt without blocking the event loop
+        
+        With a WebSocket URL configured, each poll also returns as soon as the
+        next block header arrives, so a receipt is fetched right after the block
+        that may contain it; interval still bounds the wait if no header comes.
+        
+        Args:
+            web3: Web3 instance to query
+            tx_hash: Transaction hash
+            interval: Maximum seconds between polls
+            timeout: Seconds to wait before giving up
+            
+        Returns:
+            Transaction receipt
+            
+        Raises:
+            asyncio.TimeoutError: If the transaction is not mined within timeout
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                return await asyncio.to_thread(web3.eth.get_transaction_receipt, tx_hash)
+            except TransactionNotFound:
+                if time.monotonic() >= deadline:
+                    raise asyncio.TimeoutError(f"Transaction not mined after {timeout}s")
+                if self._heads:
+                    self._heads.start()
+                    await self._heads.wait_for_head(interval)
+                else:
+                    await asyncio.sleep(interval)
+    
     def _get_explorer_url(self, tx_hash: str) -> str:
         """Get explorer URL for transaction
         
@@ -937,19 +1547,8 @@ class OpenOceanConnection:
         Returns:
             Explorer URL for the transaction
         """
-        explorer_map = {
-            '1': f"https://etherscan.io/tx/{tx_hash}",
-            '56': f"https://bscscan.com/tx/{tx_hash}",
-            '137': f"https://polygonscan.com/tx/{tx_hash}",
-            '42161': f"https://arbiscan.io/tx/{tx_hash}",
-            '10': f"https://optimistic.etherscan.io/tx/{tx_hash}",
-            '43114': f"https://snowtrace.io/tx/{tx_hash}",
-            '250': f"https://ftmscan.com/tx/{tx_hash}",
-            '146': f"https://explorer.sonic.ooo/tx/{tx_hash}",
-            # Add more chains as needed
-        }
-        
-        return explorer_map.get(self.chain_id, f"https://etherscan.io/tx/{tx_hash}")
+        base = _EXPLORER_BASE.get(self.chain_id, 'https://etherscan.io')
+        return f"{base}/tx/{tx_hash}"
     
     # Cross-chain functionality
     
@@ -973,22 +1572,11 @@ class OpenOceanConnection:
         Returns:
             Cross-chain quote data or None if the request failed
         """
-        # Store original chain ID
-        original_chain_id = self.chain_id
-        
-        # We need to use the source chain for the API request
-        if from_chain_id != self.chain_id:
-            logger.info(f"Switching from chain {self.chain_id} to {from_chain_id} for cross-chain quote")
-            self.chain_id = from_chain_id
-            self.chain_name = self._get_chain_name(from_chain_id)
-        
+        # The source chain is passed in the request params; instance chain state is
+        # left untouched so concurrent quotes for different chains don't interfere
         try:
             url = f"{self.base_url}/v1/cross_chain/cross/quote"
-            headers = {}
-            
-            if self.use_pro_api and self.api_key:
-                headers['apikey'] = self.api_key
-                headers['Content-Type'] = 'application/json'
+            headers = self._headers
             
             params = {
                 'account': wallet_address,
@@ -997,28 +1585,25 @@ class OpenOceanConnection:
                 'fromTokenAddress': from_token_address,
                 'toTokenAddress': to_token_address,
                 'amount': amount,
-                'slippage': str(self.slippage)
+                'slippage': self._slippage_str
             }
             
-            logger.info(f"Making cross-chain quote request to: {url}")
-            logger.info(f"Request parameters: {json.dumps(params, indent=2)}")
+            logger.info("Making cross-chain quote request to: %s", url)
+            logger.info("Request parameters: %s", _dump_for_log(params))
             
             # Apply rate limiting
-            now = time.time()
-            if now - self._last_request < self.min_interval:
-                await asyncio.sleep(self.min_interval - (now - self._last_request))
-            self._last_request = time.time()
+            await self._rate_limit()
             
             async with self._session.get(url, params=params, headers=headers) as response:
                 if response.status != 200:
-                    logger.error(f"OpenOcean cross-chain quote request failed with status {response.status}")
+                    logger.error("OpenOcean cross-chain quote request failed with status %s", response.status)
                     return None
                 
-                full_response = await response.json()
-                logger.info(f"OpenOcean cross-chain quote response (truncated): {json.dumps(full_response)[:200]}...")
+                full_response = orjson.loads(await response.read())
+                logger.info("OpenOcean cross-chain quote response (truncated): %s...", _dump_for_log(full_response, limit=200, indent=False))
                 
                 if full_response.get('code') != 200:
-                    logger.error(f"OpenOcean API returned error code: {full_response.get('code')}")
+                    logger.error("OpenOcean API returned error code: %s", full_response.get('code'))
                     return None
                 
                 # Extract the data field which contains the quote information
@@ -1026,19 +1611,12 @@ class OpenOceanConnection:
                     quote_data = full_response['data']
                     return quote_data
                 else:
-                    logger.warning(f"No cross-chain quote data found in response!")
+                    logger.warning("No cross-chain quote data found in response!")
                     return None
         
         except Exception as e:
-            logger.error(f"Error making cross-chain quote request: {str(e)}")
+            logger.error("Error making cross-chain quote request: %s", e)
             return None
-        
-        finally:
-            # Restore original chain ID
-            if original_chain_id != self.chain_id:
-                logger.info(f"Restoring chain ID from {self.chain_id} to {original_chain_id}")
-                self.chain_id = original_chain_id
-                self.chain_name = self._get_chain_name(original_chain_id)
     
     async def get_cross_chain_swap_transaction(self,
                                         account: str,
@@ -1054,11 +1632,7 @@ class OpenOceanConnection:
         """
         try:
             url = f"{self.base_url}/v1/cross_chain/cross/swap"
-            headers = {}
-            
-            if self.use_pro_api and self.api_key:
-                headers['apikey'] = self.api_key
-                headers['Content-Type'] = 'application/json'
+            headers = self._headers
             
             # Prepare the request body
             data = {
@@ -1066,30 +1640,27 @@ class OpenOceanConnection:
                 'route': route
             }
             
-            logger.info(f"Making cross-chain swap request to: {url}")
-            logger.info(f"Request data: {json.dumps(data, indent=2)}")
+            logger.info("Making cross-chain swap request to: %s", url)
+            logger.info("Request data: %s", _dump_for_log(data))
             
             # Apply rate limiting
-            now = time.time()
-            if now - self._last_request < self.min_interval:
-                await asyncio.sleep(self.min_interval - (now - self._last_request))
-            self._last_request = time.time()
+            await self._rate_limit()
             
             async with self._session.post(url, json=data, headers=headers) as response:
                 if response.status != 201 and response.status != 200:
-                    logger.error(f"OpenOcean cross-chain swap request failed with status {response.status}")
+                    logger.error("OpenOcean cross-chain swap request failed with status %s", response.status)
                     try:
                         error_text = await response.text()
-                        logger.error(f"Error response: {error_text}")
+                        logger.error("Error response: %s", error_text)
                     except:
                         pass
                     return None
                 
-                full_response = await response.json()
-                logger.info(f"OpenOcean cross-chain swap response (truncated): {json.dumps(full_response)[:200]}...")
+                full_response = orjson.loads(await response.read())
+                logger.info("OpenOcean cross-chain swap response (truncated): %s...", _dump_for_log(full_response, limit=200, indent=False))
                 
                 if full_response.get('code') != 200:
-                    logger.error(f"OpenOcean API returned error code: {full_response.get('code')}")
+                    logger.error("OpenOcean API returned error code: %s", full_response.get('code'))
                     return None
                 
                 # Extract the data field which contains the transaction information
@@ -1097,11 +1668,11 @@ class OpenOceanConnection:
                     tx_data = full_response['data']
                     return tx_data
                 else:
-                    logger.warning(f"No cross-chain swap transaction data found in response!")
+                    logger.warning("No cross-chain swap transaction data found in response!")
                     return None
         
         except Exception as e:
-            logger.error(f"Error making cross-chain swap request: {str(e)}")
+            logger.error("Error making cross-chain swap request: %s", e)
             return None
     
     async def get_cross_chain_status(self, tx_hash: str, from_chain_id: str) -> Optional[Dict[str, Any]]:
@@ -1116,34 +1687,27 @@ class OpenOceanConnection:
         """
         try:
             url = f"{self.base_url}/v1/cross_chain/cross/getCrossStatus"
-            headers = {}
-            
-            if self.use_pro_api and self.api_key:
-                headers['apikey'] = self.api_key
-                headers['Content-Type'] = 'application/json'
+            headers = self._headers
             
             params = {
                 'hash': tx_hash,
                 'fromChainId': from_chain_id
             }
             
-            logger.info(f"Checking cross-chain status for tx {tx_hash}")
+            logger.info("Checking cross-chain status for tx %s", tx_hash)
             
             # Apply rate limiting
-            now = time.time()
-            if now - self._last_request < self.min_interval:
-                await asyncio.sleep(self.min_interval - (now - self._last_request))
-            self._last_request = time.time()
+            await self._rate_limit()
             
             async with self._session.get(url, params=params, headers=headers) as response:
                 if response.status != 200:
-                    logger.error(f"OpenOcean cross-chain status request failed with status {response.status}")
+                    logger.error("OpenOcean cross-chain status request failed with status %s", response.status)
                     return None
                 
-                full_response = await response.json()
+                full_response = orjson.loads(await response.read())
                 
                 if full_response.get('code') != 200:
-                    logger.error(f"OpenOcean API returned error code: {full_response.get('code')}")
+                    logger.error("OpenOcean API returned error code: %s", full_response.get('code'))
                     return None
                 
                 # Extract the data field which contains the status information
@@ -1151,11 +1715,11 @@ class OpenOceanConnection:
                     status_data = full_response['data']
                     return status_data
                 else:
-                    logger.warning(f"No cross-chain status data found in response!")
+                    logger.warning("No cross-chain status data found in response!")
                     return None
         
         except Exception as e:
-            logger.error(f"Error checking cross-chain status: {str(e)}")
+            logger.error("Error checking cross-chain status: %s", e)
             return None
     
     # DCA functionality
@@ -1184,14 +1748,7 @@ class OpenOceanConnection:
         """
         try:
             url = f"{self.base_url}/v1/{self.chain_name}/dca/swap"
-            headers = {}
-            
-            if self.use_pro_api and self.api_key:
-                headers['apikey'] = self.api_key
-                headers['Content-Type'] = 'application/json'
-            
-            # Calculate the amount per order
-            per_order_amount = str(int(float(total_amount) / num_orders))
+            headers = self._headers
             
             # Prepare the request (note: this is a simplified version, 
             # in a real implementation you would need detailed order parameters)
@@ -1207,30 +1764,27 @@ class OpenOceanConnection:
                 }
             }
             
-            logger.info(f"Creating DCA order request to: {url}")
-            logger.info(f"Request data: {json.dumps(data, indent=2)}")
+            logger.info("Creating DCA order request to: %s", url)
+            logger.info("Request data: %s", _dump_for_log(data))
             
             # Apply rate limiting
-            now = time.time()
-            if now - self._last_request < self.min_interval:
-                await asyncio.sleep(self.min_interval - (now - self._last_request))
-            self._last_request = time.time()
+            await self._rate_limit()
             
             async with self._session.post(url, json=data, headers=headers) as response:
                 if response.status != 201 and response.status != 200:
-                    logger.error(f"OpenOcean DCA order request failed with status {response.status}")
+                    logger.error("OpenOcean DCA order request failed with status %s", response.status)
                     try:
                         error_text = await response.text()
-                        logger.error(f"Error response: {error_text}")
+                        logger.error("Error response: %s", error_text)
                     except:
                         pass
                     return None
                 
-                full_response = await response.json()
-                logger.info(f"OpenOcean DCA order response: {json.dumps(full_response)}")
+                full_response = orjson.loads(await response.read())
+                logger.info("OpenOcean DCA order response: %s", _dump_for_log(full_response, indent=False))
                 
                 if full_response.get('code') != 200:
-                    logger.error(f"OpenOcean API returned error code: {full_response.get('code')}")
+                    logger.error("OpenOcean API returned error code: %s", full_response.get('code'))
                     return None
                 
                 # Extract the data field which contains the transaction information
@@ -1238,11 +1792,11 @@ class OpenOceanConnection:
                     order_data = full_response['data']
                     return order_data
                 else:
-                    logger.warning(f"No DCA order data found in response!")
+                    logger.warning("No DCA order data found in response!")
                     return None
         
         except Exception as e:
-            logger.error(f"Error creating DCA order: {str(e)}")
+            logger.error("Error creating DCA order: %s", e)
             return None
     
     async def get_dca_orders(self, wallet_address: str) -> Optional[List[Dict[str, Any]]]:
@@ -1256,29 +1810,22 @@ class OpenOceanConnection:
         """
         try:
             url = f"{self.base_url}/v1/limit-order/{self.chain_name}/address/{wallet_address}"
-            headers = {}
+            headers = self._headers
             
-            if self.use_pro_api and self.api_key:
-                headers['apikey'] = self.api_key
-                headers['Content-Type'] = 'application/json'
-            
-            logger.info(f"Getting DCA orders for address {wallet_address}")
+            logger.info("Getting DCA orders for address %s", wallet_address)
             
             # Apply rate limiting
-            now = time.time()
-            if now - self._last_request < self.min_interval:
-                await asyncio.sleep(self.min_interval - (now - self._last_request))
-            self._last_request = time.time()
+            await self._rate_limit()
             
             async with self._session.get(url, headers=headers) as response:
                 if response.status != 200:
-                    logger.error(f"OpenOcean DCA orders request failed with status {response.status}")
+                    logger.error("OpenOcean DCA orders request failed with status %s", response.status)
                     return None
                 
-                full_response = await response.json()
+                full_response = orjson.loads(await response.read())
                 
                 if full_response.get('code') != 200:
-                    logger.error(f"OpenOcean API returned error code: {full_response.get('code')}")
+                    logger.error("OpenOcean API returned error code: %s", full_response.get('code'))
                     return None
                 
                 # Extract the data field which contains the orders information
@@ -1286,9 +1833,29 @@ class OpenOceanConnection:
                     orders = full_response['data']
                     return orders
                 else:
-                    logger.warning(f"No DCA orders found in response!")
+                    logger.warning("No DCA orders found in response!")
                     return []
         
         except Exception as e:
-            logger.error(f"Error getting DCA orders: {str(e)}")
-            return None
\ No newline at end of file
+            logger.error("Error getting DCA orders: %s", e)
+            return None
+    
+    async def get_dca_orders_many(self, wallet_addresses: List[str]) -> Dict[str, Optional[List[Dict[str, Any]]]]:
+        """Get DCA orders for several wallet addresses concurrently
+        
+        Requests run in parallel, bounded by the shared request concurrency limit
+        and still spaced by the rate limiter.
+        
+        Args:
+            wallet_addresses: Wallet addresses to check orders for
+            
+        Returns:
+            Mapping of wallet address to its list of DCA orders (None where the request failed)
+        """
+        concurrency = self._get_concurrency()
+        
+        async def fetch(wallet_address: str) -> Tuple[str, Optional[List[Dict[str, Any]]]]:
+            async with concurrency:
+                return wallet_address, await self.get_dca_orders(wallet_address)
+        
+        return dict(await asyncio.gather(*(fetch(wallet) for wallet in wallet_addresses)))
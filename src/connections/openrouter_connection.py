@@ -3,10 +3,16 @@ import os
 import logging
 import traceback
 import asyncio
-import atexit
-from typing import Dict, Any, Optional
-import aiohttp
+import random
+import weakref
+from typing import AsyncIterator, Dict, Any, List, Optional
+import httpx
+import orjson
+from dotenv import load_dotenv
 from .base_connection import BaseConnection, Action, Parameter
+from ._http import iter_chat_stream
+from .llm_batcher import LLMAutoBatcher
+from .llm_cache import DEFAULT_DISK_CACHE_PATH, DiskLLMCache, LLMCache
 import sys
 
 # Setup logging immediately
@@ -17,24 +23,129 @@ if not logger.handlers:
     logger.addHandler(handler)
     logger.setLevel(logging.INFO)
 
+try:
+    import h2  # noqa: F401  (enables HTTP/2 in httpx)
+    _HTTP2 = True
+except ImportError:
+    _HTTP2 = False
+
+try:
+    import msgspec
+
+    class _Message(msgspec.Struct):
+        content: str
+
+    class _Choice(msgspec.Struct):
+        message: _Message
+
+    class _ChatCompletion(msgspec.Struct):
+        choices: List[_Choice]
+
+    _COMPLETION_DECODER = msgspec.json.Decoder(_ChatCompletion)
+    _PARSE_ERRORS: tuple = (IndexError, msgspec.DecodeError)
+except ImportError:
+    _COMPLETION_DECODER = None
+    _PARSE_ERRORS = (KeyError, IndexError, TypeError, ValueError)
+
+
+# aclose() tasks scheduled by finalizers, kept referenced until they finish
+_CLOSING_CLIENTS: set = set()
+
+
+def _close_abandoned_client(client: httpx.AsyncClient, loop: asyncio.AbstractEventLoop) -> None:
+    """Finalizer for a connection collected without close(): close its client on its loop"""
+    if client.is_closed or loop.is_closed():
+        return
+
+    def schedule() -> None:
+        task = loop.create_task(client.aclose())
+        _CLOSING_CLIENTS.add(task)
+        task.add_done_callback(_CLOSING_CLIENTS.discard)
+
+    try:
+        loop.call_soon_threadsafe(schedule)
+    except RuntimeError:
+        # Loop closed in the meantime; its sockets go with the process
+        pass
+
+
+def _completion_contents(body: bytes) -> List[str]:
+    """Return the message content of each choice in a chat completion response body
+
+    Decodes straight into typed structs when msgspec is installed, skipping the
+    intermediate dicts; otherwise parses with orjson.
+    """
+    if _COMPLETION_DECODER is not None:
+        return [choice.message.content for choice in _COMPLETION_DECODER.decode(body).choices]
+    return [choice["message"]["content"] for choice in orjson.loads(body)["choices"]]
+
+
+class AuthError(Exception):
+    """Request rejected for credentials or billing; retrying won't help"""
+
+
+class RateLimitError(Exception):
+    """Request rejected with HTTP 429"""
+
+
+class OpenRouterAPIError(Exception):
+    """Unexpected non-200 response from the API"""
+
+
+# Failures _complete retries with backoff
+_RETRYABLE_ERRORS = (httpx.TransportError, RateLimitError, OpenRouterAPIError)
+
+# Completions for deterministic requests, shared across connection instances
+_RESPONSE_CACHE = LLMCache(maxsize=1024, ttl=3600)
+# Pending cacheable requests, so identical concurrent prompts share one API call
+_IN_FLIGHT: Dict[str, "asyncio.Future[Dict[str, Any]]"] = {}
+
+_ERROR_REPLY = "I encountered an error while processing your request. Please try again."
+
+
 class OpenRouterConnection(BaseConnection):
     """Connection for OpenRouter API integration"""
 
     def __init__(self, config: Dict[str, Any]):
-        """Initialize OpenRouter connection"""
+        """Initialize OpenRouter connection
+
+        Args:
+            config: Connection settings:
+                - api_key: OpenRouter key (defaults to OPENROUTER_API_KEY)
+                - model: Model name (defaults to anthropic/claude-3-sonnet)
+                - max_tokens: Completion length limit for chat/streaming (defaults to 4096)
+                - text_max_tokens: Completion length limit for generate_text (defaults to 300)
+                - disk_cache: SQLite cache path, or True for the default location
+        """
         try:
-            super().__init__(config)
-            self.api_key = os.getenv("OPENROUTER_API_KEY")  # Only use OpenRouter key
+            load_dotenv()
+            self.api_key = config.get('api_key') or os.getenv("OPENROUTER_API_KEY")
             self.base_url = "https://openrouter.ai/api/v1"  # OpenRouter base URL
-            self.model = "anthropic/claude-3-sonnet"  # Full model name for OpenRouter
-            self.session: Optional[aiohttp.ClientSession] = None
-            self.connect_timeout = aiohttp.ClientTimeout(total=10)  # 10 second timeout for connection
-            self.request_timeout = aiohttp.ClientTimeout(total=300)  # 5 minute timeout for requests
+            self.model = config.get('model', "anthropic/claude-3-sonnet")  # Full model name for OpenRouter
+            self.max_tokens = config.get('max_tokens', 4096)
+            # generate_text has always asked for short completions
+            self.text_max_tokens = config.get('text_max_tokens', 300)
+            self._headers = {
+                'Authorization': f'Bearer {self.api_key}',
+                'Content-Type': 'application/json',
+                'HTTP-Referer': 'https://github.com/blorm-network/ZerePy',
+                'X-Title': 'ZerePy Framework'
+            }
+            self._client: Optional[httpx.AsyncClient] = None
+            self._client_finalizer: Optional[weakref.finalize] = None
             self.max_retries = 3
-            self.is_connected = False
+            self._initialized = False
+            self._configured = False  # Set once is_configured succeeds, cleared on auth failures
+            self._batcher = LLMAutoBatcher(self._complete_batch)
+            # Optional persistent cache behind the in-memory one
+            disk_cache = config.get('disk_cache')
+            if disk_cache:
+                path = DEFAULT_DISK_CACHE_PATH if disk_cache is True else disk_cache
+                self._disk_cache: Optional[DiskLLMCache] = DiskLLMCache(path)
+            else:
+                self._disk_cache = None
 
-            # Register cleanup handler
-            atexit.register(self._cleanup)
+            super().__init__(config)
 
             self.actions = {
                 "generate-text": Action(
@@ -56,41 +167,68 @@ class OpenRouterConnection(BaseConnection):
                     ]
                 )
             }
-            logger.info(f"Initialized OpenRouter connection with model: {self.model}")
+            logger.info("Initialized OpenRouter connection with model: %s", self.model)
             if not self.api_key:
                 logger.warning("No API key found for OpenRouter")
             else:
                 # Log key format without revealing actual key
                 masked_key = f"{self.api_key[:4]}...{self.api_key[-4:]}"
-                logger.info(f"API key found (format: {masked_key})")
+                logger.info("API key found (format: %s)", masked_key)
         except Exception as e:
-            logger.error(f"Error in OpenRouter connection initialization: {str(e)}")
-            logger.error(f"Detailed error: {traceback.format_exc()}")
+            logger.error("Error in OpenRouter connection initialization: %s", e)
+            logger.error("Detailed error: %s", traceback.format_exc())
             raise
 
-    def _cleanup(self):
-        """Cleanup handler for atexit"""
-        try:
-            if self.session and not self.session.closed:
-                logger.info("Cleaning up OpenRouter session...")
-                loop = asyncio.get_event_loop()
-                if loop.is_running():
-                    loop.create_task(self.close())
-                else:
-                    loop.run_until_complete(self.close())
-        except Exception as e:
-            logger.error(f"Error during cleanup: {str(e)}")
+    async def __aenter__(self) -> "OpenRouterConnection":
+        """Connect on entering an async with block"""
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        """Close the HTTP client on leaving an async with block"""
+        await self.close()
 
     @property
     def is_llm_provider(self) -> bool:
         """Override to indicate this is an LLM provider"""
         return True
 
+    @property
+    def is_initialized(self) -> bool:
+        """Check if the connection is properly initialized"""
+        return self._initialized and bool(self._client and not self._client.is_closed)
+
+    async def _ensure_client(self) -> None:
+        """Ensure the HTTP client exists
+
+        With HTTP/2 available, concurrent requests are multiplexed as streams over a
+        single TLS connection instead of each holding a pooled HTTP/1.1 connection.
+        """
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                http2=_HTTP2,
+                base_url=self.base_url,
+                headers=self._headers,
+                timeout=httpx.Timeout(30, connect=5),
+                limits=httpx.Limits(
+                    max_connections=1 if _HTTP2 else 32,
+                    max_keepalive_connections=1 if _HTTP2 else 32
+                )
+            )
+            # Close the client even if this connection is dropped without close();
+            # the finalizer holds the client, not the connection
+            if self._client_finalizer is not None:
+                self._client_finalizer.detach()
+            self._client_finalizer = weakref.finalize(
+                self, _close_abandoned_client, self._client, asyncio.get_running_loop()
+            )
+            logger.debug("Created OpenRouter HTTP client (HTTP/2: %s)", _HTTP2)
+
     async def connect(self) -> bool:
         """Initialize connection"""
         try:
-            if self.is_connected and self.session and not self.session.closed:
-                logger.debug("Session already exists")
+            if self.is_initialized:
+                logger.debug("Client already exists")
                 return True
 
             if not self.api_key:
@@ -102,198 +240,270 @@ class OpenRouterConnection(BaseConnection):
                 logger.error("Invalid API key format. Must start with 'sk-'")
                 return False
 
-            logger.info("Creating new session with OpenRouter API...")
+            # No test request here: it would bill a completion on every cold start.
+            # Bad keys and missing credits surface on the first real request.
+            await self._ensure_client()
+            self._initialized = True
+            logger.info("✅ Initialized OpenRouter HTTP client")
+            return True
 
-            try:
-                self.session = aiohttp.ClientSession(
-                    timeout=self.connect_timeout,
-                    headers={
-                        'Authorization': f'Bearer {self.api_key}',
-                        'Content-Type': 'application/json',
-                        'HTTP-Referer': 'https://github.com/blorm-network/ZerePy',
-                        'X-Title': 'ZerePy Framework'
-                    }
-                )
-                logger.info("✅ Created new OpenRouter session")
-            except Exception as e:
-                logger.error(f"Failed to create session: {str(e)}")
-                return False
+        except Exception as e:
+            logger.error("Failed to initialize client: %s", e)
+            logger.error("Detailed error: %s", traceback.format_exc())
+            await self.close()
+            return False
 
-            # Test connection with a minimal request
+    def _build_payload(
+        self,
+        system_prompt: str,
+        user_message: str,
+        temperature: float = 0.7,
+        n: int = 1,
+        stream: bool = False,
+        max_tokens: Optional[int] = None
+    ) -> bytes:
+        """Serialize a chat completions request body; max_tokens defaults to self.max_tokens"""
+        messages = []
+        if system_prompt:
+            messages.append({"role": "system", "content": system_prompt})
+        messages.append({"role": "user", "content": user_message})
+
+        data = {
+            "model": self.model,
+            "messages": messages,
+            "temperature": temperature,
+            "max_tokens": self.max_tokens if max_tokens is None else max_tokens,
+            "stream": stream
+        }
+        if n > 1:
+            data["n"] = n
+        logger.debug("Request data: %s", data)
+        return orjson.dumps(data)
+
+    async def _do_post(self, payload: bytes) -> List[str]:
+        """POST a chat completion request and return the content of each choice
+
+        Args:
+            payload: Serialized request body
+
+        Returns:
+            Generated texts, empty if the response could not be parsed
+
+        Raises:
+            AuthError: On 401/402/403 responses
+            RateLimitError: On 429 responses
+            OpenRouterAPIError: On any other non-200 response
+        """
+        response = await self._client.post("/chat/completions", content=payload)
+        body = response.content
+        logger.debug("Response status: %s", response.status_code)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Response text: %s", body[:500].decode('utf-8', 'replace'))
+
+        if response.status_code in (401, 403):
+            self._configured = False
+            raise AuthError("Authentication failed - invalid API key")
+        if response.status_code == 402:
+            raise AuthError("Insufficient credits")
+        if response.status_code == 429:
+            raise RateLimitError("Rate limit exceeded")
+        if response.status_code != 200:
+            raise OpenRouterAPIError(f"API error: {response.status_code} - {body[:512].decode('utf-8', 'replace')}")
+
+        try:
+            contents = _completion_contents(body)
+        except _PARSE_ERRORS as e:
+            logger.error("Error parsing response: %s", e)
+            logger.debug("Raw response text: %s", body[:512].decode('utf-8', 'replace'))
+            return []
+        if not contents or not contents[0]:
+            logger.error("Response missing content")
+            return []
+        return contents
+
+    async def _complete(self, payload: bytes) -> Optional[List[str]]:
+        """Send a completion request, retrying transient failures
+
+        Returns:
+            Generated texts, or None if the request failed
+        """
+        await self._ensure_client()
+        logger.info("Making request to OpenRouter API with model: %s", self.model)
+        for attempt in range(self.max_retries):
             try:
-                test_data = {
-                    "model": self.model,
-                    "messages": [{"role": "user", "content": "test"}],
-                    "temperature": 0.7,
-                    "max_tokens": 1
-                }
-                logger.debug(f"Test request data: {test_data}")
-
-                async with asyncio.timeout(self.connect_timeout.total):
-                    async with self.session.post(
-                        f"{self.base_url}/chat/completions",
-                        json=test_data
-                    ) as response:
-                        response_text = await response.text()
-                        logger.debug(f"Test response (status={response.status}): {response_text}")
-
-                        if response.status == 401:
-                            logger.error("Authentication failed - invalid API key")
-                            await self.close()
-                            return False
-                        elif response.status == 402:
-                            logger.error("Insufficient credits - please check your OpenRouter account")
-                            await self.close()
-                            return False
-                        elif response.status == 429:
-                            logger.error("Rate limit exceeded")
-                            await self.close()
-                            return False
-                        elif response.status not in (200, 400):  # 400 is OK for test request
-                            logger.error(f"Connection test failed with status: {response.status}")
-                            logger.error(f"Response text: {response_text}")
-                            await self.close()
-                            return False
-
-            except asyncio.TimeoutError:
-                logger.error("Connection test timed out")
-                await self.close()
-                return False
-            except aiohttp.ClientError as e:
-                logger.error(f"Connection test failed with error: {str(e)}")
-                await self.close()
-                return False
+                contents = await self._do_post(payload)
+                if contents:
+                    logger.info("Successfully generated text response")
+                return contents or None
+            except AuthError as e:
+                logger.error(str(e))
+                return None
+            except _RETRYABLE_ERRORS as e:
+                logger.error("Request failed (attempt %s/%s): %s %s", attempt + 1, self.max_retries, type(e).__name__, e)
 
-            self.is_connected = True
-            logger.info("✅ Connection test successful")
-            return True
+            if attempt < self.max_retries - 1:
+                # Exponential backoff capped at 8s, jittered so concurrent callers spread out
+                wait_time = min(2 ** attempt, 8) * (0.5 + random.random())
+                logger.info("Retrying in %.2f seconds...", wait_time)
+                await asyncio.sleep(wait_time)
 
-        except Exception as e:
-            logger.error(f"Failed to initialize session: {str(e)}")
-            logger.error(f"Detailed error: {traceback.format_exc()}")
-            if self.session:
-                await self.close()
-            return False
+        return None
 
     async def generate_text(self, prompt: str, system_prompt: str = "") -> Optional[str]:
-        """Generate text using OpenRouter API"""
+        """Generate text using OpenRouter API
+
+        Concurrent calls are buffered briefly and identical prompts are served by one
+        request (see LLMAutoBatcher).
+        """
         try:
-            if not await self.is_configured():
+            if not self.api_key:
                 logger.error("API key not configured")
                 return None
 
-            if not self.session or not self.is_connected:
-                logger.info("No active session, attempting to connect...")
-                connected = await self.connect()
-                if not connected:
-                    logger.error("Failed to establish connection")
-                    return None
-
-            # Format messages for OpenRouter's chat completions API
-            messages = []
-            if system_prompt:
-                messages.append({
-                    "role": "system",
-                    "content": system_prompt
-                })
-            messages.append({
-                "role": "user",
-                "content": prompt
-            })
-
-            # Prepare request data
-            data = {
-                "model": self.model,
-                "messages": messages,
-                "temperature": 0.7,
-                "max_tokens": 300,
-                "stream": False
-            }
+            if not self.is_initialized and not await self.connect():
+                logger.error("Failed to establish connection")
+                return None
 
-            logger.info(f"Making request to OpenRouter API with model: {self.model}")
-            logger.debug(f"Request data: {data}")
-
-            # Make request with retry
-            for attempt in range(self.max_retries):
-                try:
-                    logger.info(f"Request attempt {attempt + 1}/{self.max_retries}")
-                    async with asyncio.timeout(self.request_timeout.total):
-                        async with self.session.post(
-                            f"{self.base_url}/chat/completions",
-                            json=data
-                        ) as response:
-                            response_text = await response.text()
-                            logger.debug(f"Response status: {response.status}")
-                            logger.debug(f"Response text: {response_text}")
-
-                            if response.status == 200:
-                                try:
-                                    result = await response.json()
-                                    if result and "choices" in result:
-                                        content = result["choices"][0].get("message", {}).get("content")
-                                        if content:
-                                            logger.info("Successfully generated text response")
-                                            return content
-                                        else:
-                                            logger.error("Response missing content")
-                                            logger.debug(f"Full response: {result}")
-                                    else:
-                                        logger.error("Unexpected response format")
-                                        logger.debug(f"Full response: {result}")
-                                except Exception as e:
-                                    logger.error(f"Error parsing response: {str(e)}")
-                                    logger.debug(f"Raw response text: {response_text}")
-                                    return None
-                            elif response.status == 401:
-                                logger.error("Authentication failed - invalid API key")
-                                return None
-                            elif response.status == 402:
-                                logger.error("Insufficient credits")
-                                return None
-                            elif response.status == 429:
-                                logger.error("Rate limit exceeded")
-                                if attempt < self.max_retries - 1:
-                                    wait_time = 2 ** attempt
-                                    logger.info(f"Waiting {wait_time} seconds before retry...")
-                                    await asyncio.sleep(wait_time)
-                                    continue
-                            else:
-                                logger.error(f"API error: {response.status} - {response_text}")
-
-                except asyncio.TimeoutError:
-                    logger.error(f"Request timed out (attempt {attempt + 1})")
-                except aiohttp.ClientError as e:
-                    logger.error(f"Network error: {str(e)}")
-                    self.is_connected = False
-                    # Try to reconnect for next attempt
-                    if not await self.connect():
-                        return None
-
-                if attempt < self.max_retries - 1:
-                    wait_time = 2 ** attempt
-                    logger.info(f"Retrying in {wait_time} seconds...")
-                    await asyncio.sleep(wait_time)
+            result = await self._batcher.submit(system_prompt, prompt)
+            return result.get("content")
 
+        except Exception as e:
+            logger.error("Error generating text: %s", e)
+            logger.error("Detailed error: %s", traceback.format_exc())
             return None
 
+    async def _complete_batch(self, system_prompt: str, user_message: str, n: int) -> List[Dict[str, Any]]:
+        """Serve n identical prompts queued by the batcher with one n-choice request"""
+        contents = await self._complete(self._build_payload(
+            system_prompt, user_message, n=n, max_tokens=self.text_max_tokens
+        ))
+        if not contents:
+            return [{"content": None}] * n
+        # Some providers ignore n and return a single choice; reuse what came back
+        return [{"content": contents[i % len(contents)]} for i in range(n)]
+
+    async def generate_text_stream(self, prompt: str, system_prompt: str = "") -> AsyncIterator[str]:
+        """Generate text using OpenRouter API, yielding content as it is produced"""
+        if not self.api_key:
+            logger.error("API key not configured")
+            return
+
+        if not self.is_initialized and not await self.connect():
+            logger.error("Failed to establish connection")
+            return
+
+        payload = self._build_payload(system_prompt, prompt, stream=True)
+        logger.info("Making streaming request to OpenRouter API with model: %s", self.model)
+        try:
+            # The read timeout bounds the gap between chunks, not the whole generation
+            async with self._client.stream("POST", "/chat/completions", content=payload) as response:
+                if response.status_code != 200:
+                    if response.status_code in (401, 403):
+                        self._configured = False
+                    response_text = (await response.aread())[:512].decode('utf-8', 'replace')
+                    logger.error("API error: %s - %s", response.status_code, response_text)
+                    return
+                async for delta in iter_chat_stream(response.aiter_lines()):
+                    yield delta
+        except httpx.TransportError as e:
+            logger.error("Streaming request failed: %s %s", type(e).__name__, e)
+
+    async def chat_completion(
+        self,
+        system_prompt: str,
+        user_message: str,
+        temperature: float = 0.7,
+        cache: bool = False
+    ) -> Dict[str, Any]:
+        """Generate chat completion using OpenRouter API
+
+        Requests with temperature 0 (or cache=True) are answered from cache when an
+        identical request has completed recently, and identical concurrent requests
+        share a single API call.
+        """
+        if not self.api_key:
+            logger.error("API key not found")
+            return {"content": "I apologize, but I'm not properly configured at the moment."}
+
+        if not (cache or temperature == 0):
+            return await self._request_completion(system_prompt, user_message, temperature)
+
+        key = LLMCache.make_key(self.model, system_prompt, user_message, temperature, self.max_tokens)
+        cached = _RESPONSE_CACHE.get(key)
+        if cached is not None:
+            logger.debug("Serving OpenRouter completion from cache")
+            return {"content": cached}
+
+        pending = _IN_FLIGHT.get(key)
+        if pending is not None:
+            return await asyncio.shield(pending)
+
+        future = asyncio.get_running_loop().create_future()
+        _IN_FLIGHT[key] = future
+        try:
+            cached = None
+            if self._disk_cache is not None:
+                # SQLite reads block, so they run off the event loop
+                cached = await asyncio.to_thread(self._disk_cache.get, key)
+            if cached is not None:
+                logger.debug("Serving OpenRouter completion from disk cache")
+                _RESPONSE_CACHE.set(key, cached)
+                result = {"content": cached}
+            else:
+                result = await self._request_completion(system_prompt, user_message, temperature, key)
+            future.set_result(result)
+            return result
+        except BaseException:
+            future.cancel()
+            raise
+        finally:
+            _IN_FLIGHT.pop(key, None)
+
+    async def _request_completion(
+        self,
+        system_prompt: str,
+        user_message: str,
+        temperature: float,
+        cache_key: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Request a completion, caching the content under cache_key on success"""
+        try:
+            contents = await self._complete(self._build_payload(system_prompt, user_message, temperature))
         except Exception as e:
-            logger.error(f"Error generating text: {str(e)}")
-            logger.error(f"Detailed error: {traceback.format_exc()}")
-            return None
+            logger.error("Error in chat completion: %s", e)
+            return {"content": _ERROR_REPLY}
+        if not contents:
+            return {"content": _ERROR_REPLY}
+
+        content = contents[0]
+        if cache_key is not None:
+            _RESPONSE_CACHE.set(cache_key, content)
+            if self._disk_cache is not None:
+                await asyncio.to_thread(self._disk_cache.set, cache_key, content)
+        return {"content": content}
 
     async def close(self) -> None:
         """Close the connection"""
+        await self._batcher.close()
+        if self._client_finalizer is not None:
+            self._client_finalizer.detach()
+            self._client_finalizer = None
         try:
-            if self.session:
-                await self.session.close()
-                self.session = None
-                self.is_connected = False
-                logger.info("Closed OpenRouter session")
+            if self._client:
+                await self._client.aclose()
+                logger.info("Closed OpenRouter HTTP client")
         except Exception as e:
-            logger.error(f"Error closing session: {str(e)}")
+            logger.error("Error closing client: %s", e)
+        self._client = None  # Always set to None even if close fails
+        self._initialized = False
+        if self._disk_cache is not None:
+            disk_cache, self._disk_cache = self._disk_cache, None
+            await asyncio.to_thread(disk_cache.close)
 
     async def is_configured(self, verbose: bool = False) -> bool:
         """Check if connection is properly configured"""
+        if self._configured and self.is_initialized:
+            return True
         try:
             if not self.api_key:
                 if verbose:
@@ -301,15 +511,16 @@ class OpenRouterConnection(BaseConnection):
                 return False
 
             # Verify we can make a connection
-            if not self.session or not self.is_connected:
+            if not self.is_initialized:
                 success = await self.connect()
                 if not success:
                     return False
 
+            self._configured = True
             return True
 
         except Exception as e:
-            logger.error(f"Error checking configuration: {str(e)}")
+            logger.error("Error checking configuration: %s", e)
             return False
 
     async def perform_action(self, action_name: str, params: Dict[str, Any], **kwargs) -> Optional[str]:
@@ -328,6 +539,6 @@ class OpenRouterConnection(BaseConnection):
             return None
 
         except Exception as e:
-            logger.error(f"Error performing action {action_name}: {str(e)}")
-            logger.error(f"Detailed error: {traceback.format_exc()}")
-            return None
\ No newline at end of file
+            logger.error("Error performing action %s: %s", action_name, e)
+            logger.error("Detailed error: %s", traceback.format_exc())
+            return None
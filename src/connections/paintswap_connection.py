@@ -2,11 +2,29 @@
 import logging
 import aiohttp
 import asyncio
-from typing import Dict, Any, Optional, List
-from datetime import datetime
+import random
+import orjson
+from typing import Dict, Any, Optional, List, Union
+from yarl import URL
+from ._http import TokenBucket, get_session, release_session
 
 logger = logging.getLogger(__name__)
 
+
+# Query parameter encoders by exact value type; anything else falls back to str()
+_PARAM_CONVERTERS = {
+    str: lambda value: value,
+    bool: lambda value: 'true' if value else 'false',
+    int: str,
+    float: str,
+}
+
+
+def _encode_params(params: Dict[str, Any]) -> Dict[str, str]:
+    """Convert query parameter values to the string forms the API expects"""
+    return {key: _PARAM_CONVERTERS.get(type(value), str)(value) for key, value in params.items()}
+
+
 class PaintSwapConnection:
     """Connection handler for PaintSwap API"""
     def __init__(self, config: Dict[str, Any]):
@@ -16,8 +34,12 @@ class PaintSwapConnection:
         self.config = config
         self._retry_count = 3
         self._retry_delay = 1  # seconds
-        self._rate_limit_delay = 0.5  # 500ms between requests
-        self._last_request_time = 0
+        # Shared by all concurrent callers of this connection; defaults to 2 requests/s, bursts of 5
+        self._bucket = TokenBucket(
+            rate=config.get('requests_per_second', 2.0),
+            capacity=config.get('rate_limit_burst', 5)
+        )
+        self._sales_urls: Dict[int, URL] = {}  # Pre-encoded v2/sales URLs by limit
         self._headers = {
             'Accept': 'application/json',
             'User-Agent': 'SonicKid/1.0 (NFT Monitor)',
@@ -26,64 +48,61 @@ class PaintSwapConnection:
         }
         logger.info("Initialized PaintSwap connection")
 
-    async def _make_request(self, method: str, endpoint: str, **kwargs) -> Optional[Dict[str, Any]]:
-        """Make API request with retries and rate limiting"""
+    def _sales_url(self, limit: int) -> URL:
+        """Return the pre-encoded v2/sales URL for a page size"""
+        url = self._sales_urls.get(limit)
+        if url is None:
+            url = URL(f"{self.base_url}/v2/sales").with_query(limit=str(limit))
+            self._sales_urls[limit] = url
+        return url
+
+    async def _make_request(self, method: str, endpoint: Union[str, URL], **kwargs) -> Optional[Dict[str, Any]]:
+        """Make API request with retries and rate limiting
+
+        endpoint is either a path relative to the API base or a fully-formed URL.
+        """
+        url = endpoint if isinstance(endpoint, URL) else f"{self.base_url}/{endpoint.lstrip('/')}"
+        if 'params' in kwargs:
+            kwargs['params'] = _encode_params(kwargs['params'])
+        # Default headers are built once in __init__
+        kwargs.setdefault('headers', self._headers)
+
         for attempt in range(self._retry_count):
             try:
-                # Apply rate limiting
-                now = datetime.now().timestamp()
-                if self._last_request_time > 0:
-                    time_since_last = now - self._last_request_time
-                    if time_since_last < self._rate_limit_delay:
-                        await asyncio.sleep(self._rate_limit_delay - time_since_last)
+                await self._bucket.acquire()
 
                 if not self._session:
-                    self._session = aiohttp.ClientSession()
-
-                # Update request time
-                self._last_request_time = datetime.now().timestamp()
+                    self._session = await get_session()
 
-                url = f"{self.base_url}/{endpoint.lstrip('/')}"
                 logger.debug(f"Making request to: {url}")
 
-                # Ensure headers are properly set
-                if 'headers' not in kwargs:
-                    kwargs['headers'] = {}
-                kwargs['headers'].update(self._headers)
-
-                # Encode parameters properly
-                if 'params' in kwargs:
-                    params = kwargs['params']
-                    for key, value in params.items():
-                        if isinstance(value, bool):
-                            params[key] = str(value).lower()
-                        elif isinstance(value, (int, float)):
-                            params[key] = str(value)
-
                 async with self._session.request(method, url, **kwargs) as response:
                     logger.debug(f"Response status: {response.status}")
-                    logger.debug(f"Response headers: {dict(response.headers)}")
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(f"Response headers: {dict(response.headers)}")
 
                     # Handle successful response
                     if response.status == 200:
+                        body = await response.read()
                         try:
-                            data = await response.json()
+                            data = orjson.loads(body)
                             logger.debug(f"Successful response from {endpoint}")
                             return data
                         except Exception as e:
-                            text = await response.text()
-                            logger.error(f"Failed to parse JSON response: {text[:200]}")
+                            logger.error(f"Failed to parse JSON response: {body[:200].decode('utf-8', 'replace')}")
                             logger.error(f"Parse error: {str(e)}")
                     else:
-                        text = await response.text()
+                        # Only the start of an error body is logged, so don't read the rest
+                        text = (await response.content.read(512)).decode('utf-8', 'replace')
                         logger.error(f"Error response from {url}: {text[:200]}")
                         logger.error(f"Status code: {response.status}")
 
                         # Only retry on specific status codes
                         if response.status in [429, 500, 502, 503, 504]:
                             if attempt < self._retry_count - 1:
-                                delay = self._retry_delay * (2 ** attempt)  # Exponential backoff
-                                logger.warning(f"Request failed (attempt {attempt + 1}), retrying in {delay}s...")
+                                # Exponential backoff with jitter so concurrent callers don't retry in lockstep
+                                delay = self._retry_delay * (2 ** attempt) * (0.5 + random.random())
+                                logger.warning(f"Request failed (attempt {attempt + 1}), retrying in {delay:.2f}s...")
                                 await asyncio.sleep(delay)
                                 continue
                     return None
@@ -91,7 +110,7 @@ class PaintSwapConnection:
             except Exception as e:
                 logger.error(f"Request error (attempt {attempt + 1}): {str(e)}")
                 if attempt < self._retry_count - 1:
-                    delay = self._retry_delay * (2 ** attempt)
+                    delay = self._retry_delay * (2 ** attempt) * (0.5 + random.random())
                     await asyncio.sleep(delay)
                     continue
                 return None
@@ -102,7 +121,7 @@ class PaintSwapConnection:
         """Establish connection and verify API access"""
         try:
             # Test connection with sales endpoint
-            result = await self._make_request('GET', 'v2/sales', params={'limit': '1'})
+            result = await self._make_request('GET', self._sales_url(1))
             if result is not None:
                 logger.info("✅ Successfully connected to PaintSwap API")
                 return True
@@ -113,19 +132,14 @@ class PaintSwapConnection:
         except Exception as e:
             logger.error(f"Error connecting to PaintSwap: {str(e)}")
             if self._session:
-                await self._session.close()
                 self._session = None
+                await release_session()
             return False
 
     async def get_sales(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Fetch recent sales data"""
         try:
-            # Get recent sales with minimal params
-            params = {
-                'limit': str(limit)
-            }
-
-            result = await self._make_request('GET', 'v2/sales', params=params)
+            result = await self._make_request('GET', self._sales_url(limit))
             if result and isinstance(result, dict):
                 sales = result.get('sales', [])
                 if sales:
@@ -146,8 +160,8 @@ class PaintSwapConnection:
         """Close service connections"""
         try:
             if self._session:
-                await self._session.close()
                 self._session = None
+                await release_session()
                 logger.info("Closed PaintSwap connection")
         except Exception as e:
             logger.error(f"Error closing connection: {str(e)}")
\ No newline at end of file
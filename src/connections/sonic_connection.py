@@ -1,15 +1,24 @@
 """Sonic network connection implementation"""
+import asyncio
 import logging
 import time
 import os
 import json
 import sys
-import requests
+import httpx
+import numpy as np
+import orjson
+import websockets
+from bisect import bisect_right
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, Optional, List, Tuple
+from typing import Dict, Any, Optional, List, Set, Tuple, Callable, Awaitable, Hashable, FrozenSet
 from web3 import Web3
+from web3.contract import Contract
+from eth_abi import encode as abi_encode, decode as abi_decode
 from web3.middleware import geth_poa_middleware
 from eth_account import Account
+from pydantic import BaseModel, ConfigDict, ValidationError
 
 # Add the src directory to the Python path to enable proper imports
 src_dir = Path(__file__).parent.parent
@@ -18,11 +27,18 @@ if str(src_dir) not in sys.path:
 
 from utils.odos_router import OdosRouter
 from constants.networks import SONIC_NETWORKS
-from constants.abi import ERC20_ABI
+from constants.abi import (
+    ERC20_ABI,
+    MULTICALL3_ADDRESS,
+    MULTICALL3_AGGREGATE3_SELECTOR,
+    ERC20_DECIMALS_SELECTOR,
+    ERC20_SYMBOL_SELECTOR
+)
 # Import DexScreenerService lazily to avoid circular import
 # from services.dexscreener_service import DexScreenerService
 from services.price_oracle_service import PriceOracleService
 from connections.sonic_wallet import SonicWalletConnection
+from connections.ttl_cache import TTLCache
 from connections.errors import (
     SonicConnectionError,
     SonicSwapError,
@@ -31,13 +47,134 @@ from connections.errors import (
 
 logger = logging.getLogger(__name__)
 
+try:
+    import h2  # noqa: F401  (enables HTTP/2 in httpx)
+    _HTTP2 = True
+except ImportError:
+    _HTTP2 = False
+
+_FETCH_TIMEOUT = httpx.Timeout(10.0, connect=3.0)
+_FETCH_LIMITS = httpx.Limits(max_connections=50, max_keepalive_connections=20)
+
+@lru_cache(maxsize=4096)
+def _checksum(address: str) -> str:
+    """Checksum an address once; the keccak behind it is redone on every Web3 call otherwise"""
+    return Web3.to_checksum_address(address)
+
+
+class OdosQuote(BaseModel):
+    """Fields of an Odos quote response that swaps depend on; the rest pass through"""
+    model_config = ConfigDict(extra="allow", frozen=True)
+
+    pathId: str
+
+
+class OdosTransaction(BaseModel):
+    """Transaction part of an assembled Odos swap"""
+    model_config = ConfigDict(extra="allow", frozen=True)
+
+    to: str
+    data: str
+
+
+class OdosAssembly(BaseModel):
+    """Assembled Odos swap as returned by OdosRouter.assemble_transaction"""
+    model_config = ConfigDict(extra="allow", frozen=True)
+
+    transaction: OdosTransaction
+
+
+# Token age categories: under 7 days "New", under 30 "Young", under 90 "Mature"
+_AGE_BINS = (7, 30, 90)
+_AGE_LABELS = ("New", "Young", "Mature", "Old")
+
+_PAIR_TOKEN0_SELECTOR = bytes.fromhex("0dfe1681")  # token0()
+_PAIR_TOKEN1_SELECTOR = bytes.fromhex("d21220a7")  # token1()
+_PAIR_GET_RESERVES_SELECTOR = bytes.fromhex("0902f1ac")  # getReserves()
+
+
+class _PairLogWatcher:
+    """Background eth_subscribe("logs") listener for a fixed set of pair contracts
+
+    on_log is called with the lowercased pair address of every log (Swap, Sync,
+    Mint, Burn...) those contracts emit; on_drop is called when the subscription
+    is lost, since events may have been missed until it is re-established.
+    """
+
+    def __init__(
+        self,
+        wss_url: str,
+        pairs: List[str],
+        on_log: Callable[[str], None],
+        on_drop: Callable[[], None]
+    ):
+        self.wss_url = wss_url
+        self.pairs = pairs
+        self._on_log = on_log
+        self._on_drop = on_drop
+        self._task: Optional[asyncio.Task] = None
+        self.live = False
+
+    def start(self) -> None:
+        """Start the subscription task if it is not already running"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    def stop(self) -> None:
+        """Cancel the subscription task"""
+        if self._task and not self._task.done():
+            self._task.cancel()
+        self._task = None
+        self.live = False
+
+    async def _run(self) -> None:
+        subscribe = orjson.dumps({
+            'jsonrpc': '2.0', 'id': 1, 'method': 'eth_subscribe',
+            'params': ['logs', {'address': self.pairs}]
+        })
+        while True:
+            try:
+                async with websockets.connect(self.wss_url) as ws:
+                    await ws.send(subscribe.decode())
+                    async for message in ws:
+                        data = orjson.loads(message)
+                        if data.get('id') == 1:
+                            self.live = 'result' in data
+                            if not self.live:
+                                raise ConnectionError(f"eth_subscribe rejected: {data.get('error')}")
+                            continue
+                        if data.get('method') == 'eth_subscription':
+                            self._on_log(data['params']['result']['address'].lower())
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("Pair log subscription to %s dropped: %s", self.wss_url, e)
+            if self.live:
+                self.live = False
+                self._on_drop()
+            await asyncio.sleep(5)
+
+
 class SonicConnection:
     """Handle Sonic network interactions"""
 
+    # Every instance attribute set in __init__; new ones must be added here
+    __slots__ = (
+        "network", "rpc_url", "wss_url", "scanner_url", "chain_id", "_web3",
+        "wallet", "odos_router", "price_oracle", "dexscreener",
+        "_price_cache", "_liquidity_cache", "_whale_cache", "_equalizer_cache",
+        "_inflight", "_token_meta_cache", "_erc20_contracts",
+        "_pair_watcher", "_pair_tokens", "_streamed_tokens", "_streamed_pairs",
+        "_http",
+    )
+
     # Class-level constants
     NATIVE_TOKEN = "0xEeeeeEeeeEeEeeEeEeEeeEEEeeeeEeeeeeeeEEeE"
     WSONIC = "0x039e2fB66102314Ce7b64Ce5Ce3E5183bc94aD38"
     USDC = "0x88b6d6bd8ba1564f8ed1c0d0d67fbd64daa4ac25"
+    # Lowercased once for the address comparisons on hot paths
+    _NATIVE_TOKEN_LC = NATIVE_TOKEN.lower()
+    _SONIC_TOKENS_LC = frozenset({NATIVE_TOKEN.lower(), WSONIC.lower()})
 
     # Safety thresholds for trading
     SAFETY_THRESHOLDS = {
@@ -59,6 +196,11 @@ class SonicConnection:
         if not self.rpc_url:
             raise SonicConnectionError("No RPC URL available")
 
+        # Websocket endpoint for pair event subscriptions; without one, caches just expire by TTL
+        self.wss_url = config.get("wss") or os.getenv('SONIC_WSS_URL') or next(
+            (url for url in network_config.get("rpc_urls", []) if url.startswith("wss://")), None
+        )
+
         self.scanner_url = network_config["scanner_url"]
         self.chain_id = network_config["chain_id"]
         self._web3: Optional[Web3] = None
@@ -83,10 +225,26 @@ class SonicConnection:
         from services.dexscreener_service import DexScreenerService
         self.dexscreener = DexScreenerService()
 
-        # Initialize caches
-        self.equalizer_cache = {}
-        self.whale_data_cache = {}
-        self.liquidity_cache = {}
+        # Initialize caches (per instance, so connections never share entries)
+        self._price_cache = TTLCache(maxsize=4096, ttl=self.price_cache_duration)
+        self._liquidity_cache = TTLCache(maxsize=4096, ttl=self.general_cache_duration)
+        self._whale_cache = TTLCache(maxsize=1024, ttl=self.whale_cache_duration)
+        self._equalizer_cache = TTLCache(maxsize=16, ttl=self.general_cache_duration)
+        # Fetches currently running, keyed by (operation, cache key), so concurrent misses share one call
+        self._inflight: Dict[Tuple[str, Hashable], asyncio.Future] = {}
+        # Token decimals/symbol never change, so these are kept for the lifetime of the connection
+        self._token_meta_cache: Dict[str, Tuple[int, str]] = {}
+        # ERC20 contract objects by checksum address, bound to the current self._web3
+        self._erc20_contracts: Dict[str, Contract] = {}
+
+        # Pair event subscription (see _start_pair_watcher); lowercase addresses throughout
+        self._pair_watcher: Optional[_PairLogWatcher] = None
+        self._pair_tokens: Dict[str, Tuple[str, str]] = {}
+        self._streamed_tokens: Set[str] = set()
+        self._streamed_pairs: Set[FrozenSet[str]] = set()
+
+        # HTTP client for fetch_data, created on first use; HTTP/2 multiplexes requests per host
+        self._http: Optional[httpx.AsyncClient] = None
 
         logger.info(f"Initialized Sonic connection with RPC URL: {self.rpc_url}")
 
@@ -97,6 +255,7 @@ class SonicConnection:
             # Use the wallet connection which already has RPC fallback mechanism
             await self.wallet.connect()
             self._web3 = self.wallet.get_web3()
+            self._erc20_contracts.clear()
             
             if not self._web3 or not self._web3.is_connected():
                 raise SonicConnectionError("Could not connect to Sonic network via wallet connection")
@@ -107,6 +266,86 @@ class SonicConnection:
             logger.error(f"Failed to connect to Sonic network: {str(e)}")
             raise SonicConnectionError(f"Failed to connect to Sonic network: {str(e)}")
 
+        if self.wss_url and self._pair_watcher is None:
+            try:
+                await self._start_pair_watcher()
+            except Exception as e:
+                logger.warning(f"Pair event subscription unavailable, using TTL caching only: {str(e)}")
+
+    def _aggregate3(self, calls: List[Tuple[str, bool, bytes]]) -> List[Tuple[bool, bytes]]:
+        """Run (target, allowFailure, calldata) calls through Multicall3 in one eth_call (blocking)"""
+        calldata = MULTICALL3_AGGREGATE3_SELECTOR + abi_encode(['(address,bool,bytes)[]'], [calls])
+        raw = self._web3.eth.call({'to': MULTICALL3_ADDRESS, 'data': Web3.to_hex(calldata)})
+        (results,) = abi_decode(['(bool,bytes)[]'], raw)
+        return results
+
+    def _multicall_pair_tokens(self, pair_addresses: List[str]) -> Dict[str, Tuple[str, str]]:
+        """Read token0/token1 for several pair contracts in one eth_call (blocking)
+
+        Pairs that don't implement token0()/token1() are left out.
+        """
+        targets = [_checksum(address) for address in pair_addresses]
+        calls = [
+            (target, True, selector)
+            for target in targets
+            for selector in (_PAIR_TOKEN0_SELECTOR, _PAIR_TOKEN1_SELECTOR)
+        ]
+        results = self._aggregate3(calls)
+
+        pair_tokens = {}
+        for i, target in enumerate(targets):
+            (token0_ok, token0_data), (token1_ok, token1_data) = results[2 * i:2 * i + 2]
+            if token0_ok and token1_ok and len(token0_data) == len(token1_data) == 32:
+                token0 = abi_decode(['address'], token0_data)[0].lower()
+                token1 = abi_decode(['address'], token1_data)[0].lower()
+                pair_tokens[target.lower()] = (token0, token1)
+        return pair_tokens
+
+    async def _start_pair_watcher(self) -> None:
+        """Subscribe to events of SPECIFIC_PAIR_ADDRESSES so their cached prices stay fresh
+
+        While the subscription is live, prices and liquidity of the pairs' tokens
+        are cached for stream_cache_duration and evicted as soon as a pair emits
+        an event, instead of being re-fetched every price_cache_duration.
+        """
+        pairs = [address for address in self.SPECIFIC_PAIR_ADDRESSES if Web3.is_address(address)]
+        self._pair_tokens = await asyncio.to_thread(self._multicall_pair_tokens, pairs)
+        if not self._pair_tokens:
+            return
+        self._streamed_tokens = {token for tokens in self._pair_tokens.values() for token in tokens}
+        self._streamed_pairs = {frozenset(tokens) for tokens in self._pair_tokens.values()}
+        self._pair_watcher = _PairLogWatcher(
+            self.wss_url,
+            list(self._pair_tokens),
+            self._on_pair_log,
+            self._on_pair_stream_drop
+        )
+        self._pair_watcher.start()
+        logger.info(f"Watching {len(self._pair_tokens)} pairs for events via {self.wss_url}")
+
+    def _evict_token(self, token: str) -> None:
+        """Drop cached and in-flight price/liquidity data involving a lowercase token address"""
+        self._price_cache.pop(token)
+        self._inflight.pop(('price', token), None)
+        for other in self._streamed_tokens:
+            for key in ((token, other), (other, token)):
+                self._liquidity_cache.pop(key)
+                self._inflight.pop(('liquidity', key), None)
+
+    def _on_pair_log(self, pair: str) -> None:
+        """A tracked pair changed state: its tokens' cached data is now stale"""
+        for token in self._pair_tokens.get(pair, ()):
+            self._evict_token(token)
+
+    def _on_pair_stream_drop(self) -> None:
+        """Events may have been missed while disconnected, so forget everything streamed"""
+        for token in self._streamed_tokens:
+            self._evict_token(token)
+
+    def _streaming(self) -> bool:
+        """Whether the pair event subscription is currently established"""
+        return self._pair_watcher is not None and self._pair_watcher.live
+
     async def get_zap_quote(
         self,
         input_token: str,
@@ -157,11 +396,10 @@ class SonicConnection:
                 quote_payload=quote_payload
             )
 
-            if not quote or not isinstance(quote, dict):
-                raise SonicQuoteError("Invalid quote response")
-
-            if 'pathId' not in quote:
-                raise SonicQuoteError("Missing pathId in quote")
+            try:
+                OdosQuote.model_validate(quote)
+            except ValidationError as e:
+                raise SonicQuoteError(f"Invalid quote response: {e.errors()[0]['msg']}")
 
             logger.debug(f"Quote response: {quote}")
             return quote
@@ -199,8 +437,10 @@ class SonicConnection:
                 assembly_payload=assembly_payload
             )
 
-            if not tx_data or not isinstance(tx_data, dict):
-                raise SonicSwapError("Invalid transaction assembly response")
+            try:
+                OdosAssembly.model_validate(tx_data)
+            except ValidationError as e:
+                raise SonicSwapError(f"Invalid transaction assembly response: {e.errors()[0]['msg']}")
 
             return tx_data
 
@@ -228,14 +468,26 @@ class SonicConnection:
             Transaction data and execution results
         """
         try:
-            # Get zap quote first
-            quote = await self.get_zap_quote(
-                input_token=input_token,
-                output_token=output_token,
-                amount=amount,
-                user_address=user_address,
-                slippage=slippage
+            if not self._web3:
+                await self.connect()
+
+            # The router allowance doesn't depend on the quote, so read it while the quote is fetched
+            quote, allowance = await asyncio.gather(
+                self.get_zap_quote(
+                    input_token=input_token,
+                    output_token=output_token,
+                    amount=amount,
+                    user_address=user_address,
+                    slippage=slippage
+                ),
+                self._current_allowance(input_token, user_address, self.odos_router.ODOS_ROUTER),
+                return_exceptions=True
             )
+            if isinstance(quote, BaseException):
+                raise quote
+            if isinstance(allowance, BaseException):
+                logger.warning(f"Could not read router allowance: {str(allowance)}")
+                allowance = None
 
             if not quote:
                 raise SonicSwapError("Failed to get swap quote")
@@ -251,6 +503,9 @@ class SonicConnection:
             tx_data['chain_id'] = self.chain_id
             tx_data['scanner_url'] = self.scanner_url
             tx_data['quote'] = quote
+            # Lets the caller approve the router without another allowance read
+            tx_data['allowance'] = allowance
+            tx_data['needs_approval'] = allowance is not None and allowance < self._web3.to_wei(amount, 'ether')
 
             return tx_data
 
@@ -260,15 +515,84 @@ class SonicConnection:
             logger.error(f"Error executing swap: {str(e)}")
             raise SonicSwapError(f"Failed to execute swap: {str(e)}")
 
+    def _erc20(self, token_address: str) -> Contract:
+        """Return the ERC20 contract object for a token, building it only once per address"""
+        address = _checksum(token_address)
+        contract = self._erc20_contracts.get(address)
+        if contract is None:
+            contract = self._web3.eth.contract(address=address, abi=ERC20_ABI)
+            self._erc20_contracts[address] = contract
+        return contract
+
+    async def _current_allowance(self, token_address: str, owner: str, spender: str) -> int:
+        """Read an ERC20 allowance; the native token never needs one"""
+        if token_address.lower() == self._NATIVE_TOKEN_LC:
+            return 2 ** 256 - 1
+        token_contract = self._erc20(token_address)
+        return await asyncio.to_thread(
+            token_contract.functions.allowance(
+                _checksum(owner),
+                _checksum(spender)
+            ).call
+        )
+
+    async def _cached(
+        self,
+        op: str,
+        cache: TTLCache,
+        key: Hashable,
+        fetch: Callable[[], Awaitable[Any]],
+        ttl: Optional[float] = None
+    ) -> Any:
+        """Return cache[key], calling fetch() and storing its result on a miss
+
+        Concurrent misses for the same (op, key) wait on the first caller's fetch
+        instead of starting their own. None results and exceptions are not cached,
+        nor are results of a fetch whose key was evicted while it ran.
+        """
+        value = cache.get(key)
+        if value is not None:
+            return value
+
+        flight_key = (op, key)
+        future = self._inflight.get(flight_key)
+        if future is not None:
+            # Shielded so one waiter being cancelled doesn't cancel the shared result
+            return await asyncio.shield(future)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[flight_key] = future
+        try:
+            value = await fetch()
+        except BaseException as e:
+            if isinstance(e, asyncio.CancelledError):
+                future.cancel()
+            else:
+                future.set_exception(e)
+                future.exception()  # Mark retrieved; waiters (if any) still see it
+            raise
+        finally:
+            evicted = self._inflight.get(flight_key) is not future
+            if not evicted:
+                del self._inflight[flight_key]
+
+        if value is not None and not evicted:
+            cache.set(key, value, ttl)
+        future.set_result(value)
+        return value
+
     async def get_token_price(self, token_address: str) -> float:
         """Get token price using PriceOracle service"""
-        if token_address.lower() == self.NATIVE_TOKEN.lower():
+        if token_address.lower() == self._NATIVE_TOKEN_LC:
             token_address = self.WSONIC
-        return await self.price_oracle.get_token_price(token_address, 'sonic')
-
-    async def get_pair_liquidity(self, token_a: str, token_b: str) -> float:
-        """Get pair liquidity using PriceOracle service"""
-        return await self.price_oracle.get_pair_liquidity(token_a, token_b, 'sonic')
+        key = token_address.lower()
+        return await self._cached(
+            'price',
+            self._price_cache,
+            key,
+            lambda: self.price_oracle.get_token_price(token_address, 'sonic'),
+            ttl=self.stream_cache_duration if self._streaming() and key in self._streamed_tokens else None
+        )
 
     async def get_whale_trades(self, token_address: Optional[str] = None) -> List[Dict]:
         """Get whale trades using WhaleTracker service"""
@@ -289,7 +613,7 @@ class SonicConnection:
     async def transfer(self, to_address: str, amount: float, token_address: Optional[str] = None) -> str:
         """Transfer tokens using wallet connection"""
         try:
-            if token_address and token_address.lower() != self.NATIVE_TOKEN.lower():
+            if token_address and token_address.lower() != self._NATIVE_TOKEN_LC:
                 return await self.wallet.send_token(token_address, to_address, amount)
             else:
                 return await self.wallet.send_native(to_address, amount)
@@ -297,32 +621,62 @@ class SonicConnection:
             logger.error(f"Transfer failed: {str(e)}")
             raise
 
-    async def get_token_info(self, token_address: str) -> Tuple[int, str]:
-        """Get token info (decimals and symbol)"""
+    def _multicall_token_meta(self, token_addresses: List[str]) -> List[Optional[Tuple[int, str]]]:
+        """Read decimals and symbol for several tokens in one eth_call (blocking)
+
+        Tokens whose calls revert or can't be decoded get None.
+        """
+        targets = [_checksum(address) for address in token_addresses]
+        calls = [
+            (target, True, selector)
+            for target in targets
+            for selector in (ERC20_DECIMALS_SELECTOR, ERC20_SYMBOL_SELECTOR)
+        ]
+        results = self._aggregate3(calls)
+
+        meta = []
+        for i, target in enumerate(targets):
+            (decimals_ok, decimals_data), (symbol_ok, symbol_data) = results[2 * i:2 * i + 2]
+            try:
+                if not (decimals_ok and symbol_ok):
+                    raise ValueError("decimals/symbol call reverted")
+                decimals = abi_decode(['uint8'], decimals_data)[0]
+                # Legacy tokens (e.g. MKR) return symbol as bytes32
+                if len(symbol_data) == 32:
+                    symbol = symbol_data.rstrip(b'\x00').decode('utf-8', 'ignore')
+                else:
+                    symbol = abi_decode(['string'], symbol_data)[0]
+                meta.append((decimals, symbol))
+            except Exception as e:
+                logger.error(f"Failed to get token info for {target}: {str(e)}")
+                meta.append(None)
+        return meta
+
+    async def get_tokens_info(self, token_addresses: List[str]) -> List[Tuple[int, str]]:
+        """Get token info (decimals and symbol) for several tokens with a single RPC
+
+        Results are memoized per checksum address; only tokens not seen before
+        are read from the chain.
+        """
         try:
             if not self._web3:
                 await self.connect()
-            token_contract = self._web3.eth.contract(
-                address=self._web3.to_checksum_address(token_address),
-                abi=ERC20_ABI
-            )
-            decimals = token_contract.functions.decimals().call()
-            symbol = token_contract.functions.symbol().call()
-            return decimals, symbol
+            keys = [_checksum(address) for address in token_addresses]
+            missing = list(dict.fromkeys(key for key in keys if key not in self._token_meta_cache))
+            if missing:
+                fetched = await asyncio.to_thread(self._multicall_token_meta, missing)
+                for key, info in zip(missing, fetched):
+                    if info is not None:  # Don't memoize the fallback for a failed read
+                        self._token_meta_cache[key] = info
+            return [self._token_meta_cache.get(key, (18, "UNKNOWN")) for key in keys]
         except Exception as e:
             logger.error(f"Failed to get token info: {str(e)}")
-            return 18, "UNKNOWN"  # Default values
+            return [(18, "UNKNOWN")] * len(token_addresses)  # Default values
 
-    def get_age_category(self, age_days: float) -> str:
-        """Determine token age category"""
-        if age_days < 7:
-            return "New"
-        elif age_days < 30:
-            return "Young"
-        elif age_days < 90:
-            return "Mature"
-        else:
-            return "Old"
+    async def get_token_info(self, token_address: str) -> Tuple[int, str]:
+        """Get token info (decimals and symbol)"""
+        (info,) = await self.get_tokens_info([token_address])
+        return info
 
     async def get_project_contracts(self, project_name: Optional[str] = None) -> Dict[str, Any]:
         """Get contract addresses for specific or all top projects"""
@@ -386,9 +740,11 @@ class SonicConnection:
             'min_liquidity': 10000
         }
     }
+    # COMMON_PAIRS keyed by unordered symbol pair, so either token order finds the entry
+    _COMMON_PAIR_INDEX = {frozenset(name.split('/')): info for name, info in COMMON_PAIRS.items()}
 
     # Specific token pairs to track
-    SPECIFIC_PAIR_ADDRESSES = [
+    SPECIFIC_PAIR_ADDRESSES: Tuple[str, ...] = (
         # Existing important pairs
         "0xf316A1cB7376021ad52705c1403DF86C7A7A18d0",
         "0xe920d1DA9A4D59126dC35996Ea242d60EFca1304",
@@ -416,10 +772,11 @@ class SonicConnection:
         "0x2be17859e8042b4deb1e9ea08cf15858eb4bd80a",
         "0x56192e94434c4fd3278b4fa53039293fb00de3db",
         "0xbf40bbbad774b0075ae0fa619059ddf273e13076"
-    ]
+    )
+    _SPECIFIC_PAIR_SET = frozenset(address.lower() for address in SPECIFIC_PAIR_ADDRESSES)
 
-    # List of whale wallets to monitor
-    WHALE_WALLETS = [
+    # Whale wallets to monitor
+    WHALE_WALLETS: Tuple[str, ...] = (
         "0xe7BC06490A89bc5E2CefAe6ECaB7cD394cd25F94",
         "0xf74e5155E6553e06a43b14C280e925758D0ba878",
         "0x62c6E060EA69b7C6d145B73bC834ede9a1B7Eed8",
@@ -428,51 +785,40 @@ class SonicConnection:
         "0x5687F1A317c62fE52546cE993Bcf9cbDc8a36Be2",
         "0x480ADe73C2A40f347202de6dF6065576f7c82829",
         "0xa064B34DC0aEeF23e48B400DC4b0A3f940B55865"
-    ]
+    )
+    _WHALE_WALLET_SET = frozenset(address.lower() for address in WHALE_WALLETS)
 
     # Cache settings
-    price_cache: Dict[str, Tuple[float, float]] = {}
-    liquidity_cache: Dict[str, Tuple[float, float]] = {}
-    specific_pair_cache: Dict[str, Dict[str, Any]] = {}
-    whale_data_cache: Dict[str, Tuple[float, List[Dict[str, Any]]]] = {}
-    equalizer_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
     price_cache_duration = 30  # 30 seconds for specific pairs
     general_cache_duration = 60  # 1 minute for other pairs
     whale_cache_duration = 300  # 5 minutes for whale data
+    stream_cache_duration = 300  # 5 minutes for data kept fresh by pair events
 
     async def analyze_token(self, token_address: str, whale_tracker = None) -> Dict[str, Any]:
         """Get comprehensive token analysis with optional whale tracking"""
         try:
-            token_contract = self._web3.eth.contract(
-                address=self._web3.to_checksum_address(token_address),
-                abi=ERC20_ABI
-            )
-
-            try:
-                symbol = token_contract.functions.symbol().call()
-                decimals = token_contract.functions.decimals().call()
-            except Exception as e:
-                logger.error(f"Error getting token info: {e}")
-                symbol = "UNKNOWN"
-                decimals = 18
-
-            # Get data from services
-            price = await self.get_token_price(token_address)
-            liquidity = await self.get_pair_liquidity(token_address, self.USDC)
-
             # Get whale activity data if whale_tracker is provided
-            whale_activity = {}
-            if whale_tracker:
+            async def get_whale_activity() -> Dict[str, Any]:
+                if not whale_tracker:
+                    return {}
                 try:
-                    whale_activity = await whale_tracker.analyze_whale_activity(token_address)
+                    return await whale_tracker.analyze_whale_activity(token_address)
                 except Exception as e:
                     logger.error(f"Error getting whale activity: {e}")
-                    whale_activity = {
+                    return {
                         'total_trades': 0,
                         'total_volume_usd': 0,
                         'buy_pressure': 0
                     }
 
+            # The lookups hit independent services, so run them concurrently
+            (decimals, symbol), price, liquidity, whale_activity = await asyncio.gather(
+                self.get_token_info(token_address),
+                self.get_token_price(token_address),
+                self.get_pair_liquidity(token_address, self.USDC),
+                get_whale_activity()
+            )
+
             analysis = {
                 'token_info': {
                     'address': token_address,
@@ -524,21 +870,59 @@ class SonicConnection:
         else:
             return "Low Activity"
 
+    def _get_trading_status_batch(
+        self,
+        liquidity: np.ndarray,
+        whale_trades: np.ndarray,
+        buy_pressure: np.ndarray
+    ) -> np.ndarray:
+        """Vectorized _get_trading_status for many tokens at once
+
+        Args:
+            liquidity: Liquidity in USD per token
+            whale_trades: Whale trade counts per token
+            buy_pressure: Buy pressure (0-1) per token
+
+        Returns:
+            Object array of status strings, matching _get_trading_status element-wise
+        """
+        liquidity = np.asarray(liquidity, dtype=float)
+        whale_trades = np.asarray(whale_trades)
+        buy_pressure = np.asarray(buy_pressure, dtype=float)
+
+        low = liquidity < 10000
+        active = ~low & (liquidity >= 50000) & (whale_trades > 5)
+        # np.select takes the first matching condition, mirroring the scalar if/elif order
+        return np.select(
+            [
+                low,
+                active & (buy_pressure > 0.7),
+                active & (buy_pressure < 0.3),
+                active,
+                liquidity >= 25000,
+            ],
+            [
+                "High Risk - Low Liquidity",
+                "Active Accumulation",
+                "Heavy Distribution",
+                "Active Trading",
+                "Moderate Activity",
+            ],
+            default="Low Activity"
+        ).astype(object)
+
     async def fetch_equalizer_stats(self) -> Optional[Dict]:
         """Fetch pair data from Equalizer API"""
         try:
-            current_time = time.time()
-
             # Check cache first
-            if 'equalizer_stats' in self.equalizer_cache:
-                timestamp, data = self.equalizer_cache['equalizer_stats']
-                if current_time - timestamp < self.general_cache_duration:
-                    return data
+            data = self._equalizer_cache.get('equalizer_stats')
+            if data is not None:
+                return data
 
             #data = await self.equalizer.fetch_global_statistics() #Removed due to missing equalizer service
 
             # Cache the results
-            #self.equalizer_cache['equalizer_stats'] = (current_time, data) #Removed due to missing equalizer service
+            #self._equalizer_cache.set('equalizer_stats', data) #Removed due to missing equalizer service
             return None #Return None since data fetching is not possible.
 
         except Exception as e:
@@ -548,19 +932,16 @@ class SonicConnection:
     async def get_whale_trades(self, token_address: Optional[str] = None) -> List[Dict]:
         """Get recent whale wallet transactions from Equalizer"""
         try:
-            current_time = time.time()
-
             # Check cache first
             cache_key = f"whale_trades_{token_address}" if token_address else "whale_trades_all"
-            if cache_key in self.whale_data_cache:
-                timestamp, trades = self.whale_data_cache[cache_key]
-                if current_time - timestamp < self.whale_cache_duration:
-                    return trades
+            trades = self._whale_cache.get(cache_key)
+            if trades is not None:
+                return trades
 
             #whale_trades = await self.whale_tracker.get_whale_trades(token_address) #Removed due to missing whale_tracker service
 
             # Cache the results
-            #self.whale_data_cache[cache_key] = (current_time, whale_trades) #Removed due to missing whale_tracker service
+            #self._whale_cache.set(cache_key, whale_trades) #Removed due to missing whale_tracker service
             return [] #Return empty list since data fetching is not possible
 
         except Exception as e:
@@ -581,16 +962,14 @@ class SonicConnection:
     async def get_pair_liquidity(self, token_a: str, token_b: str) -> float:
         """Get pair liquidity in USD using Equalizer data"""
         try:
-            # Check cache first
-            pair_key = f"{token_a}_{token_b}"
-            if pair_key in self.liquidity_cache:
-                timestamp, liquidity = self.liquidity_cache[pair_key]
-                if time.time() - timestamp < self.general_cache_duration:
-                    return liquidity
-
-            liquidity = await self.price_oracle.get_pair_liquidity(token_a, token_b, 'sonic')
-            self.liquidity_cache[pair_key] = (time.time(), liquidity)
-            return liquidity
+            key = (token_a.lower(), token_b.lower())
+            return await self._cached(
+                'liquidity',
+                self._liquidity_cache,
+                key,
+                lambda: self.price_oracle.get_pair_liquidity(token_a, token_b, 'sonic'),
+                ttl=self.stream_cache_duration if self._streaming() and frozenset(key) in self._streamed_pairs else None
+            )
 
         except Exception as e:
             logger.error(f"Failed to get pair liquidity: {str(e)}")
@@ -599,36 +978,61 @@ class SonicConnection:
     async def fetch_data(self, url: str, source_name: str) -> Optional[Dict]:
         """Generic data fetching helper function"""
         try:
-            response = requests.get(url, timeout=10)
+            if self._http is None:
+                self._http = httpx.AsyncClient(http2=_HTTP2, timeout=_FETCH_TIMEOUT, limits=_FETCH_LIMITS)
+            response = await self._http.get(url)
             response.raise_for_status()
-            data = response.json()
-            return data
+            return response.json()
         except Exception as e:
             logger.error(f"Error fetching data from {source_name}: {e}")
             return None
 
     async def fetch_token_data_from_dexscreener_specific_pairs(self) -> Dict[str, Dict[str, Any]]:
         """Batch fetch prices for specific token pairs"""
-        specific_pairs_data = {}
-        for address in self.SPECIFIC_PAIR_ADDRESSES:
-            pair_data = await self.dexscreener.get_pair_by_address(address, 'sonic')
-            if pair_data:
-                specific_pairs_data[address] = pair_data
-        return specific_pairs_data if specific_pairs_data else {}
+        # One DexScreener request per 30 pairs instead of one per pair
+        pairs = await self.dexscreener.get_pairs_by_addresses(list(self.SPECIFIC_PAIR_ADDRESSES), 'sonic')
+        return {
+            address: pairs[address.lower()]
+            for address in self.SPECIFIC_PAIR_ADDRESSES
+            if address.lower() in pairs
+        }
+
+    async def get_specific_pair_reserves(self) -> Dict[str, Tuple[int, int]]:
+        """Read getReserves() of every SPECIFIC_PAIR_ADDRESSES pool with a single RPC
+
+        Returns:
+            Raw (reserve0, reserve1) by lowercase pair address; pools without a
+            V2-style getReserves() are left out
+        """
+        try:
+            if not self._web3:
+                await self.connect()
+            pairs = [
+                _checksum(address)
+                for address in self.SPECIFIC_PAIR_ADDRESSES
+                if Web3.is_address(address)
+            ]
+            calls = [(pair, True, _PAIR_GET_RESERVES_SELECTOR) for pair in pairs]
+            results = await asyncio.to_thread(self._aggregate3, calls)
+
+            reserves = {}
+            for pair, (ok, data) in zip(pairs, results):
+                if ok and len(data) == 96:
+                    reserve0, reserve1, _ = abi_decode(['uint112', 'uint112', 'uint32'], data)
+                    reserves[pair.lower()] = (reserve0, reserve1)
+            return reserves
+        except Exception as e:
+            logger.error(f"Failed to get pair reserves: {str(e)}")
+            return {}
 
     async def get_pair_info(self, token_a: str, token_b: str) -> Dict[str, Any]:
         """Get trading pair information including liquidity"""
         try:
-            decimals_a, symbol_a = await self.get_token_info(token_a)
-            decimals_b, symbol_b = await self.get_token_info(token_b)
+            (decimals_a, symbol_a), (decimals_b, symbol_b) = await self.get_tokens_info([token_a, token_b])
 
             # Check if it's a common pair
             pair_name = f"{symbol_a}/{symbol_b}"
-            pair_info = None
-            for common_pair, info in self.COMMON_PAIRS.items():
-                if pair_name == common_pair or f"{symbol_b}/{symbol_a}" == common_pair:
-                    pair_info = info
-                    break
+            pair_info = self._COMMON_PAIR_INDEX.get(frozenset((symbol_a, symbol_b)))
 
             liquidity = await self.get_pair_liquidity(token_a, token_b)
 
@@ -672,8 +1076,8 @@ class SonicConnection:
 
             # Check if either token is SONIC or WSONIC for routing
             is_sonic_pair = (
-                token_a.lower() in [self.NATIVE_TOKEN.lower(), self.WSONIC.lower()] or
-                token_b.lower() in [self.NATIVE_TOKEN.lower(), self.WSONIC.lower()]
+                token_a.lower() in self._SONIC_TOKENS_LC or
+                token_b.lower() in self._SONIC_TOKENS_LC
             )
 
             # Check token prices and balances
@@ -722,10 +1126,7 @@ class SonicConnection:
             if not self._web3:  # Fixed typo from self_web3
                 await self.connect()
 
-            token_contract = self._web3.eth.contract(
-                address=self._web3.to_checksum_address(token_address),
-                abi=ERC20_ABI
-            )
+            token_contract = self._erc20(token_address)
             return token_contract.functions.decimals().call()
         except Exception as e:
             logger.error(f"Failed to get token decimals: {str(e)}")
@@ -742,13 +1143,10 @@ class SonicConnection:
             if not self._web3:
                 await self.connect()
 
-            if token_address.lower() == self.NATIVE_TOKEN.lower():
+            if token_address.lower() == self._NATIVE_TOKEN_LC:
                 return None  # No approval needed for native token
 
-            token_contract = self._web3.eth.contract(
-                address=self._web3.to_checksum_address(token_address),
-                abi=ERC20_ABI
-            )
+            token_contract = self._erc20(token_address)
 
             private_key = os.getenv('WALLET_PRIVATE_KEY')
             if not private_key:
@@ -758,17 +1156,18 @@ class SonicConnection:
                 private_key = '0x' + private_key
 
             account = self._web3.eth.account.from_key(private_key)
-            spender_address = self._web3.to_checksum_address(spender_address)
-
-            # Check current allowance
-            current_allowance = token_contract.functions.allowance(
-                account.address,
-                spender_address
-            ).call()
+            spender_address = _checksum(spender_address)
+
+            # Read the allowance and everything an approval would need at once: one round trip, not four.
+            # Token info is usually memoized; gas price and nonce go unused if the allowance suffices.
+            current_allowance, (decimals, symbol), gas_price, nonce = await asyncio.gather(
+                self._current_allowance(token_address, account.address, spender_address),
+                self.get_token_info(token_address),
+                asyncio.to_thread(lambda: self._web3.eth.gas_price),
+                asyncio.to_thread(self._web3.eth.get_transaction_count, account.address)
+            )
 
             if current_allowance < amount:
-                #                # Get token info for logging
-                decimals, symbol = await self.get_token_info(token_address)
                 human_amount = amount / (10 ** decimals)
                 logger.info(f"Approving {human_amount} {symbol} for spender {spender_address}")
 
@@ -778,8 +1177,8 @@ class SonicConnection:
                     amount
                 ).build_transaction({'from': account.address,
                     'gas': 100000,  # Estimated gas forapprovals
-                    'gasPrice': int(self._web3.eth.gas_price * 1.1),  # 10% buffer
-                    'nonce': self._web3.eth.get_transaction_count(account.address),
+                    'gasPrice': int(gas_price * 1.1),  # 10% buffer
+                    'nonce': nonce,
                     'chainId': self.chain_id
                 })
 
@@ -802,6 +1201,21 @@ class SonicConnection:
 
     async def analyze_pair(self, pair: Dict, dune_data: Dict = None) -> Dict[str, Any]:
         """Analyze trading pair with multiple data sources"""
+        return (await self.analyze_pairs([pair], dune_data))[0]
+
+    async def analyze_pairs(self, pairs: List[Dict], dune_data: Dict = None) -> List[Dict[str, Any]]:
+        """Analyze several trading pairs, fetching their DexScreener data in batched requests
+
+        Returns:
+            One analysis per input pair, in the same order
+        """
+        addresses = [pair.get('pairAddress') for pair in pairs if isinstance(pair, dict) and pair.get('pairAddress')]
+        # Up to 30 pairs per DexScreener request; keyed by lowercase pair address
+        dexscreener_pairs = await self.dexscreener.get_pairs_by_addresses(addresses, 'sonic') if addresses else {}
+        return [self._analyze_pair(pair, dexscreener_pairs) for pair in pairs]
+
+    def _analyze_pair(self, pair: Dict, dexscreener_pairs: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+        """Build the analysis for one pair from prefetched DexScreener data"""
         try:
             if not pair or not isinstance(pair, dict):
                 raise ValueError("Invalid pair data")
@@ -816,7 +1230,7 @@ class SonicConnection:
                 raise ValueError("Missing pair address")
 
             # Fetch data from multiple sources
-            dexscreener_data = await self.dexscreener.get_pair_by_address(pair_address, 'sonic')
+            dexscreener_data = dexscreener_pairs.get(pair_address.lower())
             #meme_api_data = await self.fetch_token_data_from_meme_api(base_token.get('address')) #Removed due to missing function
             #defillama_data = await self.fetch_token_data_from_defillama(base_token.get('address')) #Removed due to missing function
 
@@ -899,14 +1313,7 @@ class SonicConnection:
 
     def get_age_category(self, age_days: float) -> str:
         """Determine token age category"""
-        if age_days < 7:
-            return "New"
-        elif age_days < 30:
-            return "Young"
-        elif age_days < 90:
-            return "Mature"
-        else:
-            return "Old"
+        return _AGE_LABELS[bisect_right(_AGE_BINS, age_days)]
 
     # Safety thresholds for trading
     SAFETY_THRESHOLDS = {
@@ -927,11 +1334,23 @@ class SonicConnection:
             if not project:
                 return None
 
-            # Search for all contract-related pairs
+            # Search for all contract-related pairs concurrently, a few at a time to respect DexScreener's rate limit
+            semaphore = asyncio.Semaphore(5)
+
+            async def search(address: str) -> List[Dict[str, Any]]:
+                async with semaphore:
+                    return await self.dexscreener.search_pairs(address)
+
+            contracts = project['contracts']
+            results = await asyncio.gather(
+                *(search(address) for address in contracts.values()),
+                return_exceptions=True
+            )
             pairs_data = {}
-            for contract_name, address in project['contracts'].items():
-                pairs = await self.dexscreener.search_pairs(address)
-                if pairs:
+            for contract_name, pairs in zip(contracts, results):
+                if isinstance(pairs, Exception):
+                    logger.error(f"Error searching pairs for {contract_name}: {str(pairs)}")
+                elif pairs:
                     pairs_data[contract_name] = pairs
 
             return {
@@ -994,8 +1413,18 @@ class SonicConnection:
     async def close(self):
         """Close all connections"""
         try:
+            # Stop the pair event subscription
+            if self._pair_watcher is not None:
+                self._pair_watcher.stop()
+                self._pair_watcher = None
+
             # Close web3 connections
             self._web3 = None
+            self._erc20_contracts.clear()
+
+            if self._http is not None:
+                await self._http.aclose()
+                self._http = None
 
             # Close wallet connection if exists
             if hasattr(self, 'wallet') and hasattr(self.wallet, 'close'):
@@ -7,6 +7,7 @@ from web3.middleware import geth_poa_middleware
 from dotenv import load_dotenv
 
 from .errors import SonicConnectionError
+from .fallback_provider import FallbackHTTPProvider
 
 logger = logging.getLogger("connections.sonic_wallet")
 
@@ -91,6 +92,12 @@ class SonicWalletConnection:
                     logger.warning(f"Wrong chain ID for {rpc_url}. Expected {self.chain_id}, got {connected_chain_id}")
                     continue
 
+                # Keep the remaining endpoints as runtime fallbacks behind the verified one
+                self._web3.provider = FallbackHTTPProvider(
+                    [rpc_url] + [url for url in rpc_list if url != rpc_url],
+                    request_kwargs={'timeout': 20}
+                )
+
                 # If we reached here, connection was successful
                 logger.info(f"Successfully connected to Sonic network with RPC {rpc_url}, chain ID: {self.chain_id}")
                 # Update the primary RPC URL to the one that worked
@@ -190,4 +190,15 @@ SONIC_ROUTER = {
         "address": "0x8dD42505DE1d9D714D6C59620600F0c65d8fDc7A",
         "chain_id": 146
     }
-}
\ No newline at end of file
+}
+
+# Multicall3 is deployed at the same address on all major EVM chains
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+
+# Function selectors used for batched reads through Multicall3
+MULTICALL3_AGGREGATE3_SELECTOR = bytes.fromhex("82ad56cb")  # aggregate3((address,bool,bytes)[])
+ERC20_NAME_SELECTOR = bytes.fromhex("06fdde03")      # name()
+ERC20_SYMBOL_SELECTOR = bytes.fromhex("95d89b41")    # symbol()
+ERC20_DECIMALS_SELECTOR = bytes.fromhex("313ce567")  # decimals()
+ERC20_ALLOWANCE_SELECTOR = bytes.fromhex("dd62ed3e") # allowance(address,address)
+ERC20_APPROVE_SELECTOR = bytes.fromhex("095ea7b3")   # approve(address,uint256)
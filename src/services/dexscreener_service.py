@@ -67,6 +67,10 @@ web3_provider_url = "https://rpc.soniclabs.com"
 
 class DexScreenerService:
     """Service for interacting with DexScreener API via TypeScript SDK"""
+
+    # Most pair addresses the pairs endpoint accepts in one request
+    PAIRS_PER_REQUEST = 30
+
     def __init__(self, cache_duration: int = 120):  # 2 minutes default
         self._initialized = False
         self._ts_script_path = os.path.join(os.path.dirname(__file__), 'dexscreener.ts')
@@ -213,6 +217,30 @@ class DexScreenerService:
             logger.error(f"Error searching pairs: {str(e)}")
             return []
 
+    @staticmethod
+    def _format_pair(pair: Dict[str, Any], chain_id: str) -> Dict[str, Any]:
+        """Convert a raw DexScreener pair into our standard pair format"""
+        return {
+            "pair": f"{pair.get('baseToken', {}).get('symbol', '')}/{pair.get('quoteToken', {}).get('symbol', '')}",
+            "chain": pair.get("chainId", chain_id),
+            "chainId": pair.get("chainId", chain_id),
+            "baseToken": {
+                "symbol": pair.get("baseToken", {}).get("symbol", ""),
+                "address": pair.get("baseToken", {}).get("address", "")
+            },
+            "quoteToken": {
+                "symbol": pair.get("quoteToken", {}).get("symbol", ""),
+                "address": pair.get("quoteToken", {}).get("address", "")
+            },
+            "price": float(pair.get("priceNative", 0)),
+            "priceUsd": float(pair.get("priceUsd", 0)),
+            "priceChange24h": float(pair.get("priceChange", {}).get("h24", 0)),
+            "volume24h": float(pair.get("volume", {}).get("h24", 0)),
+            "liquidity": float(pair.get("liquidity", {}).get("usd", 0)),
+            "pairAddress": pair.get("pairAddress", ""),
+            "dexId": pair.get("dexId", "")
+        }
+
     async def get_pair_by_address(self, pair_address: str, chain_id: str = SONIC_CHAIN_ID_STR, force_refresh: bool = False) -> Optional[Dict[str, Any]]:
         """Get a specific pair by its address using DexScreener API"""
         try:
@@ -255,26 +283,7 @@ class DexScreenerService:
                     pair = data["pairs"][0]
                     
                     # Format the pair data to match our standard format
-                    formatted_pair = {
-                        "pair": f"{pair.get('baseToken', {}).get('symbol', '')}/{pair.get('quoteToken', {}).get('symbol', '')}",
-                        "chain": pair.get("chainId", chain_id),
-                        "chainId": pair.get("chainId", chain_id),
-                        "baseToken": {
-                            "symbol": pair.get("baseToken", {}).get("symbol", ""),
-                            "address": pair.get("baseToken", {}).get("address", "")
-                        },
-                        "quoteToken": {
-                            "symbol": pair.get("quoteToken", {}).get("symbol", ""),
-                            "address": pair.get("quoteToken", {}).get("address", "")
-                        },
-                        "price": float(pair.get("priceNative", 0)),
-                        "priceUsd": float(pair.get("priceUsd", 0)),
-                        "priceChange24h": float(pair.get("priceChange", {}).get("h24", 0)),
-                        "volume24h": float(pair.get("volume", {}).get("h24", 0)),
-                        "liquidity": float(pair.get("liquidity", {}).get("usd", 0)),
-                        "pairAddress": pair.get("pairAddress", ""),
-                        "dexId": pair.get("dexId", "")
-                    }
+                    formatted_pair = self._format_pair(pair, chain_id)
                     
                     # Cache the result
                     self._cache_data(cache_key, formatted_pair)
@@ -286,6 +295,64 @@ class DexScreenerService:
             logger.error(f"Error getting pair by address: {str(e)}")
             return None
     
+    async def get_pairs_by_addresses(self, pair_addresses: List[str], chain_id: str = SONIC_CHAIN_ID_STR, force_refresh: bool = False) -> Dict[str, Dict[str, Any]]:
+        """Get several pairs by address, up to PAIRS_PER_REQUEST addresses per API request
+
+        Returns:
+            Formatted pair data keyed by lowercase pair address; pairs DexScreener
+            doesn't know are left out
+        """
+        try:
+            if not self._initialized:
+                logger.error("DexScreener service not initialized")
+                return {}
+
+            results: Dict[str, Dict[str, Any]] = {}
+            missing = []
+            for address in dict.fromkeys(address.lower() for address in pair_addresses if address):
+                cached_data = None if force_refresh else self._get_cached(f"pair_{chain_id}_{address}")
+                if cached_data is not None:
+                    results[address] = cached_data
+                else:
+                    missing.append(address)
+            if not missing:
+                return results
+
+            chunks = [missing[i:i + self.PAIRS_PER_REQUEST] for i in range(0, len(missing), self.PAIRS_PER_REQUEST)]
+            logger.info(f"Fetching {len(missing)} pairs on chain {chain_id} in {len(chunks)} request(s)")
+
+            async with aiohttp.ClientSession() as session:
+                async def fetch_chunk(chunk: List[str]) -> List[Dict[str, Any]]:
+                    url = f"https://api.dexscreener.com/latest/dex/pairs/{chain_id}/{','.join(chunk)}"
+                    async with session.get(url) as response:
+                        if response.status != 200:
+                            logger.error(f"DexScreener API error: {response.status}")
+                            return []
+                        data = await response.json()
+                        return (data or {}).get("pairs") or []
+
+                responses = await asyncio.gather(*(fetch_chunk(chunk) for chunk in chunks), return_exceptions=True)
+
+            for chunk, pairs in zip(chunks, responses):
+                if isinstance(pairs, Exception):
+                    logger.error(f"Error fetching pairs {chunk}: {str(pairs)}")
+                    continue
+                for pair in pairs:
+                    address = pair.get("pairAddress", "").lower()
+                    try:
+                        formatted_pair = self._format_pair(pair, chain_id)
+                    except (TypeError, ValueError) as e:
+                        logger.warning(f"Skipping malformed pair data for {address}: {str(e)}")
+                        continue
+                    self._cache_data(f"pair_{chain_id}_{address}", formatted_pair)
+                    results[address] = formatted_pair
+
+            return results
+
+        except Exception as e:
+            logger.error(f"Error getting pairs by address: {str(e)}")
+            return {}
+    
     async def get_token_price(self, token_address: str, chain_id: str = SONIC_CHAIN_ID_STR, force_refresh: bool = False) -> float:
         """Get token price using TypeScript SDK with caching"""
         try:
@@ -469,15 +536,12 @@ class DexScreenerService:
     
     async def fetch_dexscreener_specific_pairs(self) -> Dict[str, Dict[str, Any]]:
         """Fetch data for specific DexScreener pairs"""
-        specific_pairs_data = {}
-        for address in SPECIFIC_PAIR_ADDRESSES:
-            try:
-                pair_data = await self.get_pair_by_address(address, SONIC, force_refresh=True)
-                if pair_data:
-                    specific_pairs_data[address] = pair_data
-                await asyncio.sleep(0.5)  # Brief pause between requests to avoid rate limits
-            except Exception as e:
-                logger.error(f"Error fetching pair data for {address}: {str(e)}")
+        pairs = await self.get_pairs_by_addresses(SPECIFIC_PAIR_ADDRESSES, SONIC, force_refresh=True)
+        specific_pairs_data = {
+            address: pairs[address.lower()]
+            for address in SPECIFIC_PAIR_ADDRESSES
+            if address.lower() in pairs
+        }
         
         logger.info(f"Fetched data for {len(specific_pairs_data)} specific pairs")
         return specific_pairs_data if specific_pairs_data else {}
@@ -0,0 +1,72 @@
+"""
+Tests for RPC endpoint failover in FallbackHTTPProvider
+"""
+import pytest
+
+pytest.importorskip("web3")
+
+import requests
+
+from src.connections.fallback_provider import FallbackHTTPProvider
+
+PRIMARY = "https://rpc-primary.example"
+BACKUP = "https://rpc-backup.example"
+RESULT = {"jsonrpc": "2.0", "id": 1, "result": "0x92"}
+
+
+def _refuse(method, params):
+    raise requests.exceptions.ConnectionError("connection refused")
+
+
+def _answer(method, params):
+    return RESULT
+
+
+def test_fails_over_when_first_endpoint_errors(monkeypatch):
+    provider = FallbackHTTPProvider([PRIMARY, BACKUP], cooldown=30)
+    monkeypatch.setattr(provider._providers[PRIMARY], "make_request", _refuse)
+    monkeypatch.setattr(provider._providers[BACKUP], "make_request", _answer)
+
+    assert provider.make_request("eth_chainId", []) == RESULT
+    # The failed endpoint is skipped while it cools down
+    monkeypatch.setattr(provider._providers[PRIMARY], "make_request", pytest.fail)
+    assert provider.make_request("eth_chainId", []) == RESULT
+
+
+def test_endpoints_are_not_mutated_by_failover(monkeypatch):
+    provider = FallbackHTTPProvider([PRIMARY, BACKUP])
+    monkeypatch.setattr(provider._providers[PRIMARY], "make_request", _refuse)
+    monkeypatch.setattr(provider._providers[BACKUP], "make_request", _answer)
+
+    provider.make_request("eth_chainId", [])
+    assert provider._providers[PRIMARY].endpoint_uri == PRIMARY
+    assert provider._providers[BACKUP].endpoint_uri == BACKUP
+
+
+def test_raises_last_error_when_all_endpoints_fail(monkeypatch):
+    provider = FallbackHTTPProvider([PRIMARY, BACKUP])
+    for url in (PRIMARY, BACKUP):
+        monkeypatch.setattr(provider._providers[url], "make_request", _refuse)
+
+    with pytest.raises(requests.exceptions.ConnectionError):
+        provider.make_request("eth_chainId", [])
+
+
+def test_non_failover_http_error_is_raised(monkeypatch):
+    response = requests.Response()
+    response.status_code = 400
+
+    def _bad_request(method, params):
+        raise requests.exceptions.HTTPError(response=response)
+
+    provider = FallbackHTTPProvider([PRIMARY, BACKUP])
+    monkeypatch.setattr(provider._providers[PRIMARY], "make_request", _bad_request)
+    monkeypatch.setattr(provider._providers[BACKUP], "make_request", pytest.fail)
+
+    with pytest.raises(requests.exceptions.HTTPError):
+        provider.make_request("eth_call", [])
+
+
+def test_rejects_non_http_endpoints():
+    with pytest.raises(ValueError):
+        FallbackHTTPProvider(["wss://rpc.example"])
@@ -0,0 +1,92 @@
+"""
+Tests for the shared HTTP session and client-side rate limiting
+"""
+import asyncio
+
+import pytest
+
+pytest.importorskip("aiohttp")
+
+from src.connections import _http
+from src.connections._http import TokenBucket, get_session, release_session
+
+
+def test_session_is_shared_until_last_release():
+    async def run():
+        first = await get_session()
+        second = await get_session()
+        assert first is second
+        assert _http._USERS == 2
+
+        await release_session()
+        assert not first.closed
+
+        await release_session()
+        assert first.closed
+        assert _http._SESSION is None
+        assert _http._USERS == 0
+
+    asyncio.run(run())
+
+
+def test_session_is_recreated_after_close():
+    async def run():
+        first = await get_session()
+        await release_session()
+        second = await get_session()
+        try:
+            assert second is not first
+            assert not second.closed
+        finally:
+            await release_session()
+
+    asyncio.run(run())
+
+
+def test_extra_release_does_not_go_negative():
+    async def run():
+        await release_session()
+        assert _http._USERS == 0
+        session = await get_session()
+        assert _http._USERS == 1
+        await release_session()
+        assert session.closed
+
+    asyncio.run(run())
+
+
+def test_token_bucket_allows_burst_then_paces():
+    async def run():
+        loop = asyncio.get_running_loop()
+        bucket = TokenBucket(rate=20, capacity=3)
+        start = loop.time()
+        for _ in range(3):
+            await bucket.acquire()
+        burst = loop.time() - start
+        for _ in range(4):
+            await bucket.acquire()
+        return burst, loop.time() - start
+
+    burst, total = asyncio.run(run())
+    assert burst < 0.04
+    # Four tokens beyond the burst at 20/s take about 0.2s
+    assert 0.18 <= total < 0.5
+
+
+def test_token_bucket_paces_concurrent_callers():
+    async def run():
+        loop = asyncio.get_running_loop()
+        bucket = TokenBucket(rate=50)
+        start = loop.time()
+
+        async def take():
+            await bucket.acquire()
+            return loop.time() - start
+
+        return await asyncio.gather(*(take() for _ in range(5)))
+
+    times = asyncio.run(run())
+    assert times == sorted(times)
+    assert times[0] < 0.02
+    # Capacity 1: each further caller waits one 20ms refill
+    assert all(later - earlier >= 0.015 for earlier, later in zip(times, times[1:]))
@@ -0,0 +1,102 @@
+"""
+Tests for micro-batching of concurrent LLM completion requests
+"""
+import asyncio
+
+import pytest
+
+from src.connections.llm_batcher import LLMAutoBatcher
+
+
+def test_identical_prompts_share_one_dispatch():
+    calls = []
+
+    async def dispatch(system_prompt, user_message, n):
+        calls.append((system_prompt, user_message, n))
+        return [{"text": f"{user_message}-{i}"} for i in range(n)]
+
+    async def run():
+        batcher = LLMAutoBatcher(dispatch, max_wait_ms=20)
+        try:
+            return await asyncio.gather(*(batcher.submit("sys", "hi") for _ in range(3)))
+        finally:
+            await batcher.close()
+
+    results = asyncio.run(run())
+    assert calls == [("sys", "hi", 3)]
+    # Each caller receives its own choice
+    assert sorted(r["text"] for r in results) == ["hi-0", "hi-1", "hi-2"]
+
+
+def test_distinct_prompts_are_dispatched_separately():
+    calls = []
+
+    async def dispatch(system_prompt, user_message, n):
+        calls.append((user_message, n))
+        return [{"text": user_message}] * n
+
+    async def run():
+        batcher = LLMAutoBatcher(dispatch, max_wait_ms=20)
+        try:
+            return await asyncio.gather(
+                batcher.submit("sys", "a"),
+                batcher.submit("sys", "b"),
+                batcher.submit("sys", "a"),
+            )
+        finally:
+            await batcher.close()
+
+    results = asyncio.run(run())
+    assert sorted(calls) == [("a", 2), ("b", 1)]
+    assert [r["text"] for r in results] == ["a", "b", "a"]
+
+
+def test_max_batch_splits_windows():
+    calls = []
+
+    async def dispatch(system_prompt, user_message, n):
+        calls.append(n)
+        return [{}] * n
+
+    async def run():
+        batcher = LLMAutoBatcher(dispatch, max_batch=2, max_wait_ms=20)
+        try:
+            await asyncio.gather(*(batcher.submit("sys", "hi") for _ in range(5)))
+        finally:
+            await batcher.close()
+
+    asyncio.run(run())
+    assert sorted(calls) == [1, 2, 2]
+
+
+def test_dispatch_error_reaches_every_caller():
+    async def dispatch(system_prompt, user_message, n):
+        raise RuntimeError("upstream failed")
+
+    async def run():
+        batcher = LLMAutoBatcher(dispatch, max_wait_ms=20)
+        try:
+            return await asyncio.gather(
+                *(batcher.submit("sys", "hi") for _ in range(2)), return_exceptions=True
+            )
+        finally:
+            await batcher.close()
+
+    results = asyncio.run(run())
+    assert len(results) == 2
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+
+def test_close_cancels_queued_prompts():
+    async def dispatch(system_prompt, user_message, n):
+        return [{}] * n
+
+    async def run():
+        batcher = LLMAutoBatcher(dispatch, max_wait_ms=1000)
+        task = asyncio.create_task(batcher.submit("sys", "hi"))
+        await asyncio.sleep(0)
+        await batcher.close()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(run())
@@ -0,0 +1,54 @@
+"""
+Tests for the in-memory and SQLite LLM completion caches
+"""
+from src.connections import llm_cache
+from src.connections.llm_cache import DiskLLMCache, LLMCache
+
+
+def test_make_key_depends_on_every_parameter():
+    base = LLMCache.make_key("model", "sys", "hi", 0.0, 300)
+    assert base == LLMCache.make_key("model", "sys", "hi", 0.0, 300)
+    assert base != LLMCache.make_key("other", "sys", "hi", 0.0, 300)
+    assert base != LLMCache.make_key("model", "sys", "hi", 0.5, 300)
+    assert base != LLMCache.make_key("model", "sys", "hi", 0.0, 150)
+
+
+def test_disk_cache_round_trip(tmp_path):
+    path = tmp_path / "nested" / "llm.sqlite"
+    cache = DiskLLMCache(str(path))
+    cache.set("key", "völlig gecacht")
+    assert cache.get("key") == "völlig gecacht"
+    assert cache.get("missing") is None
+    cache.close()
+
+    # Entries survive reopening the database
+    reopened = DiskLLMCache(str(path))
+    try:
+        assert reopened.get("key") == "völlig gecacht"
+    finally:
+        reopened.close()
+
+
+def test_disk_cache_expiry(tmp_path, monkeypatch):
+    cache = DiskLLMCache(str(tmp_path / "llm.sqlite"), ttl=60)
+    try:
+        cache.set("default", "a")
+        cache.set("short", "b", ttl=1)
+        now = llm_cache.time.time()
+        monkeypatch.setattr(llm_cache.time, "time", lambda: now + 30)
+        assert cache.get("default") == "a"
+        assert cache.get("short") is None
+        monkeypatch.setattr(llm_cache.time, "time", lambda: now + 61)
+        assert cache.get("default") is None
+    finally:
+        cache.close()
+
+
+def test_disk_cache_discards_unreadable_body(tmp_path):
+    cache = DiskLLMCache(str(tmp_path / "llm.sqlite"))
+    try:
+        cache.set("key", "value")
+        cache._conn.execute("UPDATE cache SET body=? WHERE key=?", (b"not compressed", "key"))
+        assert cache.get("key") is None
+    finally:
+        cache.close()
@@ -0,0 +1,53 @@
+"""
+Tests for OpenOcean batched approve + swap calldata
+"""
+import pytest
+
+pytest.importorskip("web3")
+
+from eth_abi import decode as abi_decode
+from web3 import Web3
+
+from src.connections.openocean_connection import (
+    OpenOceanConnection,
+    _BATCH_ALL_SELECTOR,
+    _encode_approve,
+    _encode_batch_all,
+)
+
+TOKEN = "0x29219dd400f2bf60e5a23d13be72b486d4038894"
+ROUTER = "0x6352a56caadc4f1e25cd6c75970fa768a3304e64"
+
+
+def test_batch_all_selector():
+    assert _BATCH_ALL_SELECTOR == Web3.keccak(text="batchAll(address[],uint256[],bytes[],uint64[])")[:4]
+
+
+def test_encode_batch_all_round_trip():
+    approve = _encode_approve(ROUTER, 2**256 - 1)
+    swap = bytes.fromhex("deadbeef")
+    calldata = _encode_batch_all([TOKEN, ROUTER], [0, 5], [approve, swap])
+
+    assert calldata[:4] == _BATCH_ALL_SELECTOR
+    targets, values, call_data, gas_limits = abi_decode(
+        ['address[]', 'uint256[]', 'bytes[]', 'uint64[]'], calldata[4:]
+    )
+    assert [target.lower() for target in targets] == [TOKEN, ROUTER]
+    assert list(values) == [0, 5]
+    assert list(call_data) == [approve, swap]
+    assert list(gas_limits) == []
+
+
+def test_encode_approve():
+    calldata = _encode_approve(ROUTER, 1234)
+    spender, amount = abi_decode(['address', 'uint256'], calldata[4:])
+    assert spender.lower() == ROUTER
+    assert amount == 1234
+
+
+def test_batch_routers_only_for_mapped_chains():
+    connection = OpenOceanConnection({
+        'chain_id': '146',
+        'batch_routers': {'146': ROUTER, '1284': '0x0000000000000000000000000000000000000808'}
+    })
+    assert connection._batch_router == {'146': ROUTER}
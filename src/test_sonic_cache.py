@@ -0,0 +1,112 @@
+"""
+Tests for SonicConnection's single-flight read cache
+"""
+import asyncio
+
+import pytest
+
+pytest.importorskip("web3")
+pytest.importorskip("httpx")
+pytest.importorskip("numpy")
+pytest.importorskip("pydantic")
+
+from src.connections.sonic_connection import SonicConnection
+from src.connections.ttl_cache import TTLCache
+
+TOKEN = "0x29219dd400f2bf60e5a23d13be72b486d4038894"
+
+
+def _connection() -> SonicConnection:
+    """Bare connection holding only the cache state _cached() uses"""
+    conn = SonicConnection.__new__(SonicConnection)
+    conn._inflight = {}
+    conn._price_cache = TTLCache()
+    conn._liquidity_cache = TTLCache()
+    conn._streamed_tokens = set()
+    return conn
+
+
+def test_concurrent_misses_share_one_fetch():
+    conn = _connection()
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return 1.5
+
+    async def run():
+        return await asyncio.gather(*(
+            conn._cached('price', conn._price_cache, TOKEN, fetch) for _ in range(5)
+        ))
+
+    assert asyncio.run(run()) == [1.5] * 5
+    assert len(calls) == 1
+    assert conn._price_cache.get(TOKEN) == 1.5
+    assert conn._inflight == {}
+
+
+def test_fetch_errors_reach_waiters_and_are_not_cached():
+    conn = _connection()
+
+    async def fetch():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("rpc down")
+
+    async def run():
+        return await asyncio.gather(*(
+            conn._cached('price', conn._price_cache, TOKEN, fetch) for _ in range(3)
+        ), return_exceptions=True)
+
+    results = asyncio.run(run())
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert conn._price_cache.get(TOKEN) is None
+    assert conn._inflight == {}
+
+
+def test_result_not_cached_when_evicted_during_fetch():
+    conn = _connection()
+
+    async def fetch():
+        # A pair event invalidates the token while its price is being fetched
+        conn._evict_token(TOKEN)
+        return 1.5
+
+    async def run():
+        return await conn._cached('price', conn._price_cache, TOKEN, fetch)
+
+    assert asyncio.run(run()) == 1.5
+    assert conn._price_cache.get(TOKEN) is None
+    assert conn._inflight == {}
+
+
+def test_fetch_after_eviction_does_not_join_stale_flight():
+    conn = _connection()
+    calls = []
+
+    async def run():
+        started = asyncio.Event()
+        release = asyncio.Event()
+
+        async def slow_fetch():
+            calls.append('stale')
+            started.set()
+            await release.wait()
+            return 1.0
+
+        async def fresh_fetch():
+            calls.append('fresh')
+            return 2.0
+
+        stale = asyncio.create_task(conn._cached('price', conn._price_cache, TOKEN, slow_fetch))
+        await started.wait()
+        conn._evict_token(TOKEN)
+        fresh = await conn._cached('price', conn._price_cache, TOKEN, fresh_fetch)
+        release.set()
+        return await stale, fresh
+
+    assert asyncio.run(run()) == (1.0, 2.0)
+    assert calls == ['stale', 'fresh']
+    # The fresh result survives; the stale fetch must not overwrite or drop it
+    assert conn._price_cache.get(TOKEN) == 2.0
+    assert conn._inflight == {}
@@ -0,0 +1,78 @@
+"""
+Tests for the in-memory TTL/LRU cache
+"""
+import pytest
+
+from src.connections import ttl_cache
+from src.connections.ttl_cache import TTLCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable replacement for time.monotonic() inside ttl_cache"""
+    now = [1000.0]
+    monkeypatch.setattr(ttl_cache.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_get_returns_value_until_expiry(clock):
+    cache = TTLCache(ttl=10)
+    cache.set("a", 1)
+    clock[0] += 9.9
+    assert cache.get("a") == 1
+    clock[0] += 0.1
+    assert cache.get("a") is None
+    # Expired entries are dropped on access
+    assert len(cache) == 0
+
+
+def test_per_entry_ttl_overrides_default(clock):
+    cache = TTLCache(ttl=10)
+    cache.set("short", 1, ttl=1)
+    cache.set("long", 2, ttl=100)
+    clock[0] += 5
+    assert cache.get("short") is None
+    assert cache.get("long") == 2
+    clock[0] += 95
+    assert cache.get("long") is None
+
+
+def test_evicts_least_recently_used(clock):
+    cache = TTLCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    # Reading "a" makes "b" the least recently used entry
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_set_refreshes_existing_entry(clock):
+    cache = TTLCache(maxsize=2, ttl=10)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    clock[0] += 8
+    cache.set("a", 10)
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    clock[0] += 8
+    assert cache.get("a") == 10
+
+
+def test_pop_removes_and_returns_value(clock):
+    cache = TTLCache()
+    cache.set("a", 1)
+    assert cache.pop("a") == 1
+    assert cache.pop("a") is None
+    assert cache.get("a") is None
+
+
+def test_clear(clock):
+    cache = TTLCache()
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.clear()
+    assert len(cache) == 0